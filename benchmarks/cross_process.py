@@ -0,0 +1,84 @@
+"""Cross-process throughput of SharedMemoryRingBuffer against a RingBuffer
+sharing its cursor and slots through multiprocessing.Value (the approach of
+examples/multiproc.py).
+
+A child process produces RECORDS records while the parent consumes them as the
+cursor advances, the ring holds every record so nothing is overwritten. Each
+case runs once with one get per record and once reading everything published
+since the previous read with get_range.
+
+    python benchmarks/cross_process.py
+"""
+import time
+import typing
+import multiprocessing as mp
+from pyring import RingBuffer, SharedMemoryRingBuffer
+from pyring.bench import ValueFactory
+
+RECORDS = 2 ** 14
+
+
+def produce_shared_memory(ring_buffer: SharedMemoryRingBuffer) -> None:
+    for i in range(RECORDS):
+        ring_buffer.put(i.to_bytes(8, "little"))
+    ring_buffer.close()
+
+
+def produce_value(ring_buffer: RingBuffer) -> None:
+    for i in range(RECORDS):
+        ring_buffer.put(i)
+
+
+def consume(
+    ring_buffer: typing.Any,
+    target: typing.Callable[[typing.Any], None],
+    batched: bool,
+) -> float:
+    process = mp.Process(target=target, args=(ring_buffer,))
+    process.start()
+
+    start: typing.Optional[float] = None
+    sequence = 0
+    while sequence < RECORDS:
+        cursor_position = ring_buffer._get_cursor_position()
+        if sequence < cursor_position:
+            if start is None:
+                start = time.perf_counter()
+            if batched:
+                ring_buffer.get_range(sequence, cursor_position)
+                sequence = cursor_position
+            else:
+                ring_buffer.get(sequence)
+                sequence += 1
+    assert start is not None
+    elapsed = time.perf_counter() - start
+
+    process.join()
+    return RECORDS / elapsed
+
+
+def main() -> None:
+    for batched in (False, True):
+        reads = "get_range" if batched else "get"
+        with SharedMemoryRingBuffer(size=RECORDS, slot_size=8) as shared_memory:
+            shared_memory_rate = consume(shared_memory, produce_shared_memory, batched)
+        print(
+            f"SharedMemoryRingBuffer,         {reads:<9}: "
+            f"{shared_memory_rate:>12,.0f} records/s"
+        )
+
+        value_ring_buffer = RingBuffer(
+            size=RECORDS,
+            factory=ValueFactory,
+            cursor_position_value=mp.Value("l", 0, lock=False),
+        )
+        value_rate = consume(value_ring_buffer, produce_value, batched)
+        print(
+            f"RingBuffer with mp.Value slots, {reads:<9}: "
+            f"{value_rate:>12,.0f} records/s "
+            f"({shared_memory_rate / value_rate:.1f}x slower)"
+        )
+
+
+if __name__ == "__main__":
+    main()
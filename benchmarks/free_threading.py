@@ -0,0 +1,84 @@
+"""Parallel scaling of lock-less readers: RingBuffer readers calling get_range
+and SingleProducerDisruptor subscribers calling next_batch, with 1, 2 and 4
+threads each doing the same amount of work. On a free-threaded build with
+enough cores the throughput grows with the threads, with the GIL it can't.
+
+    python benchmarks/free_threading.py
+"""
+import os
+import threading
+import time
+import typing
+from pyring import RingBuffer, SingleProducerDisruptor
+from pyring.wait_strategy import GIL_ENABLED
+
+RING_SIZE = 1024
+ROUNDS = 200
+THREADS = (1, 2, 4)
+
+
+def run_threads(
+    target: typing.Callable[[int], None],
+    threads: int,
+    produce: typing.Callable[[], None] = lambda: None,
+) -> float:
+    workers = [
+        threading.Thread(target=target, args=(index,)) for index in range(threads)
+    ]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    produce()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def bench_readers(threads: int) -> float:
+    ring_buffer = RingBuffer(size=RING_SIZE)
+    ring_buffer.put_many(range(RING_SIZE))
+
+    def read(index: int) -> None:
+        for _ in range(ROUNDS):
+            for start in range(0, RING_SIZE, 64):
+                ring_buffer.get_range(start, start + 64)
+
+    return threads * RING_SIZE * ROUNDS / run_threads(read, threads)
+
+
+def bench_subscribers(threads: int) -> float:
+    # one producer fans every event out to each subscriber thread
+    disruptor = SingleProducerDisruptor(size=RING_SIZE)
+    subscribers = [disruptor.subscribe() for _ in range(threads)]
+    count = RING_SIZE * ROUNDS // 4
+
+    def consume(index: int) -> None:
+        received = 0
+        while received < count:
+            _, values = subscribers[index].next_batch(64, timeout=5)
+            received += len(values)
+
+    def produce() -> None:
+        for start in range(0, count, 64):
+            disruptor.put_many(range(start, start + 64), timeout=5)
+
+    return threads * count / run_threads(consume, threads, produce)
+
+
+def main() -> None:
+    print(f"GIL enabled: {GIL_ENABLED}, cpus: {os.cpu_count()}")
+    for name, bench in (
+        ("RingBuffer.get_range readers", bench_readers),
+        ("SingleProducerDisruptor subscribers", bench_subscribers),
+    ):
+        base = bench(1)
+        for threads in THREADS:
+            throughput = base if threads == 1 else bench(threads)
+            print(
+                f"{name} {threads} threads: {throughput:>12,.0f} items/s "
+                f"({throughput / base:.2f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,15 @@
 name = "pyring"
 
 from .ring_factory import RingFactory, SimpleFactory
+from .slab import SlabFactory
+from .wait_strategy import (
+    WaitStrategy,
+    BlockingWaitStrategy,
+    BusySpinWaitStrategy,
+    YieldingWaitStrategy,
+    SleepingWaitStrategy,
+    AsyncWaitStrategy,
+)
 from .ring_buffer import (
     RingBuffer,
     BlockingRingBuffer,
@@ -12,7 +21,32 @@ from .ring_buffer import (
     BlockingLockedRingBuffer,
     WaitingBlockingRingBuffer,
 )
-from .disruptor import SingleProducerDisruptor, DisruptorSubscriber
+from .spsc import SPSCRingBuffer
+from .disruptor import (
+    SingleProducerDisruptor,
+    MultiProducerDisruptor,
+    DisruptorSubscriber,
+    ConflatingSubscriber,
+    OverwritableSubscriber,
+    ObserverSubscriber,
+)
+from .aggregators import (
+    Aggregator,
+    RollingSum,
+    RollingMean,
+    RollingVariance,
+    RollingMin,
+    RollingMax,
+)
+from .processor import BatchEventProcessor
+from .worker_pool import WorkerPool
+from .async_disruptor import AsyncRingBuffer, AsyncDisruptor, AsyncDisruptorSubscriber
+from .codec import Codec, BytesCodec, StructCodec, PickleCodec, Encoded
+from .shared_memory import SharedMemoryRingBuffer
+from .shared_memory_disruptor import SharedMemoryDisruptor, SharedMemorySubscriber
+from .journal import JournalRingBuffer, JournalSubscriber
+from .array_ring_buffer import ArrayRingBuffer
+from .byte_ring_buffer import ByteRingBuffer
 from .exceptions import SequenceNotFound, Empty, SequenceOverwritten, ReadCursorBlock
 
 __version__ = "0.0.12"
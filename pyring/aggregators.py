@@ -0,0 +1,141 @@
+import typing
+from abc import ABC, abstractmethod
+from collections import deque
+from .exceptions import Empty
+
+# extracts the number to aggregate from a slot value
+Key = typing.Callable[[typing.Any], typing.Any]
+
+
+class Aggregator(ABC):
+    """Rolling aggregate over the values a ring currently holds.
+
+    The ring calls `add` with each value it publishes and `evict` with the
+    value a put overwrites, so both run in O(1) amortized. Values are read
+    back from the slot with `slot.get()` and passed through `key`.
+    """
+
+    def __init__(self, key: typing.Optional[Key] = None):
+        self.key = key
+
+    @abstractmethod
+    def add(self, sequence: int, value: typing.Any) -> None:
+        ...
+
+    @abstractmethod
+    def evict(self, sequence: int, value: typing.Any) -> None:
+        ...
+
+    @abstractmethod
+    def reset(self) -> None:
+        ...
+
+    @property
+    @abstractmethod
+    def value(self) -> typing.Any:
+        ...
+
+
+class RollingSum(Aggregator):
+    def __init__(self, key: typing.Optional[Key] = None):
+        super().__init__(key)
+        self.reset()
+
+    def add(self, sequence: int, value: typing.Any) -> None:
+        self._sum += value
+        self._count += 1
+
+    def evict(self, sequence: int, value: typing.Any) -> None:
+        self._sum -= value
+        self._count -= 1
+
+    def reset(self) -> None:
+        self._sum: typing.Any = 0
+        self._count = 0
+
+    @property
+    def value(self) -> typing.Any:
+        return self._sum
+
+
+class RollingMean(RollingSum):
+    @property
+    def value(self) -> float:
+        if not self._count:
+            raise Empty()
+        return self._sum / self._count
+
+
+class RollingVariance(Aggregator):
+    """Variance with Welford's running mean and sum of squared deviations,
+    which unlike a raw sum of squares doesn't cancel out for large values.
+    `ddof=1` gives the sample variance."""
+
+    def __init__(self, key: typing.Optional[Key] = None, ddof: int = 0):
+        super().__init__(key)
+        self.ddof = ddof
+        self.reset()
+
+    def add(self, sequence: int, value: typing.Any) -> None:
+        self._count += 1
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._squares += delta * (value - self._mean)
+
+    def evict(self, sequence: int, value: typing.Any) -> None:
+        self._count -= 1
+        if not self._count:
+            self.reset()
+            return
+        delta = value - self._mean
+        self._mean -= delta / self._count
+        self._squares -= delta * (value - self._mean)
+
+    def reset(self) -> None:
+        self._count = 0
+        self._mean = 0.0
+        self._squares = 0.0
+
+    @property
+    def value(self) -> float:
+        if self._count <= self.ddof:
+            raise Empty()
+        # rounding can leave a tiny negative sum for constant windows
+        return max(self._squares, 0.0) / (self._count - self.ddof)
+
+
+class RollingMin(Aggregator):
+    """Minimum from a monotonic deque of (sequence, value) pairs, values that
+    can no longer be the minimum are dropped as they are added."""
+
+    def __init__(self, key: typing.Optional[Key] = None):
+        super().__init__(key)
+        self._window: typing.Deque[typing.Tuple[int, typing.Any]] = deque()
+
+    def _dominates(self, value: typing.Any, other: typing.Any) -> bool:
+        return value <= other
+
+    def add(self, sequence: int, value: typing.Any) -> None:
+        window = self._window
+        while window and self._dominates(value, window[-1][1]):
+            window.pop()
+        window.append((sequence, value))
+
+    def evict(self, sequence: int, value: typing.Any) -> None:
+        window = self._window
+        if window and window[0][0] <= sequence:
+            window.popleft()
+
+    def reset(self) -> None:
+        self._window.clear()
+
+    @property
+    def value(self) -> typing.Any:
+        if not self._window:
+            raise Empty()
+        return self._window[0][1]
+
+
+class RollingMax(RollingMin):
+    def _dominates(self, value: typing.Any, other: typing.Any) -> bool:
+        return value >= other
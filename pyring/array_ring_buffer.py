@@ -0,0 +1,121 @@
+import typing
+from .ring_buffer import run_with_lock, LockLike, RandomAccessRingBufferMethods
+from .exceptions import SequenceNotFound, Empty, SequenceOverwritten
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
+
+class ArrayRingBuffer(RandomAccessRingBufferMethods):
+    """Ring buffer storing its slots in one preallocated numpy array.
+
+    `dtype` may be a plain or structured dtype and `shape` the shape of a
+    single sample. Range reads return a view into the ring when the range is
+    contiguous and a single stitched copy when it wraps, views alias the ring
+    so they change once those slots are overwritten.
+    """
+
+    def __init__(
+        self,
+        size: int = 16,
+        dtype: typing.Any = float,
+        shape: typing.Tuple[int, ...] = (),
+        lock: typing.Optional[LockLike] = None,
+    ):
+        if np is None:
+            raise ImportError("ArrayRingBuffer requires numpy to be installed.")
+
+        if not size % 2 == 0:
+            raise AttributeError("size must be a factor of 2 for efficient arithmetic.")
+
+        self.ring_size: int = size
+        self._array = np.zeros((size,) + tuple(shape), dtype=dtype)
+        self._cursor_position = 0  # position of next write
+        self._lock = lock
+
+    @property
+    def dtype(self) -> typing.Any:
+        return self._array.dtype
+
+    def _get_cursor_position(self) -> int:
+        return self._cursor_position
+
+    @run_with_lock
+    def put(self, value: typing.Any) -> int:
+        cursor_position = self._cursor_position
+        self._array[cursor_position % self.ring_size] = value
+        self._cursor_position = cursor_position + 1
+        return cursor_position
+
+    @run_with_lock
+    def put_array(self, values: typing.Any) -> int:
+        values = np.asarray(values, dtype=self._array.dtype)
+        count = len(values)
+        first_sequence = self._cursor_position
+        ring_size = self.ring_size
+
+        # only the trailing ring_size values survive a block larger than the ring
+        if count > ring_size:
+            values = values[count - ring_size :]
+        start_sequence = first_sequence + count - len(values)
+
+        start = start_sequence % ring_size
+        head = min(len(values), ring_size - start)
+        self._array[start : start + head] = values[:head]
+        self._array[: len(values) - head] = values[head:]
+
+        self._cursor_position = first_sequence + count
+        return first_sequence
+
+    @run_with_lock
+    def get(self, sequence: int) -> typing.Tuple[int, typing.Any]:
+        cursor_position = self._cursor_position
+        if sequence >= cursor_position:
+            raise SequenceNotFound()
+
+        if sequence < cursor_position - self.ring_size:
+            raise SequenceOverwritten()
+
+        return (sequence, self._array[sequence % self.ring_size])
+
+    @run_with_lock
+    def get_latest(self) -> typing.Tuple[int, typing.Any]:
+        cursor_position = self._cursor_position
+        if cursor_position <= 0:
+            raise Empty()
+
+        return self.get(cursor_position - 1)
+
+    @run_with_lock
+    def get_range(self, start: int, stop: int) -> typing.Tuple[int, typing.Any]:
+        cursor_position = self._cursor_position
+        if stop > cursor_position or start > stop:
+            raise SequenceNotFound()
+
+        oldest = max(0, cursor_position - self.ring_size)
+        if start < oldest:
+            raise SequenceOverwritten(start, oldest)
+
+        ring_size = self.ring_size
+        begin = start % ring_size
+        end = begin + (stop - start)
+        if end <= ring_size:
+            return (start, self._array[begin:end])
+
+        return (
+            start,
+            np.concatenate((self._array[begin:], self._array[: end - ring_size])),
+        )
+
+    @run_with_lock
+    def window(self, n: int) -> typing.Tuple[int, typing.Any]:
+        cursor_position = self._cursor_position
+        n = min(n, cursor_position, self.ring_size)
+        return self.get_range(cursor_position - n, cursor_position)
+
+    @run_with_lock
+    def flush(self) -> None:
+        self._array[...] = 0
+        self._cursor_position = 0
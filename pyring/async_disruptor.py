@@ -0,0 +1,277 @@
+import typing
+from multiprocessing import Value
+from .exceptions import SequenceNotFound, ReadCursorBlock
+from .ring_factory import RingFactory, SimpleFactory
+from .ring_buffer import WaitingBlockingRingBuffer
+from .disruptor import SingleProducerDisruptor, DisruptorSubscriber
+from .wait_strategy import WaitStrategy, AsyncWaitStrategy
+from .metrics import timed_wait_async
+
+
+class AsyncRingBuffer(WaitingBlockingRingBuffer):
+    """`WaitingBlockingRingBuffer` whose `put`, `put_many`, `next` and
+    `next_batch` are coroutines that wait on the event loop.
+
+    Producers on other threads can use `put_threadsafe`, which blocks the
+    calling thread instead and wakes the async consumer.
+    """
+
+    def __init__(
+        self,
+        size: int = 16,
+        factory: typing.Type[RingFactory] = SimpleFactory,
+        cursor_position_value: typing.Union[Value, int] = 0,
+    ):
+        self._wait_strategy: AsyncWaitStrategy = AsyncWaitStrategy()
+        super().__init__(
+            size=size,
+            factory=factory,
+            cursor_position_value=cursor_position_value,
+            wait_strategy=self._wait_strategy,
+        )
+
+    def put_threadsafe(self, value, timeout: float = None):
+        return super().put(value, timeout=timeout)
+
+    async def _wait_for_free_slots_async(
+        self, condition: typing.Callable[[], bool], timeout: typing.Optional[float]
+    ) -> None:
+        if not await timed_wait_async(
+            self._wait_strategy,
+            condition,
+            self._write_cursor_barrier,
+            timeout,
+            self._metrics,
+            producer=True,
+        ):
+            raise ReadCursorBlock()
+
+    async def _wait_for_next_async(self, timeout: typing.Optional[float]) -> None:
+        if not await timed_wait_async(
+            self._wait_strategy,
+            self._has_next,
+            self._read_cursor_barrier,
+            timeout,
+            self._metrics,
+            producer=False,
+        ):
+            raise SequenceNotFound()
+
+    async def put(self, value, timeout: float = None):  # type: ignore
+        if not self._has_free_slot():
+            await self._wait_for_free_slots_async(self._has_free_slot, timeout)
+        result = self._put(value)
+        self._wait_strategy.signal(self._read_cursor_barrier)
+        return result
+
+    async def put_many(
+        self, values: typing.Iterable[typing.Any], timeout: float = None
+    ):
+        values = list(values)
+        if len(values) > self.ring_size:
+            raise ValueError("cannot put more values than the ring size at once.")
+
+        has_free_slots = self._has_free_slots_condition(len(values))
+        if not has_free_slots():
+            await self._wait_for_free_slots_async(has_free_slots, timeout)
+        result = self._put_many(values)
+        self._wait_strategy.signal(self._read_cursor_barrier)
+        return result
+
+    async def next(self, timeout: float = None):  # type: ignore
+        if not self._has_next():
+            await self._wait_for_next_async(timeout)
+
+        return self._read_next()
+
+    async def next_batch(self, max_items: int = 16, timeout: float = None):
+        if not self._has_next():
+            await self._wait_for_next_async(timeout)
+
+        return self._read_next_batch(max_items)
+
+    def __aiter__(self) -> "AsyncRingBuffer":
+        return self
+
+    async def __anext__(self) -> typing.Tuple[int, typing.Any]:
+        return await self.next()
+
+
+class AsyncDisruptorSubscriber(DisruptorSubscriber):
+    """`DisruptorSubscriber` with coroutine `next` / `next_batch` and support
+    for `async for sequence, value in subscriber`, iteration stops once the
+    subscriber is unregistered."""
+
+    _wait_strategy: AsyncWaitStrategy
+
+    def __init__(
+        self,
+        ring_buffer: "SingleProducerDisruptor",
+        read_cursor: int = 0,
+        wait_strategy: typing.Optional[WaitStrategy] = None,
+    ):
+        if wait_strategy is None:
+            wait_strategy = AsyncWaitStrategy()
+        if not isinstance(wait_strategy, AsyncWaitStrategy):
+            raise TypeError("async subscribers require an AsyncWaitStrategy.")
+        super().__init__(
+            ring_buffer=ring_buffer,
+            read_cursor=read_cursor,
+            wait_strategy=wait_strategy,
+        )
+
+    def _has_next_or_unregistered(self) -> bool:
+        return self._has_next() or not self._registered
+
+    async def _wait_for_next_async(
+        self,
+        condition: typing.Callable[[], bool],
+        timeout: typing.Optional[float] = None,
+    ) -> None:
+        self._start_waiting()
+        try:
+            if not await timed_wait_async(
+                self._wait_strategy,
+                condition,
+                self._read_cursor_barrier,
+                timeout,
+                self._metrics,
+                producer=False,
+            ):
+                raise SequenceNotFound()
+        finally:
+            self._stop_waiting()
+
+    async def next(self, timeout: typing.Optional[float] = None):
+        if not self._has_next():
+            await self._wait_for_next_async(self._has_next, timeout)
+
+        return self._read_next()
+
+    async def next_batch(
+        self, max_items: int = 16, timeout: typing.Optional[float] = None
+    ):
+        if not self._has_next():
+            await self._wait_for_next_async(self._has_next, timeout)
+
+        return self._read_next_batch(max_items)
+
+    def unregister(self) -> None:
+        super().unregister()
+        # wake a pending `async for` so it can stop
+        self._wait_strategy.signal(self._read_cursor_barrier)
+
+    def __aiter__(self) -> "AsyncDisruptorSubscriber":
+        return self
+
+    async def __anext__(self) -> typing.Tuple[int, typing.Any]:
+        if not self._has_next():
+            await self._wait_for_next_async(self._has_next_or_unregistered)
+        if not self._registered:
+            raise StopAsyncIteration()
+        return self._read_next()
+
+
+class AsyncDisruptor(SingleProducerDisruptor):
+    """`SingleProducerDisruptor` whose `put` / `put_many` are coroutines and
+    whose subscribers are `AsyncDisruptorSubscriber`s.
+
+    A producer on another thread can use `put_threadsafe`, which blocks the
+    calling thread and wakes async subscribers through their event loop.
+    """
+
+    _subscriber_type = AsyncDisruptorSubscriber
+    _wait_strategy: AsyncWaitStrategy
+
+    def __init__(
+        self,
+        size: int = 16,
+        factory: typing.Type[RingFactory] = SimpleFactory,
+        cursor_position_value: typing.Union[Value, int] = 0,
+    ):
+        super().__init__(
+            size=size,
+            factory=factory,
+            cursor_position_value=cursor_position_value,
+            wait_strategy=AsyncWaitStrategy(),
+        )
+
+    def subscribe(  # type: ignore
+        self,
+        start_at_latest: bool = False,
+        after: typing.Optional[typing.Sequence[DisruptorSubscriber]] = None,
+    ) -> AsyncDisruptorSubscriber:
+        # each subscriber gets its own strategy so its waiters are its own
+        return typing.cast(
+            AsyncDisruptorSubscriber,
+            super().subscribe(
+                start_at_latest=start_at_latest,
+                wait_strategy=AsyncWaitStrategy(),
+                after=after,
+            ),
+        )
+
+    def put_threadsafe(self, value, timeout: float = None):
+        return super().put(value, timeout=timeout)
+
+    def put_many_threadsafe(
+        self, values: typing.Iterable[typing.Any], timeout: float = None
+    ):
+        return super().put_many(values, timeout=timeout)
+
+    async def _refresh_gating_sequence_async(
+        self,
+        cursor_position: int,
+        claim_end: int,
+        timeout: typing.Optional[float] = None,
+    ) -> None:
+        while True:
+            gating_sequence, gating_subscriber = self._get_minimum_gating_sequence(
+                cursor_position
+            )
+            self._cached_gating_sequence = gating_sequence
+            if (
+                gating_subscriber is None
+                or claim_end - gating_sequence <= self.ring_size
+            ):
+                return
+            if not await timed_wait_async(
+                self._wait_strategy,
+                self._has_capacity_condition(gating_subscriber, claim_end),
+                gating_subscriber._write_cursor_barrier,
+                timeout,
+                gating_subscriber._metrics,
+                producer=True,
+            ):
+                raise ReadCursorBlock()
+
+    async def put(self, value, timeout: float = None):  # type: ignore
+        cursor_position = self._get_cursor_position()
+        if cursor_position - self._cached_gating_sequence >= self.ring_size:
+            await self._refresh_gating_sequence_async(
+                cursor_position, cursor_position + 1, timeout
+            )
+
+        result = self._put(value)
+        if self._waiting_subscribers:
+            self._signal_subscribers(result, result + 1)
+        return result
+
+    async def put_many(
+        self, values: typing.Iterable[typing.Any], timeout: float = None
+    ):
+        values = list(values)
+        if len(values) > self.ring_size:
+            raise ValueError("cannot put more values than the ring size at once.")
+
+        cursor_position = self._get_cursor_position()
+        claim_end = cursor_position + len(values)
+        if claim_end - self._cached_gating_sequence > self.ring_size:
+            await self._refresh_gating_sequence_async(
+                cursor_position, claim_end, timeout
+            )
+
+        first_sequence = self._put_many(values)
+        if self._waiting_subscribers:
+            self._signal_subscribers(first_sequence, claim_end)
+        return first_sequence
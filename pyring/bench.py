@@ -0,0 +1,322 @@
+"""Throughput and latency benchmarks for the ring buffer variants.
+
+    python -m pyring.bench run --output results.json
+    python -m pyring.bench compare baseline.json results.json
+
+`run` measures ops/s and p50 / p99 / p99.9 latency for every case and writes
+the results as JSON. Single threaded rings time a put followed by a get,
+threaded and multi process cases time a value from its put to its read by the
+consumer. `compare` matches cases by name and exits with status 1 when any
+case lost more than `--threshold` of its throughput or gained as much p99
+latency.
+"""
+import argparse
+import json
+import multiprocessing as mp
+import platform
+import sys
+import threading
+import time
+import typing
+from threading import RLock
+from .ring_factory import RingFactory
+from .ring_buffer import (
+    RingBuffer,
+    LockedRingBuffer,
+    BlockingRingBuffer,
+    WaitingBlockingRingBuffer,
+)
+from .disruptor import SingleProducerDisruptor, DisruptorSubscriber
+
+Result = typing.Dict[str, typing.Any]
+
+RING_SIZES = (64, 1024)
+PAYLOAD_SIZES = (8, 1024)
+SUBSCRIBER_COUNTS = (1, 4, 16)
+TIMEOUT = 10.0
+
+
+class ValueFactory(RingFactory):
+    """Slot shared between processes, as in examples/multiproc.py."""
+
+    def __init__(self) -> None:
+        self.value: typing.Any = mp.Value("q", 0)
+
+    def get(self) -> int:
+        with self.value.get_lock():
+            return self.value.value
+
+    def set(self, value: int) -> None:
+        with self.value.get_lock():
+            self.value.value = value
+
+
+def _summarise(
+    name: str,
+    events: int,
+    elapsed: float,
+    latencies: typing.List[int],
+    **case: typing.Any,
+) -> Result:
+    latencies = sorted(latencies)
+
+    def percentile(fraction: float) -> float:
+        index = min(len(latencies) - 1, int(len(latencies) * fraction))
+        return latencies[index] / 1000
+
+    return dict(
+        name=name,
+        **case,
+        events=events,
+        ops_per_sec=events / elapsed,
+        p50_us=percentile(0.5),
+        p99_us=percentile(0.99),
+        p999_us=percentile(0.999),
+    )
+
+
+def bench_put_get(
+    variant: str, ring_size: int, payload_size: int, events: int
+) -> Result:
+    if variant == "RingBuffer":
+        ring_buffer: typing.Any = RingBuffer(size=ring_size)
+    elif variant == "LockedRingBuffer":
+        ring_buffer = LockedRingBuffer(size=ring_size, lock=RLock())
+    else:
+        ring_buffer = BlockingRingBuffer(size=ring_size)
+    read = ring_buffer.next if variant == "BlockingRingBuffer" else None
+    payload = b"x" * payload_size
+    latencies = []
+    clock = time.perf_counter_ns
+
+    start = time.perf_counter()
+    for _ in range(events):
+        begin = clock()
+        sequence = ring_buffer.put(payload)
+        if read is None:
+            ring_buffer.get(sequence)
+        else:
+            read()
+        latencies.append(clock() - begin)
+    elapsed = time.perf_counter() - start
+
+    return _summarise(
+        f"{variant}/size={ring_size}/payload={payload_size}",
+        events,
+        elapsed,
+        latencies,
+        variant=variant,
+        ring_size=ring_size,
+        payload_size=payload_size,
+        subscribers=0,
+        producer="inline",
+    )
+
+
+def bench_waiting_ring_buffer(ring_size: int, payload_size: int, events: int) -> Result:
+    ring_buffer = WaitingBlockingRingBuffer(size=ring_size)
+    payload = b"x" * payload_size
+
+    def produce() -> None:
+        clock = time.perf_counter_ns
+        for _ in range(events):
+            ring_buffer.put((clock(), payload), timeout=TIMEOUT)
+
+    latencies = []
+    producer = threading.Thread(target=produce)
+    start = time.perf_counter()
+    producer.start()
+    for _ in range(events):
+        _, (stamp, _) = ring_buffer.next(timeout=TIMEOUT)
+        latencies.append(time.perf_counter_ns() - stamp)
+    elapsed = time.perf_counter() - start
+    producer.join()
+
+    return _summarise(
+        f"WaitingBlockingRingBuffer/size={ring_size}/payload={payload_size}",
+        events,
+        elapsed,
+        latencies,
+        variant="WaitingBlockingRingBuffer",
+        ring_size=ring_size,
+        payload_size=payload_size,
+        subscribers=1,
+        producer="thread",
+    )
+
+
+def bench_disruptor(
+    ring_size: int, payload_size: int, subscribers: int, events: int
+) -> Result:
+    disruptor = SingleProducerDisruptor(size=ring_size)
+    consumers = [disruptor.subscribe() for _ in range(subscribers)]
+    payload = b"x" * payload_size
+    latencies: typing.List[typing.List[int]] = [[] for _ in consumers]
+
+    def consume(subscriber: DisruptorSubscriber, received: typing.List[int]) -> None:
+        clock = time.perf_counter_ns
+        while len(received) < events:
+            _, values = subscriber.next_batch(ring_size, timeout=TIMEOUT)
+            now = clock()
+            received.extend(now - stamp for stamp, _ in values)
+
+    threads = [
+        threading.Thread(target=consume, args=(subscriber, received))
+        for subscriber, received in zip(consumers, latencies)
+    ]
+    for thread in threads:
+        thread.start()
+
+    clock = time.perf_counter_ns
+    start = time.perf_counter()
+    for _ in range(events):
+        disruptor.put((clock(), payload), timeout=TIMEOUT)
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    return _summarise(
+        f"SingleProducerDisruptor/size={ring_size}/payload={payload_size}"
+        f"/subscribers={subscribers}",
+        events,
+        elapsed,
+        [latency for received in latencies for latency in received],
+        variant="SingleProducerDisruptor",
+        ring_size=ring_size,
+        payload_size=payload_size,
+        subscribers=subscribers,
+        producer="thread",
+    )
+
+
+def _produce_to_process(
+    ring_buffer: RingBuffer, consumed: typing.Any, events: int
+) -> None:
+    clock = time.perf_counter_ns
+    ring_size = ring_buffer.ring_size
+    for sequence in range(events):
+        # the ring doesn't gate, so wait for the consumer to keep up
+        while sequence - consumed.value >= ring_size:
+            pass
+        ring_buffer.put(clock())
+
+
+def bench_process(ring_size: int, events: int) -> Result:
+    ring_buffer = RingBuffer(
+        size=ring_size,
+        factory=ValueFactory,
+        cursor_position_value=mp.Value("l", 0, lock=False),
+    )
+    consumed = mp.Value("l", 0, lock=False)
+    producer = mp.Process(
+        target=_produce_to_process, args=(ring_buffer, consumed, events)
+    )
+
+    latencies = []
+    clock = time.perf_counter_ns
+    start = time.perf_counter()
+    producer.start()
+    for sequence in range(events):
+        while sequence >= ring_buffer._get_cursor_position():
+            pass
+        _, stamp = ring_buffer.get(sequence)
+        latencies.append(clock() - stamp)
+        consumed.value = sequence + 1
+    elapsed = time.perf_counter() - start
+    producer.join()
+
+    return _summarise(
+        f"RingBuffer[mp.Value]/size={ring_size}/process",
+        events,
+        elapsed,
+        latencies,
+        variant="RingBuffer[mp.Value]",
+        ring_size=ring_size,
+        payload_size=8,
+        subscribers=1,
+        producer="process",
+    )
+
+
+def run(events: int = 20000) -> typing.Dict[str, typing.Any]:
+    results = []
+    for ring_size in RING_SIZES:
+        for payload_size in PAYLOAD_SIZES:
+            for variant in ("RingBuffer", "LockedRingBuffer", "BlockingRingBuffer"):
+                results.append(bench_put_get(variant, ring_size, payload_size, events))
+            results.append(bench_waiting_ring_buffer(ring_size, payload_size, events))
+            for subscribers in SUBSCRIBER_COUNTS:
+                results.append(
+                    bench_disruptor(ring_size, payload_size, subscribers, events)
+                )
+        results.append(bench_process(ring_size, events))
+
+    return dict(
+        python=platform.python_version(),
+        platform=platform.platform(),
+        events=events,
+        results=results,
+    )
+
+
+def compare(
+    baseline: typing.Dict[str, typing.Any],
+    current: typing.Dict[str, typing.Any],
+    threshold: float = 0.1,
+) -> typing.List[str]:
+    """Returns a line per regressed case."""
+    baseline_results = {result["name"]: result for result in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        previous = baseline_results.get(result["name"])
+        if previous is None:
+            continue
+        throughput = result["ops_per_sec"] / previous["ops_per_sec"] - 1
+        latency = result["p99_us"] / max(previous["p99_us"], 1e-9) - 1
+        if throughput < -threshold or latency > threshold:
+            regressions.append(
+                f"{result['name']}: ops/s {throughput:+.1%}, p99 {latency:+.1%}"
+            )
+    return regressions
+
+
+def _print_results(results: typing.Dict[str, typing.Any]) -> None:
+    for result in results["results"]:
+        print(
+            f"{result['name']:<60} {result['ops_per_sec']:>12,.0f} ops/s "
+            f"p50 {result['p50_us']:>8.1f}us p99 {result['p99_us']:>8.1f}us "
+            f"p99.9 {result['p999_us']:>8.1f}us"
+        )
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m pyring.bench")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--events", type=int, default=20000)
+    run_parser.add_argument("--output", help="write the results to this JSON file")
+
+    compare_parser = commands.add_parser("compare", help="flag regressions")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        results = run(events=args.events)
+        _print_results(results)
+        if args.output:
+            with open(args.output, "w") as output:
+                json.dump(results, output, indent=2)
+        return 0
+
+    with open(args.baseline) as baseline, open(args.current) as current:
+        regressions = compare(json.load(baseline), json.load(current), args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
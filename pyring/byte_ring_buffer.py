@@ -0,0 +1,123 @@
+import struct
+import typing
+from array import array
+from .ring_buffer import run_with_lock, LockLike, RandomAccessRingBufferMethods
+from .exceptions import SequenceNotFound, Empty, SequenceOverwritten
+
+# every record starts with its length, records that would run past the end of
+# the buffer wrap to the start and leave a padding marker behind
+RECORD_HEADER = struct.Struct("<I")
+PADDING = 0xFFFFFFFF
+
+
+class ByteRingBuffer(RandomAccessRingBufferMethods):
+    """Ring buffer of variable-length byte records packed into one
+    contiguous buffer of `capacity` bytes.
+
+    Records are length-prefixed and never split, one that doesn't fit before
+    the end of the buffer pads the rest of it and starts at the beginning.
+    At most the last `size` records are retained, fewer when their bytes
+    have been reused by newer records. Reads return a `memoryview` into the
+    buffer that stays valid until the record is overwritten.
+    """
+
+    def __init__(
+        self,
+        size: int = 16,
+        capacity: int = 4096,
+        lock: typing.Optional[LockLike] = None,
+    ):
+        if not size % 2 == 0:
+            raise AttributeError("size must be a factor of 2 for efficient arithmetic.")
+
+        self.ring_size: int = size
+        self.capacity = capacity
+        self._buffer = memoryview(bytearray(capacity))
+        # byte position of every retained record, positions only ever grow
+        self._positions = array("q", bytes(8 * size))
+        self._cursor_position = 0  # sequence of next write
+        self._write_position = 0  # byte position of next write
+        self._lock = lock
+
+    def _get_cursor_position(self) -> int:
+        return self._cursor_position
+
+    def _to_record(self, value: typing.Any) -> memoryview:
+        data = memoryview(value).cast("B")
+        if RECORD_HEADER.size + data.nbytes > self.capacity:
+            raise ValueError(
+                f"record of {data.nbytes} bytes does not fit in a "
+                f"{self.capacity} byte ring."
+            )
+        return data
+
+    def _reserve(self, nbytes: int) -> int:
+        needed = RECORD_HEADER.size + nbytes
+        position = self._write_position
+        offset = position % self.capacity
+        if offset + needed > self.capacity:
+            if self.capacity - offset >= RECORD_HEADER.size:
+                RECORD_HEADER.pack_into(self._buffer, offset, PADDING)
+            position += self.capacity - offset
+        self._write_position = position + needed
+        return position
+
+    def _write(self, sequence: int, data: memoryview) -> None:
+        position = self._reserve(data.nbytes)
+        offset = position % self.capacity
+        RECORD_HEADER.pack_into(self._buffer, offset, data.nbytes)
+        start = offset + RECORD_HEADER.size
+        self._buffer[start : start + data.nbytes] = data
+        self._positions[sequence % self.ring_size] = position
+
+    @run_with_lock
+    def put(self, value: typing.Any) -> int:
+        sequence = self._cursor_position
+        self._write(sequence, self._to_record(value))
+        self._cursor_position = sequence + 1
+        return sequence
+
+    @run_with_lock
+    def put_many(self, values: typing.Iterable[typing.Any]) -> int:
+        """Every record is checked before any is written, so either all of
+        them are published or none."""
+        records = [self._to_record(value) for value in values]
+        first_sequence = self._cursor_position
+        for sequence, data in enumerate(records, first_sequence):
+            self._write(sequence, data)
+        self._cursor_position = first_sequence + len(records)
+        return first_sequence
+
+    def _read(self, sequence: int) -> memoryview:
+        cursor_position = self._cursor_position
+        if sequence >= cursor_position:
+            raise SequenceNotFound()
+
+        if sequence < cursor_position - self.ring_size:
+            raise SequenceOverwritten()
+
+        position = self._positions[sequence % self.ring_size]
+        if position < self._write_position - self.capacity:
+            raise SequenceOverwritten()
+
+        offset = position % self.capacity
+        (length,) = RECORD_HEADER.unpack_from(self._buffer, offset)
+        start = offset + RECORD_HEADER.size
+        return self._buffer[start : start + length]
+
+    @run_with_lock
+    def get(self, sequence: int) -> typing.Tuple[int, memoryview]:
+        return (sequence, self._read(sequence))
+
+    @run_with_lock
+    def get_latest(self) -> typing.Tuple[int, memoryview]:
+        cursor_position = self._cursor_position
+        if cursor_position <= 0:
+            raise Empty()
+
+        return (cursor_position - 1, self._read(cursor_position - 1))
+
+    @run_with_lock
+    def flush(self) -> None:
+        self._cursor_position = 0
+        self._write_position = 0
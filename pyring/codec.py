@@ -0,0 +1,183 @@
+import pickle
+import re
+import struct
+import typing
+from abc import ABC, abstractmethod
+
+# pickle header: in-band length and number of out-of-band buffers
+_PICKLE_HEADER = struct.Struct("<qq")
+_BUFFER_LENGTH = struct.Struct("<q")
+_FORMAT_ITEM = re.compile(r"\s*(\d*)([xcbB?hHiIlLqQnNefdspP])")
+
+
+def _check_fits(nbytes: int, buffer: memoryview) -> None:
+    if nbytes > buffer.nbytes:
+        raise ValueError(
+            f"value of {nbytes} bytes does not fit in a {buffer.nbytes} byte slot."
+        )
+
+
+class Codec(ABC):
+    """Serializes values straight into a byte slot and back.
+
+    `encode_into` writes `value` at the start of `buffer` and returns the
+    number of bytes written, it raises ValueError when the value doesn't fit.
+    `decode` reads those bytes back and may return views into `buffer`
+    rather than copies, they are valid until the slot is overwritten.
+    """
+
+    @abstractmethod
+    def encode_into(self, value: typing.Any, buffer: memoryview) -> int:
+        ...
+
+    @abstractmethod
+    def decode(self, buffer: memoryview) -> typing.Any:
+        ...
+
+
+class BytesCodec(Codec):
+    """Bytes-like values as they are, decoded as a view of the slot."""
+
+    def encode_into(self, value: typing.Any, buffer: memoryview) -> int:
+        data = memoryview(value).cast("B")
+        _check_fits(data.nbytes, buffer)
+        buffer[: data.nbytes] = data
+        return data.nbytes
+
+    def decode(self, buffer: memoryview) -> memoryview:
+        return buffer
+
+
+def _field_structs(format: str) -> typing.List[typing.Tuple[int, struct.Struct]]:
+    # offset and single field struct of every value in the format
+    byte_order = format[0] if format[:1] and format[0] in "@=<>!" else ""
+    prefix = byte_order
+    fields = []
+    for count, code in _FORMAT_ITEM.findall(format[len(byte_order) :]):
+        count = int(count) if count else 1
+        if code == "x":
+            prefix += f"{count}x"
+            continue
+        items = [f"{count}{code}"] if code in "sp" else [code] * count
+        for item in items:
+            prefix += item
+            field_format = byte_order + item
+            offset = struct.calcsize(prefix) - struct.calcsize(field_format)
+            fields.append((offset, struct.Struct(field_format)))
+    return fields
+
+
+class StructCodec(Codec):
+    """Fixed layout records packed with a `struct` format, values are
+    sequences of fields and decode to tuples.
+
+    `field(buffer, field)` unpacks a single field, by index or by one of
+    `names`, without decoding the rest of the record.
+    """
+
+    def __init__(
+        self, format: str, names: typing.Optional[typing.Sequence[str]] = None
+    ):
+        self.format = format
+        self.struct = struct.Struct(format)
+        self._fields = _field_structs(format)
+        self.names = list(names) if names is not None else None
+        self._indices: typing.Dict[str, int] = {}
+        if self.names is not None:
+            if len(self.names) != len(self._fields):
+                raise ValueError(
+                    f"{len(self.names)} names for {len(self._fields)} fields."
+                )
+            self._indices = {name: index for index, name in enumerate(self.names)}
+
+    def __reduce__(self):
+        return (StructCodec, (self.format, self.names))
+
+    def encode_into(self, value: typing.Any, buffer: memoryview) -> int:
+        _check_fits(self.struct.size, buffer)
+        self.struct.pack_into(buffer, 0, *value)
+        return self.struct.size
+
+    def decode(self, buffer: memoryview) -> typing.Tuple[typing.Any, ...]:
+        return self.struct.unpack_from(buffer)
+
+    def field(self, buffer: memoryview, field: typing.Union[int, str]) -> typing.Any:
+        index = self._indices[field] if isinstance(field, str) else field
+        offset, field_struct = self._fields[index]
+        return field_struct.unpack_from(buffer, offset)[0]
+
+
+class PickleCodec(Codec):
+    """Any picklable value, with pickle protocol 5.
+
+    Buffers pickled out-of-band, such as those of large numpy arrays or
+    `pickle.PickleBuffer`s, are copied once straight into the slot and
+    decoded as views of it rather than copies.
+    """
+
+    def __init__(self) -> None:
+        if pickle.HIGHEST_PROTOCOL < 5:
+            raise ImportError("PickleCodec requires pickle protocol 5 (python 3.8).")
+
+    def encode_into(self, value: typing.Any, buffer: memoryview) -> int:
+        buffers: typing.List[typing.Any] = []
+        data = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+        raws = [pickle_buffer.raw() for pickle_buffer in buffers]
+        nbytes = _PICKLE_HEADER.size + len(data)
+        nbytes += sum(_BUFFER_LENGTH.size + raw.nbytes for raw in raws)
+        _check_fits(nbytes, buffer)
+
+        _PICKLE_HEADER.pack_into(buffer, 0, len(data), len(raws))
+        offset = _PICKLE_HEADER.size
+        buffer[offset : offset + len(data)] = data
+        offset += len(data)
+        for raw in raws:
+            _BUFFER_LENGTH.pack_into(buffer, offset, raw.nbytes)
+            offset += _BUFFER_LENGTH.size
+            buffer[offset : offset + raw.nbytes] = raw
+            offset += raw.nbytes
+            raw.release()
+        return nbytes
+
+    def decode(self, buffer: memoryview) -> typing.Any:
+        length, count = _PICKLE_HEADER.unpack_from(buffer)
+        offset = _PICKLE_HEADER.size
+        data = buffer[offset : offset + length]
+        offset += length
+        buffers = []
+        for _ in range(count):
+            (buffer_length,) = _BUFFER_LENGTH.unpack_from(buffer, offset)
+            offset += _BUFFER_LENGTH.size
+            buffers.append(buffer[offset : offset + buffer_length])
+            offset += buffer_length
+        return pickle.loads(data, buffers=buffers)
+
+
+_UNSET = object()
+
+
+class Encoded:
+    """An encoded slot as read from a ring with a codec. `value` decodes it
+    on first use, `field` reads one field of a `StructCodec` record without
+    decoding the rest. Like the slot view it wraps, it is only valid until
+    the slot is overwritten."""
+
+    __slots__ = ("view", "codec", "_value")
+
+    def __init__(self, view: memoryview, codec: Codec):
+        self.view = view
+        self.codec = codec
+        self._value: typing.Any = _UNSET
+
+    @property
+    def value(self) -> typing.Any:
+        if self._value is _UNSET:
+            self._value = self.codec.decode(self.view)
+        return self._value
+
+    def field(self, field: typing.Union[int, str]) -> typing.Any:
+        return self.codec.field(self.view, field)  # type: ignore
+
+    def release(self) -> None:
+        self._value = _UNSET
+        self.view.release()
@@ -1,9 +1,19 @@
 from abc import ABC, abstractmethod
+import functools
+import sys
 import typing
 from threading import Lock, Event, RLock
 from multiprocessing import Value, Lock as MpLock
-from .exceptions import SequenceNotFound, ReadCursorBlock
-from .ring_buffer import SimpleFactory, RingBufferInternal, RingFactory
+from .exceptions import (
+    SequenceNotFound,
+    SequenceOverwritten,
+    ReadCursorBlock,
+    Empty,
+)
+from .ring_buffer import SimpleFactory, RingBufferInternal, RingFactory, Translator
+from .wait_strategy import WaitStrategy, BlockingWaitStrategy
+from .metrics import RingMetrics, timed_wait
+from .aggregators import Aggregator
 
 
 class DisruptorMethods(ABC):
@@ -17,86 +27,675 @@ class DisruptorMethods(ABC):
 
 
 class DisruptorSubscriber:
-    def __init__(self, ring_buffer: "SingleProducerDisruptor", read_cursor: int = 0):
+    # what happens when the producer laps this subscriber, see subscribe()
+    policy = "block"
+
+    def __init__(
+        self,
+        ring_buffer: "SingleProducerDisruptor",
+        read_cursor: int = 0,
+        wait_strategy: typing.Optional[WaitStrategy] = None,
+    ):
         self._read_cursor = read_cursor
         self.__ring_buffer = ring_buffer
         self._read_cursor_barrier = Event()
         self._write_cursor_barrier = Event()
+        self._wait_strategy = wait_strategy or BlockingWaitStrategy()
+        self._registered = True
+        # number of next() calls blocked on this subscriber
+        self._waiting = 0
+        self._metrics: typing.Optional[RingMetrics] = None
+        # subscribers that must process a sequence before this one can read it
+        self._upstream: typing.List["DisruptorSubscriber"] = []
+        self._downstream: typing.List["DisruptorSubscriber"] = []
 
-    def next(self, timeout: typing.Optional[float] = None):
-        try:
-            res = self.__ring_buffer._get(self._read_cursor)
-        except SequenceNotFound:
-            self._read_cursor_barrier.clear()
-            success = self._read_cursor_barrier.wait(timeout=timeout)
-            if not success:
-                raise SequenceNotFound()
+    def _has_next(self) -> bool:
+        read_cursor = self._read_cursor
+        for upstream in self._upstream:
+            if upstream._read_cursor <= read_cursor:
+                return False
+        return self.__ring_buffer._is_published(read_cursor)
 
+    def _signal_downstream(self) -> None:
+        for downstream in self._downstream:
+            downstream._wait_strategy.signal(downstream._read_cursor_barrier)
+
+    def _read_next(self) -> typing.Tuple[int, typing.Any]:
         res = self.__ring_buffer._get(self._read_cursor)
+        self._read_cursor += 1
 
         # release the write barrier
-        if not self._write_cursor_barrier.is_set():
-            self._write_cursor_barrier.set()
+        self.__ring_buffer._wait_strategy.signal(self._write_cursor_barrier)
+        if self._downstream:
+            self._signal_downstream()
+        return res
+
+    def _peek_next_batch(
+        self, max_items: int
+    ) -> typing.Tuple[int, typing.List[typing.Any]]:
+        """Reads the available sequences without moving the read cursor."""
+        if self._upstream:
+            upstream_cursor = min(upstream._read_cursor for upstream in self._upstream)
+            max_items = min(max_items, upstream_cursor - self._read_cursor)
+        return self.__ring_buffer._get_many(self._read_cursor, max_items)
+
+    def _advance(self, count: int) -> None:
+        self._read_cursor += count
+
+        # release the write barrier
+        self.__ring_buffer._wait_strategy.signal(self._write_cursor_barrier)
+        if self._downstream:
+            self._signal_downstream()
+
+    def _read_next_batch(
+        self, max_items: int
+    ) -> typing.Tuple[int, typing.List[typing.Any]]:
+        res = self._peek_next_batch(max_items)
+        self._advance(len(res[1]))
+        return res
 
+    def _start_waiting(self) -> None:
+        # the producer only signals subscribers that are waiting
+        self._waiting += 1
+        self.__ring_buffer._waiting_subscribers.add(self)
+
+    def _stop_waiting(self) -> None:
+        self._waiting -= 1
+        if not self._waiting:
+            self.__ring_buffer._waiting_subscribers.discard(self)
+
+    def _wait_for_next(self, timeout: typing.Optional[float] = None) -> None:
+        self._start_waiting()
+        try:
+            if not timed_wait(
+                self._wait_strategy,
+                self._has_next,
+                self._read_cursor_barrier,
+                timeout,
+                self._metrics,
+                producer=False,
+            ):
+                raise SequenceNotFound()
+        finally:
+            self._stop_waiting()
+
+    def next(self, timeout: typing.Optional[float] = None):
+        if not self._has_next():
+            self._wait_for_next(timeout)
+
+        return self._read_next()
+
+    def next_batch(self, max_items: int = 16, timeout: typing.Optional[float] = None):
+        if not self._has_next():
+            self._wait_for_next(timeout)
+
+        return self._read_next_batch(max_items)
+
+    def next_slot(
+        self, timeout: typing.Optional[float] = None
+    ) -> typing.Tuple[int, RingFactory]:
+        """Borrows the next slot object rather than `slot.get()`. It is only
+        safe to read until the producer wraps onto it again."""
+        if not self._has_next():
+            self._wait_for_next(timeout)
+
+        res = self.__ring_buffer._get_slot(self._read_cursor)
         self._read_cursor += 1
+
+        # release the write barrier
+        self.__ring_buffer._wait_strategy.signal(self._write_cursor_barrier)
+        if self._downstream:
+            self._signal_downstream()
         return res
 
     def unregister(self) -> None:
+        self._registered = False
         self.__ring_buffer._unregister_subscriber(self)
         if not self._write_cursor_barrier.is_set():
             self._write_cursor_barrier.set()
 
 
+class ConflatingSubscriber(DisruptorSubscriber):
+    """Subscriber that only sees the latest value per key.
+
+    `next()` takes every sequence published since the previous read and
+    returns `(last_sequence, {key(value): value})`, `next_batch` does the
+    same for at most `max_items` sequences. A lagging reader catches up in
+    one read instead of handling each stale event, and stops gating the
+    producer as soon as it has. `conflated` counts the values replaced by a
+    newer one for the same key.
+    """
+
+    def __init__(
+        self,
+        ring_buffer: "SingleProducerDisruptor",
+        read_cursor: int = 0,
+        wait_strategy: typing.Optional[WaitStrategy] = None,
+        key: typing.Callable[[typing.Any], typing.Hashable] = lambda value: value,
+    ):
+        super().__init__(ring_buffer, read_cursor, wait_strategy)
+        self._key = key
+        self.conflated = 0
+
+    def _read_conflated(
+        self, max_items: int
+    ) -> typing.Tuple[int, typing.Dict[typing.Any, typing.Any]]:
+        sequence, values = self._peek_next_batch(max_items)
+        key = self._key
+        latest = {key(value): value for value in values}
+        self.conflated += len(values) - len(latest)
+        self._advance(len(values))
+        return (sequence + len(values) - 1, latest)
+
+    def _read_next(self) -> typing.Tuple[int, typing.Dict[typing.Any, typing.Any]]:
+        return self._read_conflated(sys.maxsize)
+
+    def next_batch(
+        self, max_items: int = 16, timeout: typing.Optional[float] = None
+    ) -> typing.Tuple[int, typing.Dict[typing.Any, typing.Any]]:
+        if not self._has_next():
+            self._wait_for_next(timeout)
+
+        return self._read_conflated(max_items)
+
+    def next_slot(
+        self, timeout: typing.Optional[float] = None
+    ) -> typing.Tuple[int, RingFactory]:
+        raise TypeError("conflating subscribers read values, not slots.")
+
+
+class OverwritableSubscriber(DisruptorSubscriber):
+    """Subscriber that never gates the producer. A read of a sequence the
+    producer has lapped raises `SequenceOverwritten`, with the number of
+    lost sequences as its `lag`, and moves the read cursor to the oldest
+    sequence still retained. `overwritten` counts the lost sequences."""
+
+    policy = "overwrite"
+
+    def __init__(
+        self,
+        ring_buffer: "SingleProducerDisruptor",
+        read_cursor: int = 0,
+        wait_strategy: typing.Optional[WaitStrategy] = None,
+    ):
+        super().__init__(ring_buffer, read_cursor, wait_strategy)
+        self._disruptor = ring_buffer
+        self.overwritten = 0
+
+    def _is_overwritten(self) -> bool:
+        disruptor = self._disruptor
+        return self._read_cursor < disruptor._claimed - disruptor.ring_size
+
+    def _has_next(self) -> bool:
+        return (
+            self._disruptor._is_published(self._read_cursor) or self._is_overwritten()
+        )
+
+    def _skip_overwritten(self) -> None:
+        if self._is_overwritten():
+            disruptor = self._disruptor
+            read_cursor = self._read_cursor
+            oldest = disruptor._claimed - disruptor.ring_size
+            self._read_cursor = oldest
+            self.overwritten += oldest - read_cursor
+            raise SequenceOverwritten(read_cursor, oldest)
+
+    def _peek_next_batch(
+        self, max_items: int
+    ) -> typing.Tuple[int, typing.List[typing.Any]]:
+        self._skip_overwritten()
+        try:
+            res = super()._peek_next_batch(max_items)
+        except SequenceOverwritten:
+            self._skip_overwritten()
+            raise
+        # the producer may have lapped the slots while they were read
+        self._skip_overwritten()
+        return res
+
+    def _read_next(self) -> typing.Tuple[int, typing.Any]:
+        sequence, values = self._read_next_batch(1)
+        return (sequence, values[0])
+
+    def next_slot(
+        self, timeout: typing.Optional[float] = None
+    ) -> typing.Tuple[int, RingFactory]:
+        raise TypeError("slots of non-gating subscribers can be lapped.")
+
+
+class ObserverSubscriber(OverwritableSubscriber):
+    """Subscriber that never gates the producer and only reads the latest
+    published sequence, skipping anything published before it."""
+
+    policy = "observer"
+
+    def _peek_next_batch(
+        self, max_items: int
+    ) -> typing.Tuple[int, typing.List[typing.Any]]:
+        while True:
+            try:
+                sequence, value = self._disruptor._get_latest()
+                break
+            except SequenceOverwritten:
+                # the producer lapped the slot while it was read, there is a
+                # newer latest sequence to read instead
+                continue
+        self._read_cursor = sequence
+        return (sequence, [value])
+
+
+_POLICIES: typing.Dict[str, typing.Type[DisruptorSubscriber]] = {
+    "block": DisruptorSubscriber,
+    "overwrite": OverwritableSubscriber,
+    "observer": ObserverSubscriber,
+}
+
+
 # this really needs locks
 class SingleProducerDisruptor(RingBufferInternal, DisruptorMethods):
+    _subscriber_type: typing.Type[DisruptorSubscriber] = DisruptorSubscriber
+
     def __init__(
         self,
         size: int = 16,
         factory: typing.Type[RingFactory] = SimpleFactory,
         cursor_position_value: typing.Union[Value, int] = 0,
+        wait_strategy: typing.Optional[WaitStrategy] = None,
     ):
         super().__init__(
             size=size, factory=factory, cursor_position_value=cursor_position_value
         )
-        self._subscribers: typing.List[DisruptorSubscriber] = []
+        # dicts are used as insertion ordered sets for O(1) removal
+        self._subscribers: typing.Dict[DisruptorSubscriber, None] = {}
+        # subscribers without downstream dependents, these gate the producer
+        self._gating_subscribers: typing.Dict[DisruptorSubscriber, None] = {}
+        # subscribers blocked in next(), the only ones the producer signals
+        self._waiting_subscribers: typing.Set[DisruptorSubscriber] = set()
+        # lower bound of the gating read cursors, only refreshed near a wrap
+        self._cached_gating_sequence = 0
+        self._wait_strategy = wait_strategy or BlockingWaitStrategy()
+
+    def subscribe(
+        self,
+        start_at_latest: bool = False,
+        wait_strategy: typing.Optional[WaitStrategy] = None,
+        after: typing.Optional[typing.Sequence[DisruptorSubscriber]] = None,
+        conflate: typing.Optional[
+            typing.Callable[[typing.Any], typing.Hashable]
+        ] = None,
+        policy: str = "block",
+    ) -> DisruptorSubscriber:
+        """Subscribes to the ring, subscribers passed as `after` must have
+        processed a sequence before the new subscriber can read it. Dependent
+        subscribers start at the oldest upstream read cursor, and never ahead
+        of it with `start_at_latest`.
+
+        With a `conflate` key function the subscriber is a
+        `ConflatingSubscriber` that only reads the latest value per key.
 
-    def subscribe(self, start_at_latest: bool = False) -> DisruptorSubscriber:
+        `policy` decides what happens when the subscriber falls a ring behind:
+        with "block" the producer waits for it, with "overwrite" the producer
+        carries on and the subscriber gets `SequenceOverwritten` before
+        jumping to the oldest retained sequence, and an "observer" never
+        gates and only reads the latest sequence. Only blocking subscribers
+        can have or be dependencies."""
+        if policy not in _POLICIES:
+            raise ValueError(f"unknown policy {policy!r}.")
+        if policy != "block" and (after or conflate is not None):
+            raise ValueError("only blocking subscribers can use after or conflate.")
+
+        subscriber_type: typing.Callable[..., DisruptorSubscriber]
+        subscriber_type = self._subscriber_type
+        if conflate is not None:
+            subscriber_type = functools.partial(ConflatingSubscriber, key=conflate)
+        elif policy != "block":
+            subscriber_type = _POLICIES[policy]
+        return self._subscribe(subscriber_type, start_at_latest, wait_strategy, after)
+
+    def _subscribe(
+        self,
+        subscriber_type: typing.Callable[..., DisruptorSubscriber],
+        start_at_latest: bool = False,
+        wait_strategy: typing.Optional[WaitStrategy] = None,
+        after: typing.Optional[typing.Sequence[DisruptorSubscriber]] = None,
+    ) -> DisruptorSubscriber:
+        after = list(after or [])
+        for upstream in after:
+            if upstream not in self._subscribers:
+                raise ValueError("upstream subscriber is not registered here.")
+            if upstream.policy != "block":
+                raise ValueError("only blocking subscribers can be dependencies.")
+
+        if wait_strategy is None:
+            wait_strategy = self._wait_strategy
         if start_at_latest:
-            subscriber = DisruptorSubscriber(
-                ring_buffer=self, read_cursor=self._get_latest()[0]
-            )
+            read_cursor = self._get_latest()[0]
+            if after:
+                read_cursor = min(
+                    read_cursor, min(upstream._read_cursor for upstream in after)
+                )
+        elif after:
+            read_cursor = min(upstream._read_cursor for upstream in after)
         else:
-            subscriber = DisruptorSubscriber(ring_buffer=self,)
-        self._subscribers.append(subscriber)
+            # the oldest sequence still in the ring
+            read_cursor = max(0, self._get_cursor_position() - self.ring_size)
+
+        subscriber = subscriber_type(
+            ring_buffer=self, read_cursor=read_cursor, wait_strategy=wait_strategy
+        )
+        if self._metrics is not None:
+            subscriber._metrics = RingMetrics(parent=self._metrics)
+
+        subscriber._upstream = after
+        for upstream in after:
+            upstream._downstream.append(subscriber)
+            self._gating_subscribers.pop(upstream, None)
+
+        self._subscribers[subscriber] = None
+        if subscriber.policy == "block":
+            self._gating_subscribers[subscriber] = None
+            self._cached_gating_sequence = min(
+                self._cached_gating_sequence, read_cursor
+            )
         return subscriber
 
     def _unregister_subscriber(self, subscriber_to_remove: DisruptorSubscriber):
-        subscriber_index = None
-        for sid, subscriber in enumerate(self._subscribers):
-            if subscriber is subscriber_to_remove:
-                subscriber_index = sid
-                break
+        self._subscribers.pop(subscriber_to_remove, None)
+        self._gating_subscribers.pop(subscriber_to_remove, None)
+        self._waiting_subscribers.discard(subscriber_to_remove)
 
-        if subscriber_index is not None:
-            self._subscribers.pop(subscriber_index)
+        # splice the subscriber out of the dependency graph
+        upstreams = subscriber_to_remove._upstream
+        downstreams = subscriber_to_remove._downstream
+        for upstream in upstreams:
+            upstream._downstream.remove(subscriber_to_remove)
+            for downstream in downstreams:
+                if downstream not in upstream._downstream:
+                    upstream._downstream.append(downstream)
+            if not upstream._downstream:
+                self._gating_subscribers[upstream] = None
+        for downstream in downstreams:
+            downstream._upstream.remove(subscriber_to_remove)
+            for upstream in upstreams:
+                if upstream not in downstream._upstream:
+                    downstream._upstream.append(upstream)
+            downstream._wait_strategy.signal(downstream._read_cursor_barrier)
+        subscriber_to_remove._upstream = []
+        subscriber_to_remove._downstream = []
 
-    def put(self, value, timeout: float = None):
+    def enable_metrics(self) -> None:
+        super().enable_metrics()
         for subscriber in self._subscribers:
-            if (
-                self._get_cursor_position() - subscriber._read_cursor
-            ) == self.ring_size:
-                subscriber._write_cursor_barrier.clear()
-                success = subscriber._write_cursor_barrier.wait(timeout=timeout)
-                if not success:
-                    raise ReadCursorBlock()
+            subscriber._metrics = RingMetrics(parent=self._metrics)
 
-        result = super()._put(value)
+    def disable_metrics(self) -> None:
+        super().disable_metrics()
+        for subscriber in self._subscribers:
+            subscriber._metrics = None
 
+    def stats(self) -> typing.Dict[str, typing.Any]:
+        """Ring counters plus, per subscriber, its lag behind the cursor, its
+        own waits and the time the producer spent stalled behind it."""
+        stats = super().stats()
+        cursor_position = stats["cursor"]
+        subscribers = []
         for subscriber in self._subscribers:
+            subscriber_stats = dict(
+                read_cursor=subscriber._read_cursor,
+                lag=cursor_position - subscriber._read_cursor,
+                gating=subscriber in self._gating_subscribers,
+                policy=subscriber.policy,
+            )
+            if isinstance(subscriber, ConflatingSubscriber):
+                subscriber_stats["conflated"] = subscriber.conflated
+            # observers skip sequences on purpose, they don't count as lost
             if (
-                subscriber._read_cursor == result
-                and not subscriber._read_cursor_barrier.is_set()
+                isinstance(subscriber, OverwritableSubscriber)
+                and subscriber.policy == "overwrite"
             ):
-                subscriber._read_cursor_barrier.set()
+                subscriber_stats["overwritten"] = subscriber.overwritten
+            if subscriber._metrics is not None:
+                subscriber_stats.update(subscriber._metrics.wait_snapshot())
+            subscribers.append(subscriber_stats)
+        stats["subscribers"] = subscribers
+        return stats
+
+    def _is_published(self, sequence: int) -> bool:
+        return sequence < self._get_cursor_position()
+
+    def _get_minimum_gating_sequence(
+        self, cursor_position: int
+    ) -> typing.Tuple[int, typing.Optional[DisruptorSubscriber]]:
+        gating_sequence = cursor_position
+        gating_subscriber = None
+        for subscriber in tuple(self._gating_subscribers):
+            if subscriber._read_cursor < gating_sequence:
+                gating_sequence = subscriber._read_cursor
+                gating_subscriber = subscriber
+        return gating_sequence, gating_subscriber
+
+    def _refresh_gating_sequence(
+        self,
+        cursor_position: int,
+        claim_end: int,
+        timeout: typing.Optional[float] = None,
+    ) -> None:
+        while True:
+            gating_sequence, gating_subscriber = self._get_minimum_gating_sequence(
+                cursor_position
+            )
+            self._cached_gating_sequence = gating_sequence
+            if (
+                gating_subscriber is None
+                or claim_end - gating_sequence <= self.ring_size
+            ):
+                return
+            self._wait_for_subscriber(gating_subscriber, claim_end, timeout)
+
+    def _has_capacity_condition(
+        self, subscriber: DisruptorSubscriber, claim_end: int
+    ) -> typing.Callable[[], bool]:
+        ring_size = self.ring_size
+
+        def has_capacity() -> bool:
+            return (
+                claim_end - subscriber._read_cursor <= ring_size
+                or not subscriber._registered
+            )
+
+        return has_capacity
+
+    def _wait_for_subscriber(
+        self,
+        subscriber: DisruptorSubscriber,
+        claim_end: int,
+        timeout: typing.Optional[float] = None,
+    ) -> None:
+        # producer waits are recorded against the subscriber gating them
+        if not timed_wait(
+            self._wait_strategy,
+            self._has_capacity_condition(subscriber, claim_end),
+            subscriber._write_cursor_barrier,
+            timeout,
+            subscriber._metrics,
+            producer=True,
+        ):
+            raise ReadCursorBlock()
+
+    def _signal_subscribers(self, first_sequence: int, stop: int) -> None:
+        for subscriber in tuple(self._waiting_subscribers):
+            if first_sequence <= subscriber._read_cursor < stop:
+                subscriber._wait_strategy.signal(subscriber._read_cursor_barrier)
+
+    def put(self, value, timeout: float = None):
+        cursor_position = self._get_cursor_position()
+        if cursor_position - self._cached_gating_sequence >= self.ring_size:
+            self._refresh_gating_sequence(cursor_position, cursor_position + 1, timeout)
+
+        result = self._put(value)
+        if self._waiting_subscribers:
+            self._signal_subscribers(result, result + 1)
+        return result
+
+    def put_with(
+        self,
+        translator: Translator,
+        *args: typing.Any,
+        timeout: typing.Optional[float] = None,
+    ) -> int:
+        """Fills the next preallocated slot in place with
+        `translator(slot, sequence, *args)` and publishes it."""
+        cursor_position = self._get_cursor_position()
+        if cursor_position - self._cached_gating_sequence >= self.ring_size:
+            self._refresh_gating_sequence(cursor_position, cursor_position + 1, timeout)
 
+        result = self._put_with(translator, args)
+        if self._waiting_subscribers:
+            self._signal_subscribers(result, result + 1)
         return result
+
+    def put_many(self, values: typing.Iterable[typing.Any], timeout: float = None):
+        """Waits until the whole batch fits, nothing is written on timeout."""
+        values = list(values)
+        if len(values) > self.ring_size:
+            raise ValueError("cannot put more values than the ring size at once.")
+
+        cursor_position = self._get_cursor_position()
+        claim_end = cursor_position + len(values)
+        if claim_end - self._cached_gating_sequence > self.ring_size:
+            self._refresh_gating_sequence(cursor_position, claim_end, timeout)
+
+        first_sequence = self._put_many(values)
+        if self._waiting_subscribers:
+            self._signal_subscribers(first_sequence, claim_end)
+        return first_sequence
+
+
+class MultiProducerDisruptor(SingleProducerDisruptor):
+    """Disruptor that any number of producer threads can put to.
+
+    Producers only hold the claim lock while reserving sequences, slots are
+    written concurrently and then marked in the availability buffer.
+    Subscribers only see contiguous runs of published sequences.
+    """
+
+    def __init__(
+        self,
+        size: int = 16,
+        factory: typing.Type[RingFactory] = SimpleFactory,
+        cursor_position_value: typing.Union[Value, int] = 0,
+        wait_strategy: typing.Optional[WaitStrategy] = None,
+    ):
+        super().__init__(
+            size=size,
+            factory=factory,
+            cursor_position_value=cursor_position_value,
+            wait_strategy=wait_strategy,
+        )
+        self._claim_lock = Lock()
+        # sequence last published into each slot
+        self._available: typing.List[int] = [-1] * size
+
+    def add_aggregator(self, name: str, aggregator: Aggregator) -> None:
+        # producers write their slots concurrently and in any order
+        raise TypeError("aggregators require a single producer.")
+
+    def _claim(self, count: int, timeout: typing.Optional[float] = None) -> int:
+        if not self._claim_lock.acquire(timeout=-1 if timeout is None else timeout):
+            if self._metrics is not None:
+                self._metrics.record_wait(True, timeout or 0.0, True)
+            raise ReadCursorBlock()
+        try:
+            cursor_position = self._get_cursor_position()
+            claim_end = cursor_position + count
+            if claim_end - self._cached_gating_sequence > self.ring_size:
+                self._refresh_gating_sequence(cursor_position, claim_end, timeout)
+            self._claimed = claim_end
+            self._set_cursor_position(claim_end)
+        finally:
+            self._claim_lock.release()
+        return cursor_position
+
+    def _publish(self, first_sequence: int, stop: int) -> None:
+        available = self._available
+        ring_size = self.ring_size
+        for sequence in range(first_sequence, stop):
+            available[sequence % ring_size] = sequence
+
+        self._signal_subscribers(first_sequence, stop)
+
+    def put(self, value, timeout: float = None):
+        sequence = self._claim(1, timeout=timeout)
+        self._write(sequence, value)
+        self._publish(sequence, sequence + 1)
+        return sequence
+
+    def put_with(
+        self,
+        translator: Translator,
+        *args: typing.Any,
+        timeout: typing.Optional[float] = None,
+    ) -> int:
+        sequence = self._claim(1, timeout=timeout)
+        self._write_with(sequence, translator, args)
+        self._publish(sequence, sequence + 1)
+        return sequence
+
+    def put_many(self, values: typing.Iterable[typing.Any], timeout: float = None):
+        values = list(values)
+        if len(values) > self.ring_size:
+            raise ValueError("cannot put more values than the ring size at once.")
+
+        first_sequence = self._claim(len(values), timeout=timeout)
+        for offset, value in enumerate(values):
+            self._write(first_sequence + offset, value)
+        self._publish(first_sequence, first_sequence + len(values))
+        return first_sequence
+
+    def _is_published(self, sequence: int) -> bool:
+        return self._available[sequence % self.ring_size] == sequence
+
+    def _get(self, idx: int) -> typing.Tuple[int, typing.Any]:
+        if self._available[idx % self.ring_size] != idx:
+            if idx < self._get_cursor_position() - self.ring_size:
+                raise SequenceOverwritten()
+            # not yet claimed, or claimed but not yet published
+            raise SequenceNotFound()
+        return super()._get(idx)
+
+    def _get_slot(self, idx: int) -> typing.Tuple[int, RingFactory]:
+        if self._available[idx % self.ring_size] != idx:
+            if idx < self._get_cursor_position() - self.ring_size:
+                raise SequenceOverwritten()
+            raise SequenceNotFound()
+        return super()._get_slot(idx)
+
+    def _get_many(
+        self, idx: int, max_items: int
+    ) -> typing.Tuple[int, typing.List[typing.Any]]:
+        available = self._available
+        ring_size = self.ring_size
+        stop = idx
+        limit = idx + max_items
+        while stop < limit and available[stop % ring_size] == stop:
+            stop += 1
+
+        if stop == idx:
+            return self._get(idx)  # raises
+
+        return super()._get_many(idx, stop - idx)
+
+    def _get_latest(self) -> typing.Tuple[int, typing.Any]:
+        # the end of the published run, later sequences may be claimed but
+        # not yet written
+        available = self._available
+        ring_size = self.ring_size
+        start = max(0, self._get_cursor_position() - ring_size)
+        stop = start
+        while stop < start + ring_size and available[stop % ring_size] == stop:
+            stop += 1
+
+        if stop == start:
+            raise Empty()
+
+        return self._get(stop - 1)
@@ -1,5 +1,23 @@
+import typing
+
+
 class SequenceOverwritten(Exception):
-    pass
+    """Raised for a sequence the ring no longer holds. Range reads also set
+    `oldest`, the oldest sequence still retained, so `sequence` up to
+    `oldest - 1` are exactly the sequences that were lost."""
+
+    def __init__(
+        self, sequence: typing.Optional[int] = None, oldest: typing.Optional[int] = None
+    ):
+        super().__init__(*(() if sequence is None else (sequence, oldest)))
+        self.sequence = sequence
+        self.oldest = oldest
+
+    @property
+    def lag(self) -> typing.Optional[int]:
+        if self.sequence is None or self.oldest is None:
+            return None
+        return self.oldest - self.sequence
 
 
 class SequenceNotFound(Exception):
@@ -0,0 +1,170 @@
+import typing
+from .ring_buffer import run_with_lock, LockLike, RandomAccessRingBufferMethods
+from .exceptions import SequenceNotFound, Empty, SequenceOverwritten
+from .codec import Codec, Encoded
+
+# header of int64 fields, padded out to a cache line
+HEADER_SIZE = 64
+CURSOR_FIELD = 0
+RING_SIZE_FIELD = 1
+SLOT_SIZE_FIELD = 2
+
+
+def buffer_size(size: int, slot_size: int) -> int:
+    # header, one int64 length per slot, then the slots
+    return HEADER_SIZE + size * (8 + slot_size)
+
+
+def init_header(buf: typing.Any, size: int, slot_size: int) -> None:
+    header = memoryview(buf)[:HEADER_SIZE].cast("q")
+    header[CURSOR_FIELD] = 0
+    header[RING_SIZE_FIELD] = size
+    header[SLOT_SIZE_FIELD] = slot_size
+    header.release()
+
+
+class FixedSlotRingBuffer(RandomAccessRingBufferMethods):
+    """Ring buffer of bytes-like records of at most `slot_size` bytes, with
+    its cursor and slots laid out in one buffer mapped by the subclass.
+
+    Reads return a `memoryview` into the buffer that stays valid until the
+    slot is overwritten, copy it with `bytes()` if it must outlive that.
+    With a `codec` values of any type are encoded straight into the slot and
+    reads return an `Encoded` wrapping the view, decoded on demand.
+    """
+
+    _lock: typing.Optional[LockLike]
+    _codec: typing.Optional[Codec] = None
+
+    def _map_buffer(self, buf: typing.Any) -> None:
+        buf = memoryview(buf)
+        self._header = buf[:HEADER_SIZE].cast("q")
+        self.ring_size: int = self._header[RING_SIZE_FIELD]
+        self.slot_size: int = self._header[SLOT_SIZE_FIELD]
+
+        lengths_end = HEADER_SIZE + 8 * self.ring_size
+        self._lengths = buf[HEADER_SIZE:lengths_end].cast("q")
+        self._slots = buf[lengths_end : lengths_end + self.ring_size * self.slot_size]
+        buf.release()
+
+    def _release_buffer(self) -> None:
+        # views handed out by get() must be released before this
+        self._header.release()
+        self._lengths.release()
+        self._slots.release()
+
+    def _get_cursor_position(self) -> int:
+        return self._header[CURSOR_FIELD]
+
+    def _write_slot(self, cursor_position: int, value: typing.Any) -> None:
+        if self._codec is not None:
+            ring_index = cursor_position % self.ring_size
+            offset = ring_index * self.slot_size
+            slot = self._slots[offset : offset + self.slot_size]
+            try:
+                self._lengths[ring_index] = self._codec.encode_into(value, slot)
+            finally:
+                slot.release()
+            return
+
+        data = memoryview(value).cast("B")
+        length = data.nbytes
+        if length > self.slot_size:
+            raise ValueError(
+                f"value of {length} bytes does not fit in a {self.slot_size} byte slot."
+            )
+        ring_index = cursor_position % self.ring_size
+        offset = ring_index * self.slot_size
+        self._slots[offset : offset + length] = data
+        self._lengths[ring_index] = length
+
+    def _read_slot(self, sequence: int) -> typing.Any:
+        ring_index = sequence % self.ring_size
+        offset = ring_index * self.slot_size
+        view = self._slots[offset : offset + self._lengths[ring_index]]
+        if self._codec is None:
+            return view
+        return Encoded(view, self._codec)
+
+    @run_with_lock
+    def put(self, value: typing.Any) -> int:
+        cursor_position = self._header[CURSOR_FIELD]
+        self._write_slot(cursor_position, value)
+        # publish only once the slot is written
+        self._header[CURSOR_FIELD] = cursor_position + 1
+        return cursor_position
+
+    @run_with_lock
+    def put_many(self, values: typing.Iterable[typing.Any]) -> int:
+        first_sequence = cursor_position = self._header[CURSOR_FIELD]
+        for value in values:
+            self._write_slot(cursor_position, value)
+            cursor_position += 1
+        self._header[CURSOR_FIELD] = cursor_position
+        return first_sequence
+
+    def _get_unlocked(self, sequence: int) -> typing.Tuple[int, typing.Any]:
+        cursor_position = self._header[CURSOR_FIELD]
+        if sequence >= cursor_position:
+            raise SequenceNotFound()
+
+        if sequence < cursor_position - self.ring_size:
+            raise SequenceOverwritten()
+
+        return (sequence, self._read_slot(sequence))
+
+    def get(self, sequence: int) -> typing.Tuple[int, typing.Any]:
+        # reads are the hot path across processes, the lock check is inlined
+        # rather than going through run_with_lock
+        if self._lock is None:
+            return self._get_unlocked(sequence)
+        with self._lock:
+            return self._get_unlocked(sequence)
+
+    def _get_range_unlocked(
+        self, start: int, stop: int
+    ) -> typing.Tuple[int, typing.List[typing.Any]]:
+        cursor_position = self._header[CURSOR_FIELD]
+        if stop > cursor_position or start > stop:
+            raise SequenceNotFound()
+
+        oldest = max(0, cursor_position - self.ring_size)
+        if start < oldest:
+            raise SequenceOverwritten(start, oldest)
+
+        if self._codec is not None:
+            return (start, [self._read_slot(i) for i in range(start, stop)])
+
+        ring_size = self.ring_size
+        slot_size = self.slot_size
+        slots = self._slots
+        lengths = self._lengths
+        views = []
+        for sequence in range(start, stop):
+            ring_index = sequence % ring_size
+            offset = ring_index * slot_size
+            views.append(slots[offset : offset + lengths[ring_index]])
+        return (start, views)
+
+    def get_range(
+        self, start: int, stop: int
+    ) -> typing.Tuple[int, typing.List[typing.Any]]:
+        """Reads sequences `start` to `stop - 1` with one cursor read and at
+        most one lock acquisition, returning the first sequence and a list of
+        views."""
+        if self._lock is None:
+            return self._get_range_unlocked(start, stop)
+        with self._lock:
+            return self._get_range_unlocked(start, stop)
+
+    @run_with_lock
+    def get_latest(self) -> typing.Tuple[int, typing.Any]:
+        cursor_position = self._header[CURSOR_FIELD]
+        if cursor_position <= 0:
+            raise Empty()
+
+        return self._get_unlocked(cursor_position - 1)
+
+    @run_with_lock
+    def flush(self) -> None:
+        self._header[CURSOR_FIELD] = 0
@@ -0,0 +1,205 @@
+import mmap
+import os
+import typing
+from threading import Event
+from .ring_buffer import LockLike
+from .codec import Codec
+from .fixed_slot import (
+    FixedSlotRingBuffer,
+    buffer_size,
+    init_header,
+    HEADER_SIZE,
+    RING_SIZE_FIELD,
+    SLOT_SIZE_FIELD,
+)
+from .wait_strategy import WaitStrategy, SleepingWaitStrategy
+from .exceptions import SequenceNotFound, SequenceOverwritten
+
+
+class JournalRingBuffer(FixedSlotRingBuffer):
+    """Ring buffer of fixed-size byte slots whose cursor and slots live in a
+    memory-mapped file, so a restarted process recovers the write cursor and
+    can replay every sequence still in the ring with `get` or `subscribe`.
+
+    An existing journal at `path` is reopened with its own size and slot
+    size, `size` and `slot_size` are only used to create a new one.
+
+    Puts are plain memory stores, the slot is written before the cursor so a
+    crashed process never leaves a torn record behind the cursor. The kernel
+    writes dirty pages back on its own, which is enough to survive a process
+    crash. To survive a machine crash pass `sync_every=n` to msync the file
+    every n puts, or call `sync()` at points of your choosing.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        size: typing.Optional[int] = None,
+        slot_size: typing.Optional[int] = None,
+        sync_every: typing.Optional[int] = None,
+        lock: typing.Optional[LockLike] = None,
+        codec: typing.Optional[Codec] = None,
+    ):
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        if not exists:
+            size = 16 if size is None else size
+            slot_size = 64 if slot_size is None else slot_size
+            if not size % 2 == 0:
+                raise AttributeError(
+                    "size must be a factor of 2 for efficient arithmetic."
+                )
+            with open(path, "wb") as journal_file:
+                journal_file.truncate(buffer_size(size, slot_size))
+
+        self.path = path
+        self._file = open(path, "r+b")
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+        if not exists:
+            init_header(self._mmap, size, slot_size)  # type: ignore
+        else:
+            self._check_header(size, slot_size)
+
+        self._lock = lock
+        self._codec = codec
+        self._sync_every = sync_every
+        self._unsynced = 0
+        self._map_buffer(self._mmap)
+
+    def _check_header(
+        self, size: typing.Optional[int], slot_size: typing.Optional[int]
+    ) -> None:
+        header = memoryview(self._mmap)[:HEADER_SIZE].cast("q")
+        ring_size, ring_slot_size = header[RING_SIZE_FIELD], header[SLOT_SIZE_FIELD]
+        header.release()
+        if len(self._mmap) != buffer_size(ring_size, ring_slot_size):
+            self._mmap.close()
+            self._file.close()
+            raise ValueError(f"{self.path} is not a journal ring buffer.")
+        if (size is not None and size != ring_size) or (
+            slot_size is not None and slot_size != ring_slot_size
+        ):
+            self._mmap.close()
+            self._file.close()
+            raise ValueError(
+                f"{self.path} holds a journal of size {ring_size} with "
+                f"{ring_slot_size} byte slots."
+            )
+
+    def __reduce__(self):
+        return (
+            JournalRingBuffer,
+            (self.path, None, None, self._sync_every, self._lock, self._codec),
+        )
+
+    def __enter__(self) -> "JournalRingBuffer":
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.close()
+
+    def put(self, value: typing.Any) -> int:
+        sequence = super().put(value)
+        if self._sync_every is not None:
+            self._unsynced += 1
+            if self._unsynced >= self._sync_every:
+                self.sync()
+        return sequence
+
+    def put_many(self, values: typing.Iterable[typing.Any]) -> int:
+        values = list(values)
+        first_sequence = super().put_many(values)
+        if self._sync_every is not None:
+            self._unsynced += len(values)
+            if self._unsynced >= self._sync_every:
+                self.sync()
+        return first_sequence
+
+    def sync(self) -> None:
+        """Flushes the mapped file to disk with msync."""
+        self._mmap.flush()
+        self._unsynced = 0
+
+    def subscribe(
+        self,
+        start_sequence: typing.Optional[int] = None,
+        wait_strategy: typing.Optional[WaitStrategy] = None,
+    ) -> "JournalSubscriber":
+        """Reads the journal in order from `start_sequence`, by default the
+        oldest sequence still in the ring."""
+        if start_sequence is None:
+            start_sequence = max(0, self._get_cursor_position() - self.ring_size)
+        return JournalSubscriber(self, start_sequence, wait_strategy)
+
+    def close(self) -> None:
+        # views handed out by get() must be released before closing
+        self._release_buffer()
+        self._mmap.close()
+        self._file.close()
+
+
+class JournalSubscriber:
+    """Sequential reader of a `JournalRingBuffer`.
+
+    Subscribers don't gate the writer, which may be in another process, so a
+    subscriber that falls a whole ring behind gets `SequenceOverwritten`, with
+    the number of lost sequences as its `lag`, and its next read starts at
+    the oldest sequence still retained. `overwritten` counts the lost
+    sequences. Waiting polls the cursor, the default is a
+    `SleepingWaitStrategy`.
+    """
+
+    def __init__(
+        self,
+        journal: JournalRingBuffer,
+        read_cursor: int = 0,
+        wait_strategy: typing.Optional[WaitStrategy] = None,
+    ):
+        self._journal = journal
+        self._read_cursor = read_cursor
+        self._read_cursor_barrier = Event()
+        self._wait_strategy = wait_strategy or SleepingWaitStrategy()
+        self.overwritten = 0
+
+    def _has_next(self) -> bool:
+        return self._read_cursor < self._journal._get_cursor_position()
+
+    def _wait_for_next(self, timeout: typing.Optional[float]) -> None:
+        if not self._has_next():
+            if not self._wait_strategy.wait(
+                self._has_next, self._read_cursor_barrier, timeout=timeout
+            ):
+                raise SequenceNotFound()
+
+    def _skip_overwritten(self) -> None:
+        journal = self._journal
+        oldest = journal._get_cursor_position() - journal.ring_size
+        read_cursor = self._read_cursor
+        if read_cursor < oldest:
+            self._read_cursor = oldest
+            self.overwritten += oldest - read_cursor
+            raise SequenceOverwritten(read_cursor, oldest)
+
+    def next(self, timeout: typing.Optional[float] = None):
+        self._wait_for_next(timeout)
+        self._skip_overwritten()
+        try:
+            res = self._journal.get(self._read_cursor)
+        except SequenceOverwritten:
+            # the writer lapped the subscriber between the check and the read
+            self._skip_overwritten()
+            raise
+        self._read_cursor += 1
+        return res
+
+    def next_batch(self, max_items: int = 16, timeout: typing.Optional[float] = None):
+        self._wait_for_next(timeout)
+        self._skip_overwritten()
+        first_sequence = self._read_cursor
+        stop = min(self._journal._get_cursor_position(), first_sequence + max_items)
+        try:
+            res = self._journal.get_range(first_sequence, stop)
+        except SequenceOverwritten:
+            self._skip_overwritten()
+            raise
+        self._read_cursor = stop
+        return res
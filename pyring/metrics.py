@@ -0,0 +1,94 @@
+import time
+import typing
+from threading import Event
+from .wait_strategy import WaitStrategy, AsyncWaitStrategy, Condition
+
+
+class RingMetrics:
+    """Counters kept by a ring or a disruptor subscriber once metrics are
+    enabled with `enable_metrics()`.
+
+    Producer waits are waits for free slots and consumer waits are waits for
+    new sequences, a wait that times out is also counted as a timeout. A
+    subscriber's counters are added to its disruptor's as well.
+    """
+
+    def __init__(self, parent: typing.Optional["RingMetrics"] = None) -> None:
+        self.parent = parent
+        self.started = time.monotonic()
+        self.puts = 0
+        self.gets = 0
+        self.producer_waits = 0
+        self.producer_wait_time = 0.0
+        self.producer_timeouts = 0
+        self.consumer_waits = 0
+        self.consumer_wait_time = 0.0
+        self.consumer_timeouts = 0
+
+    def record_wait(self, producer: bool, wait_time: float, timed_out: bool) -> None:
+        if producer:
+            self.producer_waits += 1
+            self.producer_wait_time += wait_time
+            self.producer_timeouts += timed_out
+        else:
+            self.consumer_waits += 1
+            self.consumer_wait_time += wait_time
+            self.consumer_timeouts += timed_out
+        if self.parent is not None:
+            self.parent.record_wait(producer, wait_time, timed_out)
+
+    def snapshot(self) -> typing.Dict[str, typing.Any]:
+        elapsed = time.monotonic() - self.started
+        return dict(
+            elapsed=elapsed,
+            puts=self.puts,
+            gets=self.gets,
+            puts_per_sec=self.puts / elapsed if elapsed else 0.0,
+            gets_per_sec=self.gets / elapsed if elapsed else 0.0,
+            **self.wait_snapshot(),
+        )
+
+    def wait_snapshot(self) -> typing.Dict[str, typing.Any]:
+        return dict(
+            producer_waits=self.producer_waits,
+            producer_wait_time=self.producer_wait_time,
+            producer_timeouts=self.producer_timeouts,
+            consumer_waits=self.consumer_waits,
+            consumer_wait_time=self.consumer_wait_time,
+            consumer_timeouts=self.consumer_timeouts,
+        )
+
+
+def timed_wait(
+    wait_strategy: WaitStrategy,
+    condition: Condition,
+    barrier: Event,
+    timeout: typing.Optional[float],
+    metrics: typing.Optional[RingMetrics],
+    producer: bool,
+) -> bool:
+    """`wait_strategy.wait` that records the wait when `metrics` is set."""
+    if metrics is None:
+        return wait_strategy.wait(condition, barrier, timeout=timeout)
+
+    started = time.perf_counter()
+    satisfied = wait_strategy.wait(condition, barrier, timeout=timeout)
+    metrics.record_wait(producer, time.perf_counter() - started, not satisfied)
+    return satisfied
+
+
+async def timed_wait_async(
+    wait_strategy: AsyncWaitStrategy,
+    condition: Condition,
+    barrier: Event,
+    timeout: typing.Optional[float],
+    metrics: typing.Optional[RingMetrics],
+    producer: bool,
+) -> bool:
+    if metrics is None:
+        return await wait_strategy.wait_async(condition, barrier, timeout=timeout)
+
+    started = time.perf_counter()
+    satisfied = await wait_strategy.wait_async(condition, barrier, timeout=timeout)
+    metrics.record_wait(producer, time.perf_counter() - started, not satisfied)
+    return satisfied
@@ -0,0 +1,116 @@
+import sys
+import threading
+import traceback
+import typing
+from .disruptor import DisruptorSubscriber
+from .metrics import timed_wait
+from .exceptions import SequenceOverwritten
+
+EventHandler = typing.Callable[[typing.Any, int, bool], None]
+ExceptionHandler = typing.Callable[[BaseException, int, typing.Any], None]
+
+
+def print_exception(exception: BaseException, sequence: int, value: typing.Any):
+    """Default exception handler, prints the traceback to stderr."""
+    print(f"exception handling sequence {sequence}:", file=sys.stderr)
+    traceback.print_exception(
+        type(exception), exception, exception.__traceback__, file=sys.stderr
+    )
+
+
+class BatchEventProcessor:
+    """Runs `handler(value, sequence, end_of_batch)` for every sequence read
+    by `subscriber`, on a thread started with `start()`.
+
+    Each pass drains everything published up to the producer cursor (at most
+    `max_batch_size` sequences) and `end_of_batch` is True for the last value
+    of the pass, so handlers can flush or make syscalls once per batch. The
+    read cursor only moves past a batch once the handler has seen all of it,
+    so downstream subscribers and the producer wait for the handler.
+
+    An exception raised by the handler is passed to `exception_handler` with
+    the sequence and value and processing carries on with the next sequence.
+    `halt()` wakes the processor if it is waiting, lets it finish the current
+    batch and joins the thread. A halted processor's subscriber still gates
+    the producer, unregister it if it won't be started again.
+    """
+
+    def __init__(
+        self,
+        subscriber: DisruptorSubscriber,
+        handler: EventHandler,
+        exception_handler: ExceptionHandler = print_exception,
+        max_batch_size: typing.Optional[int] = None,
+        name: typing.Optional[str] = None,
+    ):
+        self.subscriber = subscriber
+        self.handler = handler
+        self.exception_handler = exception_handler
+        self.max_batch_size = max_batch_size or sys.maxsize
+        self.name = name
+        self._halted = False
+        self._thread: typing.Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.is_running:
+            raise RuntimeError("processor is already running.")
+        self._halted = False
+        self._thread = threading.Thread(target=self.run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def halt(self, timeout: typing.Optional[float] = None) -> None:
+        self._halted = True
+        subscriber = self.subscriber
+        subscriber._wait_strategy.signal(subscriber._read_cursor_barrier)
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _can_run(self) -> bool:
+        return self._halted or self.subscriber._has_next()
+
+    def _wait(self) -> None:
+        subscriber = self.subscriber
+        subscriber._start_waiting()
+        try:
+            timed_wait(
+                subscriber._wait_strategy,
+                self._can_run,
+                subscriber._read_cursor_barrier,
+                None,
+                subscriber._metrics,
+                producer=False,
+            )
+        finally:
+            subscriber._stop_waiting()
+
+    def run(self) -> None:
+        """Processes sequences on the calling thread until halted."""
+        subscriber = self.subscriber
+        handler = self.handler
+        max_batch_size = self.max_batch_size
+        while not self._halted:
+            if not subscriber._has_next():
+                self._wait()
+                continue
+
+            try:
+                first_sequence, values = subscriber._peek_next_batch(max_batch_size)
+            except SequenceOverwritten as overwritten:
+                # a non-gating subscriber was lapped and skipped ahead
+                sequence = overwritten.sequence
+                if sequence is None:
+                    sequence = subscriber._read_cursor
+                self.exception_handler(overwritten, sequence, None)
+                continue
+            last = len(values) - 1
+            for offset, value in enumerate(values):
+                try:
+                    handler(value, first_sequence + offset, offset == last)
+                except Exception as exception:
+                    self.exception_handler(exception, first_sequence + offset, value)
+            subscriber._advance(len(values))
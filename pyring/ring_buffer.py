@@ -1,12 +1,19 @@
+import itertools
 import typing
 from threading import Lock, Event, RLock
 from multiprocessing import Value, Lock as MpLock
 from abc import abstractmethod, ABC
 from .ring_factory import RingFactory, SimpleFactory
+from .wait_strategy import WaitStrategy, BlockingWaitStrategy
+from .metrics import RingMetrics, timed_wait
+from .aggregators import Aggregator
 from .exceptions import SequenceNotFound, Empty, SequenceOverwritten, ReadCursorBlock
 
 T = typing.TypeVar("T", bound=typing.Callable[..., typing.Any])
 
+# fills a slot in place, called as translator(slot, sequence, *args)
+Translator = typing.Callable[..., None]
+
 
 def run_with_lock(func: T) -> T:
     def with_lock(
@@ -23,7 +30,42 @@ def run_with_lock(func: T) -> T:
 LockLike = typing.Union[Lock, RLock]
 
 
+class _LazySlots(dict):
+    # slots of a lazy factory by ring index, each is created on first access
+    def __init__(self, factory: typing.Type[RingFactory]):
+        super().__init__()
+        self.factory = factory
+
+    def __missing__(self, index: int) -> RingFactory:
+        slot = self[index] = self.factory()
+        return slot
+
+
+Slots = typing.Union[typing.List[RingFactory], _LazySlots]
+
+
+def _allocate_slots(factory: typing.Type[RingFactory], size: int) -> Slots:
+    if getattr(factory, "lazy", False):
+        return _LazySlots(factory)
+    create_many = getattr(factory, "create_many", None)
+    if create_many is not None:
+        return create_many(size)
+    return [factory() for _ in range(size)]
+
+
+def _allocated_slots(ring: Slots) -> typing.Iterable[RingFactory]:
+    return ring.values() if isinstance(ring, _LazySlots) else ring
+
+
 class RingBufferInternal:
+    # the user facing class, specialized instances are private subclasses of it
+    _public_class: typing.Type["RingBufferInternal"]
+
+    def __init_subclass__(cls, **kwargs: typing.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if not getattr(cls, "_is_specialized", False):
+            cls._public_class = cls
+
     def __init__(
         self,
         size: int = 16,
@@ -33,13 +75,85 @@ class RingBufferInternal:
     ):
         if not size % 2 == 0:
             raise AttributeError("size must be a factor of 2 for efficient arithmetic.")
+        if getattr(factory, "lazy", False) and not isinstance(
+            cursor_position_value, int
+        ):
+            # a lazy slot is private to the process that first writes it
+            raise ValueError("lazy factories can't be shared with other processes.")
 
         self.ring_size: int = size
         self.factory = factory
 
         self.__cursor_position = cursor_position_value  # position of next write
-        self.__ring: typing.List[RingFactory] = [factory() for _ in range(size)]
+        self.__ring: Slots = _allocate_slots(factory, size)
         self._lock = lock
+        # end of the sequences being written, set before the slots are so
+        # lock-less readers can tell whether a slot was lapped while read
+        self._claimed = self._get_cursor_position()
+        self._metrics: typing.Optional[RingMetrics] = None
+        self._aggregators: typing.Dict[str, Aggregator] = {}
+
+        self._specialize()
+
+    def _specialize(self) -> None:
+        # swaps the instance to a private subclass carrying the cheapest hot
+        # path for this lock / cursor combination, so calls skip the lock
+        # check and the cursor isinstance dispatch
+        int_cursor = isinstance(self.__cursor_position, int)
+        if self._lock is not None:
+            variant = "locked_int" if int_cursor else "locked_value"
+        else:
+            variant = "int" if int_cursor else "value"
+        self.__class__ = _get_specialized_class(
+            self._public_class,
+            variant,
+            self._metrics is not None,
+            bool(self._aggregators),
+        )
+
+    def __reduce_ex__(self, protocol):
+        # the specialized class only exists in this process, pickle as the
+        # public class and specialize again on load
+        return (_restore_ring_buffer, (self._public_class, self.__dict__))
+
+    def enable_metrics(self) -> None:
+        """Starts counting puts, gets, waits and timeouts for `stats()`,
+        rings without metrics pay nothing for them."""
+        self._metrics = RingMetrics()
+        self._specialize()
+
+    def disable_metrics(self) -> None:
+        self._metrics = None
+        self._specialize()
+
+    def stats(self) -> typing.Dict[str, typing.Any]:
+        if self._metrics is None:
+            raise RuntimeError("metrics are not enabled, call enable_metrics().")
+        return dict(cursor=self._get_cursor_position(), **self._metrics.snapshot())
+
+    @run_with_lock
+    def add_aggregator(self, name: str, aggregator: Aggregator) -> None:
+        """Keeps `aggregator` up to date with every put, starting from the
+        values already in the ring. Rings without aggregators pay nothing
+        for them."""
+        cursor_position = self._get_cursor_position()
+        key = aggregator.key
+        for sequence in range(
+            max(0, cursor_position - self.ring_size), cursor_position
+        ):
+            value = self.__ring[sequence % self.ring_size].get()
+            aggregator.add(sequence, value if key is None else key(value))
+        self._aggregators[name] = aggregator
+        self._specialize()
+
+    @run_with_lock
+    def remove_aggregator(self, name: str) -> None:
+        del self._aggregators[name]
+        self._specialize()
+
+    @run_with_lock
+    def aggregate(self, name: str) -> typing.Any:
+        return self._aggregators[name].value
 
     def _get_cursor_position(self):
         if isinstance(self.__cursor_position, int):
@@ -53,19 +167,182 @@ class RingBufferInternal:
         else:
             self.__cursor_position.value = value
 
-    @run_with_lock
-    def _put(self, value) -> int:
+    def _get_int_cursor_position(self) -> int:
+        return self.__cursor_position
+
+    def _set_int_cursor_position(self, value: int) -> None:
+        self.__cursor_position = value
+
+    # the value variants are only installed on rings with a shared cursor
+    def _get_value_cursor_position(self) -> int:
+        return self.__cursor_position.value  # type: ignore
+
+    def _set_value_cursor_position(self, value: int) -> None:
+        self.__cursor_position.value = value  # type: ignore
+
+    def _get_shared_state(self) -> typing.Tuple[typing.List[RingFactory], typing.Any]:
+        # the slots and cursor, for readers in other processes, which can't
+        # see slots allocated after they start
+        ring = self.__ring
+        if isinstance(ring, _LazySlots):
+            ring = [ring[index] for index in range(self.ring_size)]
+        return ring, self.__cursor_position
+
+    def _put_int_cursor(self, value) -> int:
+        cursor_position = self.__cursor_position
+        self._claimed = cursor_position + 1
+        # readers trust the cursor, publish after the write
+        self.__ring[cursor_position % self.ring_size].set(value)
+        self.__cursor_position = cursor_position + 1
+        return cursor_position
+
+    def _get_int_cursor(self, idx: int) -> typing.Tuple[int, typing.Any]:
+        cursor_position = self.__cursor_position
+        if idx >= cursor_position:
+            raise SequenceNotFound()
+
+        if idx < cursor_position - self.ring_size:
+            raise SequenceOverwritten()
+
+        value = self.__ring[idx % self.ring_size].get()
+        # a producer running alongside may have lapped the slot meanwhile
+        if idx < self._claimed - self.ring_size:
+            raise SequenceOverwritten()
+
+        return (idx, value)
+
+    # the locked variants are only installed on rings that have a lock
+    def _put_locked(self, value) -> int:
+        with self._lock:  # type: ignore
+            return self._put_unlocked(value)
+
+    def _get_locked(self, idx: int) -> typing.Tuple[int, typing.Any]:
+        with self._lock:  # type: ignore
+            return self._get_unlocked(idx)
+
+    def _put_unlocked(self, value) -> int:
         cursor_position = self._get_cursor_position()
+        self._claimed = cursor_position + 1
         ring_index = cursor_position % self.ring_size
 
+        # readers in other processes trust the cursor, publish after the write
+        self.__ring[ring_index].set(value)
+
         self._set_cursor_position(cursor_position + 1)
 
-        self.__ring[ring_index].set(value)
+        return cursor_position
+
+    _put = run_with_lock(_put_unlocked)
+
+    def _write(self, sequence: int, value) -> None:
+        # writes a slot without moving the cursor, callers handle publication
+        self.__ring[sequence % self.ring_size].set(value)
+
+    def _write_with(
+        self, sequence: int, translator: Translator, args: typing.Tuple
+    ) -> None:
+        translator(self.__ring[sequence % self.ring_size], sequence, *args)
+
+    @run_with_lock
+    def _put_with(self, translator: Translator, args: typing.Tuple) -> int:
+        cursor_position = self._get_cursor_position()
+        self._claimed = cursor_position + 1
+        translator(
+            self.__ring[cursor_position % self.ring_size], cursor_position, *args
+        )
+        # publish only once the slot is filled
+        self._set_cursor_position(cursor_position + 1)
+        return cursor_position
+
+    @run_with_lock
+    def _put_many(self, values: typing.Sequence[typing.Any]) -> int:
+        cursor_position = self._get_cursor_position()
+        self._claimed = cursor_position + len(values)
+        ring_size = self.ring_size
+        ring = self.__ring
+
+        for offset, value in enumerate(values):
+            ring[(cursor_position + offset) % ring_size].set(value)
+
+        self._set_cursor_position(cursor_position + len(values))
+
+        return cursor_position
+
+    def _evict_overwritten(self, sequence: int, slot: RingFactory) -> None:
+        # the value about to be overwritten leaves the aggregates first
+        if sequence >= self.ring_size:
+            value = slot.get()
+            for aggregator in self._aggregators.values():
+                key = aggregator.key
+                aggregator.evict(
+                    sequence - self.ring_size, value if key is None else key(value)
+                )
+
+    def _add_published(self, sequence: int, slot: RingFactory) -> None:
+        value = slot.get()
+        for aggregator in self._aggregators.values():
+            key = aggregator.key
+            aggregator.add(sequence, value if key is None else key(value))
+
+    @run_with_lock
+    def _put_aggregated(self, value) -> int:
+        cursor_position = self._get_cursor_position()
+        self._claimed = cursor_position + 1
+        slot = self.__ring[cursor_position % self.ring_size]
+        self._evict_overwritten(cursor_position, slot)
+        slot.set(value)
+        self._add_published(cursor_position, slot)
+        self._set_cursor_position(cursor_position + 1)
+        return cursor_position
+
+    @run_with_lock
+    def _put_with_aggregated(self, translator: Translator, args: typing.Tuple) -> int:
+        cursor_position = self._get_cursor_position()
+        self._claimed = cursor_position + 1
+        slot = self.__ring[cursor_position % self.ring_size]
+        self._evict_overwritten(cursor_position, slot)
+        translator(slot, cursor_position, *args)
+        self._add_published(cursor_position, slot)
+        self._set_cursor_position(cursor_position + 1)
+        return cursor_position
+
+    @run_with_lock
+    def _put_many_aggregated(self, values: typing.Sequence[typing.Any]) -> int:
+        cursor_position = self._get_cursor_position()
+        self._claimed = cursor_position + len(values)
+        ring_size = self.ring_size
+        ring = self.__ring
+
+        for sequence, value in enumerate(values, cursor_position):
+            slot = ring[sequence % ring_size]
+            self._evict_overwritten(sequence, slot)
+            slot.set(value)
+            self._add_published(sequence, slot)
 
+        self._set_cursor_position(cursor_position + len(values))
         return cursor_position
 
+    def _get_unlocked(self, idx: int) -> typing.Tuple[int, typing.Any]:
+        cursor_position = self._get_cursor_position()
+        if idx >= cursor_position:
+            raise SequenceNotFound()
+
+        if idx < cursor_position - self.ring_size:
+            raise SequenceOverwritten()
+
+        value = self.__ring[idx % self.ring_size].get()
+        # a producer running alongside may have lapped the slot meanwhile
+        if idx < self._claimed - self.ring_size:
+            raise SequenceOverwritten()
+
+        return (idx, value)
+
     @run_with_lock
     def _get(self, idx: int) -> typing.Tuple[int, typing.Any]:
+        return self._get_unlocked(idx)
+
+    @run_with_lock
+    def _get_slot(self, idx: int) -> typing.Tuple[int, RingFactory]:
         cursor_position = self._get_cursor_position()
         if idx >= cursor_position:
             raise SequenceNotFound()
@@ -73,7 +350,51 @@ class RingBufferInternal:
         if idx < cursor_position - self.ring_size:
             raise SequenceOverwritten()
 
-        return (idx, self.__ring[idx % self.ring_size].get())
+        return (idx, self.__ring[idx % self.ring_size])
+
+    @run_with_lock
+    def _get_many(
+        self, idx: int, max_items: int
+    ) -> typing.Tuple[int, typing.List[typing.Any]]:
+        cursor_position = self._get_cursor_position()
+        if idx >= cursor_position:
+            raise SequenceNotFound()
+
+        if idx < cursor_position - self.ring_size:
+            raise SequenceOverwritten()
+
+        ring_size = self.ring_size
+        ring = self.__ring
+        stop = min(cursor_position, idx + max_items)
+        values = [ring[i % ring_size].get() for i in range(idx, stop)]
+        if idx < self._claimed - ring_size:
+            raise SequenceOverwritten()
+
+        return (idx, values)
+
+    @run_with_lock
+    def _get_range(
+        self, start: typing.Optional[int] = None, stop: typing.Optional[int] = None
+    ) -> typing.Tuple[int, typing.List[typing.Any]]:
+        # one lock acquisition and one cursor read for the whole span, start
+        # defaults to the oldest retained sequence and stop to the cursor
+        cursor_position = self._get_cursor_position()
+        oldest = max(0, cursor_position - self.ring_size)
+        start = oldest if start is None else start
+        stop = cursor_position if stop is None else stop
+        if stop > cursor_position or start > stop:
+            raise SequenceNotFound()
+
+        if start < oldest:
+            raise SequenceOverwritten(start, oldest)
+
+        ring_size = self.ring_size
+        ring = self.__ring
+        values = [ring[i % ring_size].get() for i in range(start, stop)]
+        if start < self._claimed - ring_size:
+            raise SequenceOverwritten(start, self._claimed - ring_size)
+
+        return (start, values)
 
     @run_with_lock
     def _get_latest(self) -> typing.Tuple[int, typing.Any]:
@@ -87,8 +408,167 @@ class RingBufferInternal:
 
     @run_with_lock
     def _flush(self) -> None:
-        self.__ring = [self.factory() for _ in range(self.ring_size)]
+        # slots are reused, only the cursor decides what readers can see, and
+        # factories without a reset hook of their own are not touched at all
+        reset = getattr(self.factory, "reset", None)
+        if reset is None:
+            self.__ring = _allocate_slots(self.factory, self.ring_size)
+        elif reset is not RingFactory.reset:
+            for slot in _allocated_slots(self.__ring):
+                slot.reset()
+        for aggregator in self._aggregators.values():
+            aggregator.reset()
         self._set_cursor_position(0)
+        self._claimed = 0
+
+
+RingBufferInternal._public_class = RingBufferInternal
+
+_SPECIALIZED_METHODS: typing.Dict[str, typing.Dict[str, str]] = {
+    "int": {
+        "_get_cursor_position": "_get_int_cursor_position",
+        "_set_cursor_position": "_set_int_cursor_position",
+        "_put": "_put_int_cursor",
+        "_get": "_get_int_cursor",
+    },
+    "value": {
+        "_get_cursor_position": "_get_value_cursor_position",
+        "_set_cursor_position": "_set_value_cursor_position",
+        "_put": "_put_unlocked",
+        "_get": "_get_unlocked",
+    },
+    "locked_int": {
+        "_get_cursor_position": "_get_int_cursor_position",
+        "_set_cursor_position": "_set_int_cursor_position",
+        "_put": "_put_locked",
+        "_get": "_get_locked",
+    },
+    "locked_value": {
+        "_get_cursor_position": "_get_value_cursor_position",
+        "_set_cursor_position": "_set_value_cursor_position",
+        "_put": "_put_locked",
+        "_get": "_get_locked",
+    },
+}
+
+
+# put paths swapped in while a ring has aggregators
+_AGGREGATED_METHODS = {
+    "_put": "_put_aggregated",
+    "_put_with": "_put_with_aggregated",
+    "_put_many": "_put_many_aggregated",
+}
+
+
+def _count_put(put: typing.Callable[..., int]) -> typing.Callable[..., int]:
+    def counted_put(self: RingBufferInternal, *args: typing.Any) -> int:
+        sequence = put(self, *args)
+        self._metrics.puts += 1  # type: ignore
+        return sequence
+
+    return counted_put
+
+
+def _count_put_many(put_many: typing.Callable[..., int]) -> typing.Callable[..., int]:
+    def counted_put_many(
+        self: RingBufferInternal, values: typing.Sequence[typing.Any]
+    ) -> int:
+        sequence = put_many(self, values)
+        self._metrics.puts += len(values)  # type: ignore
+        return sequence
+
+    return counted_put_many
+
+
+def _count_claim(claim: typing.Callable[..., int]) -> typing.Callable[..., int]:
+    def counted_claim(
+        self: RingBufferInternal, count: int, *args: typing.Any, **kwargs: typing.Any
+    ) -> int:
+        sequence = claim(self, count, *args, **kwargs)
+        self._metrics.puts += count  # type: ignore
+        return sequence
+
+    return counted_claim
+
+
+def _count_get(
+    get: typing.Callable[..., typing.Any]
+) -> typing.Callable[..., typing.Any]:
+    def counted_get(self: RingBufferInternal, idx: int) -> typing.Any:
+        result = get(self, idx)
+        self._metrics.gets += 1  # type: ignore
+        return result
+
+    return counted_get
+
+
+def _count_get_many(
+    get_many: typing.Callable[..., typing.Any]
+) -> typing.Callable[..., typing.Any]:
+    def counted_get_many(self: RingBufferInternal, *args: typing.Any) -> typing.Any:
+        result = get_many(self, *args)
+        self._metrics.gets += len(result[1])  # type: ignore
+        return result
+
+    return counted_get_many
+
+
+# wrappers installed on instrumented rings, on top of the fast paths
+_COUNTED_METHODS = {
+    "_put": _count_put,
+    "_put_with": _count_put,
+    "_put_many": _count_put_many,
+    "_claim": _count_claim,
+    "_get": _count_get,
+    "_get_slot": _count_get,
+    "_get_many": _count_get_many,
+    "_get_range": _count_get_many,
+}
+
+_specialized_classes: typing.Dict[
+    typing.Tuple[type, str, bool, bool], typing.Type[RingBufferInternal]
+] = {}
+
+
+def _get_specialized_class(
+    public_class: typing.Type[RingBufferInternal],
+    variant: str,
+    instrumented: bool,
+    aggregated: bool = False,
+) -> typing.Type[RingBufferInternal]:
+    key = (public_class, variant, instrumented, aggregated)
+    specialized = _specialized_classes.get(key)
+    if specialized is None:
+        namespace: typing.Dict[str, typing.Any] = {
+            "_is_specialized": True,
+            "__module__": public_class.__module__,
+            "__qualname__": public_class.__qualname__,
+        }
+        for name, implementation in _SPECIALIZED_METHODS[variant].items():
+            # methods overridden by the public class are left alone
+            if getattr(public_class, name) is getattr(RingBufferInternal, name):
+                namespace[name] = getattr(RingBufferInternal, implementation)
+        if aggregated:
+            for name, implementation in _AGGREGATED_METHODS.items():
+                if getattr(public_class, name) is getattr(RingBufferInternal, name):
+                    namespace[name] = getattr(RingBufferInternal, implementation)
+        if instrumented:
+            for name, count in _COUNTED_METHODS.items():
+                if hasattr(public_class, name):
+                    method = namespace.get(name, getattr(public_class, name))
+                    namespace[name] = count(method)
+        specialized = type(public_class.__name__, (public_class,), namespace)
+        _specialized_classes[key] = specialized
+    return specialized
+
+
+def _restore_ring_buffer(
+    public_class: typing.Type[RingBufferInternal], state: typing.Dict[str, typing.Any]
+) -> RingBufferInternal:
+    ring_buffer = public_class.__new__(public_class)
+    ring_buffer.__dict__.update(state)
+    ring_buffer._specialize()
+    return ring_buffer
 
 
 class RandomAccessRingBufferMethods(ABC):
@@ -139,14 +619,48 @@ class RingBuffer(RingBufferInternal, RandomAccessRingBufferMethods):
         )
 
     def put(self, value):
-        return super()._put(value)
+        return self._put(value)
+
+    def put_many(self, values: typing.Iterable[typing.Any]):
+        return self._put_many(list(values))
+
+    def put_with(self, translator: Translator, *args: typing.Any) -> int:
+        """Fills the next preallocated slot in place with
+        `translator(slot, sequence, *args)` and publishes it."""
+        return self._put_with(translator, args)
 
     def get(self, sequence: int):
-        return super()._get(sequence)
+        return self._get(sequence)
+
+    def get_slot(self, sequence: int) -> typing.Tuple[int, RingFactory]:
+        """Borrows the slot object itself rather than `slot.get()`, it is
+        reused once the ring wraps onto it."""
+        return self._get_slot(sequence)
 
     def get_latest(self):
         return super()._get_latest()
 
+    def get_range(self, start: int, stop: int) -> typing.Tuple[int, typing.List]:
+        """Values of sequences `start` to `stop - 1`, read under a single lock
+        acquisition so either all of them or none are returned."""
+        return self._get_range(start, stop)
+
+    def iter_from(
+        self, sequence: int
+    ) -> typing.Iterator[typing.Tuple[int, typing.Any]]:
+        """Iterates (sequence, value) pairs from `sequence` up to the cursor at
+        the time of the call, the span is copied before iterating."""
+        start, values = self._get_range(sequence)
+        return zip(itertools.count(start), values)
+
+    def snapshot(self) -> typing.Tuple[int, typing.List]:
+        """Every retained value and the sequence of the first one."""
+        return self._get_range()
+
+    def __iter__(self) -> typing.Iterator[typing.Tuple[int, typing.Any]]:
+        start, values = self._get_range()
+        return zip(itertools.count(start), values)
+
     def flush(self):
         return super()._flush()
 
@@ -188,17 +702,44 @@ class BlockingRingBuffer(RingBufferInternal, SequencedRingBufferMethods):
     def put(self, value):
         if (self._get_cursor_position() - self._read_cursor) == self.ring_size:
             raise ReadCursorBlock()
-        return super()._put(value)
+        return self._put(value)
+
+    def put_many(self, values: typing.Iterable[typing.Any]):
+        values = list(values)
+        free_slots = self.ring_size - (self._get_cursor_position() - self._read_cursor)
+        if len(values) > free_slots:
+            raise ReadCursorBlock()
+        return self._put_many(values)
+
+    def put_with(self, translator: Translator, *args: typing.Any) -> int:
+        if (self._get_cursor_position() - self._read_cursor) == self.ring_size:
+            raise ReadCursorBlock()
+        return self._put_with(translator, args)
 
     def next(self):
-        res = super()._get(self._read_cursor)
+        res = self._get(self._read_cursor)
+        self._read_cursor += 1
+        return res
+
+    def next_slot(self) -> typing.Tuple[int, RingFactory]:
+        res = self._get_slot(self._read_cursor)
         self._read_cursor += 1
         return res
 
+    def next_batch(self, max_items: int = 16):
+        res = self._get_many(self._read_cursor, max_items)
+        self._read_cursor += len(res[1])
+        return res
+
     def flush(self):
         super()._flush()
         self._read_cursor = 0
 
+    def stats(self) -> typing.Dict[str, typing.Any]:
+        stats = super().stats()
+        stats["lag"] = stats["cursor"] - self._read_cursor
+        return stats
+
 
 class BlockingLockedRingBuffer(BlockingRingBuffer, SequencedRingBufferMethods):
     def __init__(
@@ -218,46 +759,135 @@ class BlockingLockedRingBuffer(BlockingRingBuffer, SequencedRingBufferMethods):
 
 
 class WaitingBlockingRingBuffer(RingBufferInternal, SequencedRingBufferMethods):
-    _read_cursor = 0
-    _read_cursor_barrier = Event()
-    _write_cursor_barrier = Event()
-
     def __init__(
         self,
         size: int = 16,
         factory: typing.Type[RingFactory] = SimpleFactory,
         cursor_position_value: typing.Union[Value, int] = 0,
+        wait_strategy: typing.Optional[WaitStrategy] = None,
     ):
         super().__init__(
             size=size, factory=factory, cursor_position_value=cursor_position_value
         )
+        self._read_cursor = 0
+        self._read_cursor_barrier = Event()
+        self._write_cursor_barrier = Event()
+        self._wait_strategy = wait_strategy or BlockingWaitStrategy()
+
+    def _has_free_slot(self) -> bool:
+        return (self._get_cursor_position() - self._read_cursor) < self.ring_size
+
+    def _has_free_slots_condition(self, count: int) -> typing.Callable[[], bool]:
+        ring_size = self.ring_size
+
+        def has_free_slots() -> bool:
+            return self._get_cursor_position() + count - self._read_cursor <= ring_size
+
+        return has_free_slots
+
+    def _has_next(self) -> bool:
+        return self._read_cursor < self._get_cursor_position()
+
+    def _wait_for_free_slots(
+        self, condition: typing.Callable[[], bool], timeout: typing.Optional[float]
+    ) -> None:
+        if not timed_wait(
+            self._wait_strategy,
+            condition,
+            self._write_cursor_barrier,
+            timeout,
+            self._metrics,
+            producer=True,
+        ):
+            raise ReadCursorBlock()
 
-    def put(self, value, timeout: float = None):
-        if not self._read_cursor_barrier.is_set():
-            self._read_cursor_barrier.set()
-        if (self._get_cursor_position() - self._read_cursor) == self.ring_size:
-            self._write_cursor_barrier.clear()
-            success = self._write_cursor_barrier.wait(timeout=timeout)
-            if not success:
-                raise ReadCursorBlock()
-        return super()._put(value)
+    def _wait_for_next(self, timeout: typing.Optional[float]) -> None:
+        if not timed_wait(
+            self._wait_strategy,
+            self._has_next,
+            self._read_cursor_barrier,
+            timeout,
+            self._metrics,
+            producer=False,
+        ):
+            raise SequenceNotFound()
 
-    def next(self, timeout: float = None):
-        try:
-            res = super()._get(self._read_cursor)
-        except SequenceNotFound:
-            self._read_cursor_barrier.clear()
-            success = self._read_cursor_barrier.wait(timeout=timeout)
-            if not success:
-                raise SequenceNotFound()
-
-        res = super()._get(self._read_cursor)
+    def put(self, value, timeout: float = None):
+        if not self._has_free_slot():
+            self._wait_for_free_slots(self._has_free_slot, timeout)
+        result = self._put(value)
+        self._wait_strategy.signal(self._read_cursor_barrier)
+        return result
+
+    def put_many(self, values: typing.Iterable[typing.Any], timeout: float = None):
+        """Waits until the whole batch fits, nothing is written on timeout."""
+        values = list(values)
+        if len(values) > self.ring_size:
+            raise ValueError("cannot put more values than the ring size at once.")
+
+        has_free_slots = self._has_free_slots_condition(len(values))
+        if not has_free_slots():
+            self._wait_for_free_slots(has_free_slots, timeout)
+        result = self._put_many(values)
+        self._wait_strategy.signal(self._read_cursor_barrier)
+        return result
+
+    def put_with(
+        self,
+        translator: Translator,
+        *args: typing.Any,
+        timeout: typing.Optional[float] = None,
+    ) -> int:
+        if not self._has_free_slot():
+            self._wait_for_free_slots(self._has_free_slot, timeout)
+        result = self._put_with(translator, args)
+        self._wait_strategy.signal(self._read_cursor_barrier)
+        return result
+
+    def _read_next(self) -> typing.Tuple[int, typing.Any]:
+        res = self._get(self._read_cursor)
+        self._read_cursor += 1
         # release the write barrier
-        if not self._write_cursor_barrier.is_set():
-            self._write_cursor_barrier.set()
+        self._wait_strategy.signal(self._write_cursor_barrier)
+        return res
+
+    def next_slot(
+        self, timeout: typing.Optional[float] = None
+    ) -> typing.Tuple[int, RingFactory]:
+        if not self._has_next():
+            self._wait_for_next(timeout)
+
+        res = self._get_slot(self._read_cursor)
         self._read_cursor += 1
+        self._wait_strategy.signal(self._write_cursor_barrier)
         return res
 
+    def _read_next_batch(
+        self, max_items: int
+    ) -> typing.Tuple[int, typing.List[typing.Any]]:
+        res = self._get_many(self._read_cursor, max_items)
+        self._read_cursor += len(res[1])
+        # release the write barrier
+        self._wait_strategy.signal(self._write_cursor_barrier)
+        return res
+
+    def next(self, timeout: float = None):
+        if not self._has_next():
+            self._wait_for_next(timeout)
+
+        return self._read_next()
+
+    def next_batch(self, max_items: int = 16, timeout: float = None):
+        if not self._has_next():
+            self._wait_for_next(timeout)
+
+        return self._read_next_batch(max_items)
+
     def flush(self):
         super()._flush()
         self._read_cursor = 0
+
+    def stats(self) -> typing.Dict[str, typing.Any]:
+        stats = super().stats()
+        stats["lag"] = stats["cursor"] - self._read_cursor
+        return stats
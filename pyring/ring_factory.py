@@ -3,6 +3,9 @@ import typing
 
 
 class RingFactory(ABC):
+    # allocate each slot on its first write rather than with the ring
+    lazy: bool = False
+
     @abstractmethod
     def set(self, value):
         ...
@@ -11,6 +14,16 @@ class RingFactory(ABC):
     def get(self):
         ...
 
+    @classmethod
+    def create_many(cls, count: int) -> typing.List["RingFactory"]:
+        """Allocates all slots of an eager ring, override to allocate them in
+        one bulk call."""
+        return [cls() for _ in range(count)]
+
+    def reset(self) -> None:
+        """Called on every allocated slot by `flush()`, which reuses slots
+        rather than allocating new ones."""
+
 
 class SimpleFactory(RingFactory):
     def __init__(self):
@@ -21,3 +34,7 @@ class SimpleFactory(RingFactory):
 
     def set(self, value):
         self.value = value
+
+    def reset(self):
+        # drops the reference so flushed values can be collected
+        self.value = None
@@ -0,0 +1,97 @@
+import typing
+from .ring_buffer import LockLike
+from .fixed_slot import FixedSlotRingBuffer, buffer_size, init_header
+from .codec import Codec
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # pragma: no cover, python < 3.8
+    shared_memory = None  # type: ignore
+
+
+def _require_shared_memory() -> None:
+    if shared_memory is None:
+        raise ImportError("SharedMemoryRingBuffer requires python 3.8 or newer.")
+
+
+def _open_segment(name: str) -> "shared_memory.SharedMemory":
+    _require_shared_memory()
+    # python >= 3.13 lets attaching processes opt out of the resource tracker,
+    # older versions may unlink the segment when an unrelated process exits
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # type: ignore
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+class SharedMemoryRingBuffer(FixedSlotRingBuffer):
+    """Ring buffer with its cursor and fixed-size byte slots in one shared
+    memory segment.
+
+    Values are bytes-like records of at most `slot_size` bytes, reads return
+    a `memoryview` into the segment. Pass a `codec` to store other values.
+
+    Other processes attach by segment name with `attach(name)`, pickling the
+    ring (e.g. as a `multiprocessing.Process` argument) attaches the same way.
+    """
+
+    def __init__(
+        self,
+        size: int = 16,
+        slot_size: int = 64,
+        name: typing.Optional[str] = None,
+        lock: typing.Optional[LockLike] = None,
+        codec: typing.Optional[Codec] = None,
+    ):
+        _require_shared_memory()
+
+        if not size % 2 == 0:
+            raise AttributeError("size must be a factor of 2 for efficient arithmetic.")
+
+        self._shm = shared_memory.SharedMemory(
+            name=name, create=True, size=buffer_size(size, slot_size)
+        )
+        init_header(self._shm.buf, size, slot_size)
+
+        self._lock = lock
+        self._codec = codec
+        self._owner = True
+        self._map_buffer(self._shm.buf)
+
+    @classmethod
+    def attach(
+        cls,
+        name: str,
+        lock: typing.Optional[LockLike] = None,
+        codec: typing.Optional[Codec] = None,
+    ) -> "SharedMemoryRingBuffer":
+        ring_buffer = cls.__new__(cls)
+        ring_buffer._shm = _open_segment(name)
+        ring_buffer._lock = lock
+        ring_buffer._codec = codec
+        ring_buffer._owner = False
+        ring_buffer._map_buffer(ring_buffer._shm.buf)
+        return ring_buffer
+
+    def __reduce__(self):
+        return (SharedMemoryRingBuffer.attach, (self.name, self._lock, self._codec))
+
+    def __enter__(self) -> "SharedMemoryRingBuffer":
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def close(self) -> None:
+        # views handed out by get() must be released before closing
+        self._release_buffer()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        self._shm.unlink()
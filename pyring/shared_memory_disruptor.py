@@ -0,0 +1,420 @@
+import os
+import select
+import tempfile
+import time
+import typing
+from .fixed_slot import buffer_size, init_header, CURSOR_FIELD
+from .shared_memory import (
+    SharedMemoryRingBuffer,
+    shared_memory,
+    _open_segment,
+    _require_shared_memory,
+)
+from .exceptions import SequenceNotFound, SequenceOverwritten, ReadCursorBlock
+from .codec import Codec, Encoded
+
+# header fields after the fixed slot ones
+MAX_SUBSCRIBERS_FIELD = 3
+PRODUCER_WAITING_FIELD = 4
+
+# one cache line of int64 fields per subscriber, after the slots
+SUBSCRIBER_FIELDS = 8
+READ_CURSOR_FIELD = 0
+STATE_FIELD = 1
+WAITING_FIELD = 2
+
+FREE = 0
+REGISTERED = 1
+
+SPIN_TRIES = 100
+# the waiting flag and the cursor are plain stores, without a fence a wakeup
+# can be missed, so blocked waiters re-check at least this often
+MAX_BLOCK = 0.05
+
+
+class PipeWakeup:
+    """Wakes a waiter in another process through a named pipe.
+
+    The waiter blocks in `select` on the read end, `signal` writes a byte.
+    Only the path is pickled, each process opens the pipe itself.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._read_fd: typing.Optional[int] = None
+        self._keepalive_fd: typing.Optional[int] = None
+        self._write_fd: typing.Optional[int] = None
+
+    def __reduce__(self):
+        return (PipeWakeup, (self.path,))
+
+    def wait(self, timeout: float) -> None:
+        if self._read_fd is None:
+            self._read_fd = os.open(self.path, os.O_RDONLY | os.O_NONBLOCK)
+            # keep a writer open so the pipe never reads as closed
+            self._keepalive_fd = os.open(self.path, os.O_WRONLY | os.O_NONBLOCK)
+        select.select([self._read_fd], [], [], timeout)
+        try:
+            while os.read(self._read_fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def signal(self) -> None:
+        if self._write_fd is None:
+            try:
+                self._write_fd = os.open(self.path, os.O_WRONLY | os.O_NONBLOCK)
+            except OSError:
+                # nobody has opened the pipe to wait on it yet
+                return
+        try:
+            os.write(self._write_fd, b"\0")
+        except BlockingIOError:
+            # the pipe is already full of wakeups
+            pass
+        except BrokenPipeError:
+            os.close(self._write_fd)
+            self._write_fd = None
+
+    def close(self) -> None:
+        for fd in (self._read_fd, self._keepalive_fd, self._write_fd):
+            if fd is not None:
+                os.close(fd)
+        self._read_fd = self._keepalive_fd = self._write_fd = None
+
+
+def _wait(
+    condition: typing.Callable[[], bool],
+    fields: memoryview,
+    waiting_field: int,
+    wakeup: PipeWakeup,
+    timeout: typing.Optional[float],
+) -> bool:
+    for _ in range(SPIN_TRIES):
+        if condition():
+            return True
+
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while not condition():
+        block = MAX_BLOCK
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            block = min(block, remaining)
+        fields[waiting_field] = 1
+        try:
+            # re-check after flagging so a concurrent signal isn't missed
+            if condition():
+                return True
+            wakeup.wait(block)
+        finally:
+            fields[waiting_field] = 0
+    return True
+
+
+class SharedMemoryDisruptor(SharedMemoryRingBuffer):
+    """Single producer disruptor whose cursor, slots and subscriber read
+    cursors all live in one shared memory segment, so subscribers in other
+    processes gate the producer and are woken by it.
+
+    There are no locks. The producer writes a slot before moving the cursor
+    and subscribers publish their read cursor once they are done with a
+    slot, so a subscriber's slot can't be overwritten while it reads it.
+    Blocked waiters sleep on a named pipe per waiter, which the other side
+    only writes to when the waiter has flagged itself as waiting.
+
+    Subscribe up to `max_subscribers` times in the creating process and pass
+    the subscribers to other processes, e.g. as `multiprocessing.Process`
+    arguments. The producer may run in any process that attaches by name.
+    """
+
+    def __init__(
+        self,
+        size: int = 16,
+        slot_size: int = 64,
+        max_subscribers: int = 8,
+        name: typing.Optional[str] = None,
+        codec: typing.Optional[Codec] = None,
+    ):
+        _require_shared_memory()
+        if not hasattr(os, "mkfifo"):
+            raise ImportError("SharedMemoryDisruptor requires named pipes.")
+
+        if not size % 2 == 0:
+            raise AttributeError("size must be a factor of 2 for efficient arithmetic.")
+
+        self._shm = shared_memory.SharedMemory(
+            name=name,
+            create=True,
+            size=buffer_size(size, slot_size) + 8 * SUBSCRIBER_FIELDS * max_subscribers,
+        )
+        init_header(self._shm.buf, size, slot_size)
+        header = self._shm.buf[: 8 * (MAX_SUBSCRIBERS_FIELD + 1)].cast("q")
+        header[MAX_SUBSCRIBERS_FIELD] = max_subscribers
+        header.release()
+
+        self._lock = None
+        self._codec = codec
+        self._owner = True
+        self._map_buffer(self._shm.buf)
+        os.mkfifo(self._producer_wakeup.path)
+
+    @classmethod
+    def attach(  # type: ignore
+        cls, name: str, codec: typing.Optional[Codec] = None
+    ) -> "SharedMemoryDisruptor":
+        disruptor = cls.__new__(cls)
+        disruptor._shm = _open_segment(name)
+        disruptor._lock = None
+        disruptor._codec = codec
+        disruptor._owner = False
+        disruptor._map_buffer(disruptor._shm.buf)
+        return disruptor
+
+    def __reduce__(self):
+        return (SharedMemoryDisruptor.attach, (self.name, self._codec))
+
+    def _map_buffer(self, buf: typing.Any) -> None:
+        super()._map_buffer(buf)
+        self.max_subscribers: int = self._header[MAX_SUBSCRIBERS_FIELD]
+        table_start = buffer_size(self.ring_size, self.slot_size)
+        table_end = table_start + 8 * SUBSCRIBER_FIELDS * self.max_subscribers
+        buf = memoryview(buf)
+        self._table = buf[table_start:table_end].cast("q")
+        buf.release()
+        self._cached_gating_sequence = 0
+        self._producer_wakeup = PipeWakeup(self._wakeup_path("producer"))
+        self._subscriber_wakeups = [
+            PipeWakeup(self._wakeup_path(str(index)))
+            for index in range(self.max_subscribers)
+        ]
+
+    def _release_buffer(self) -> None:
+        self._table.release()
+        super()._release_buffer()
+
+    def _wakeup_path(self, waiter: str) -> str:
+        return os.path.join(
+            tempfile.gettempdir(), f"{self.name.lstrip('/')}-{waiter}.wakeup"
+        )
+
+    def subscribe(self) -> "SharedMemorySubscriber":
+        """Registers a subscriber that reads every sequence published from
+        now on. Call it in the creating process only."""
+        if not self._owner:
+            raise RuntimeError("subscribe in the process that created the disruptor.")
+        table = self._table
+        for index in range(self.max_subscribers):
+            entry = index * SUBSCRIBER_FIELDS
+            if table[entry + STATE_FIELD] == FREE:
+                break
+        else:
+            raise ValueError(f"all {self.max_subscribers} subscribers are in use.")
+
+        path = self._subscriber_wakeups[index].path
+        if not os.path.exists(path):
+            os.mkfifo(path)
+        # starting at the cursor can't be overwritten before the producer
+        # next refreshes its cached gating sequence
+        table[entry + READ_CURSOR_FIELD] = self._header[CURSOR_FIELD]
+        table[entry + WAITING_FIELD] = 0
+        table[entry + STATE_FIELD] = REGISTERED
+        return SharedMemorySubscriber(self, index)
+
+    def _get_minimum_gating_sequence(self, cursor_position: int) -> int:
+        table = self._table
+        gating_sequence = cursor_position
+        for entry in range(0, len(table), SUBSCRIBER_FIELDS):
+            if table[entry + STATE_FIELD] == REGISTERED:
+                read_cursor = table[entry + READ_CURSOR_FIELD]
+                if read_cursor < gating_sequence:
+                    gating_sequence = read_cursor
+        return gating_sequence
+
+    def _wait_for_capacity(
+        self, cursor_position: int, claim_end: int, timeout: typing.Optional[float]
+    ) -> None:
+        ring_size = self.ring_size
+
+        def has_capacity() -> bool:
+            gating_sequence = self._get_minimum_gating_sequence(cursor_position)
+            self._cached_gating_sequence = gating_sequence
+            return claim_end - gating_sequence <= ring_size
+
+        if not _wait(
+            has_capacity,
+            self._header,
+            PRODUCER_WAITING_FIELD,
+            self._producer_wakeup,
+            timeout,
+        ):
+            raise ReadCursorBlock()
+
+    def _signal_subscribers(self) -> None:
+        table = self._table
+        for index, wakeup in enumerate(self._subscriber_wakeups):
+            if table[index * SUBSCRIBER_FIELDS + WAITING_FIELD]:
+                wakeup.signal()
+
+    def put(self, value: typing.Any, timeout: typing.Optional[float] = None) -> int:
+        cursor_position = self._header[CURSOR_FIELD]
+        if cursor_position - self._cached_gating_sequence >= self.ring_size:
+            self._wait_for_capacity(cursor_position, cursor_position + 1, timeout)
+
+        self._write_slot(cursor_position, value)
+        # publish only once the slot is written
+        self._header[CURSOR_FIELD] = cursor_position + 1
+        self._signal_subscribers()
+        return cursor_position
+
+    def put_many(
+        self,
+        values: typing.Iterable[typing.Any],
+        timeout: typing.Optional[float] = None,
+    ) -> int:
+        """Waits until the whole batch fits, nothing is written on timeout."""
+        values = list(values)
+        if len(values) > self.ring_size:
+            raise ValueError("cannot put more values than the ring size at once.")
+
+        first_sequence = self._header[CURSOR_FIELD]
+        claim_end = first_sequence + len(values)
+        if claim_end - self._cached_gating_sequence > self.ring_size:
+            self._wait_for_capacity(first_sequence, claim_end, timeout)
+
+        for offset, value in enumerate(values):
+            self._write_slot(first_sequence + offset, value)
+        self._header[CURSOR_FIELD] = claim_end
+        self._signal_subscribers()
+        return first_sequence
+
+    def get(self, sequence: int) -> typing.Tuple[int, typing.Any]:
+        """Copies out any retained sequence without gating the producer, with
+        a codec the copy is returned as an `Encoded`.
+
+        The copy is checked against the cursor afterwards, seqlock style, and
+        raises `SequenceOverwritten` if the producer may have reused the slot
+        while it was being read.
+        """
+        cursor_position = self._header[CURSOR_FIELD]
+        if sequence >= cursor_position:
+            raise SequenceNotFound()
+
+        ring_index = sequence % self.ring_size
+        offset = ring_index * self.slot_size
+        value = bytes(self._slots[offset : offset + self._lengths[ring_index]])
+
+        # the producer writes the slot of `cursor - ring_size` before moving
+        # the cursor past it, so that sequence is no longer safe either
+        if sequence <= self._header[CURSOR_FIELD] - self.ring_size:
+            raise SequenceOverwritten()
+        if self._codec is not None:
+            return (sequence, Encoded(memoryview(value), self._codec))
+        return (sequence, value)
+
+    def close(self) -> None:
+        self._producer_wakeup.close()
+        for wakeup in self._subscriber_wakeups:
+            wakeup.close()
+        super().close()
+
+    def unlink(self) -> None:
+        for wakeup in [self._producer_wakeup] + self._subscriber_wakeups:
+            if os.path.exists(wakeup.path):
+                os.unlink(wakeup.path)
+        super().unlink()
+
+
+def _attach_subscriber(
+    name: str, index: int, codec: typing.Optional[Codec]
+) -> "SharedMemorySubscriber":
+    disruptor = SharedMemoryDisruptor.attach(name, codec)
+    return SharedMemorySubscriber(disruptor, index, True)
+
+
+class SharedMemorySubscriber:
+    """Subscriber of a `SharedMemoryDisruptor`, usable from any process.
+
+    `next` and `next_batch` return memoryviews into the segment, or
+    `Encoded` views with a codec. The
+    subscriber keeps gating the producer on those slots until its next read,
+    so views are valid until then. Pickling attaches to the segment again,
+    `close()` detaches.
+    """
+
+    def __init__(
+        self, disruptor: SharedMemoryDisruptor, index: int, attached: bool = False
+    ):
+        self._disruptor = disruptor
+        self._index = index
+        self._attached = attached
+        self._table = disruptor._table
+        self._entry = index * SUBSCRIBER_FIELDS
+        self._wakeup = disruptor._subscriber_wakeups[index]
+        self._read_cursor = self._table[self._entry + READ_CURSOR_FIELD]
+
+    def __reduce__(self):
+        disruptor = self._disruptor
+        return (_attach_subscriber, (disruptor.name, self._index, disruptor._codec))
+
+    def _has_next(self) -> bool:
+        return self._read_cursor < self._disruptor._header[CURSOR_FIELD]
+
+    def _wait_for_next(self, timeout: typing.Optional[float]) -> None:
+        # done with the slots handed out by the previous read
+        self._release()
+        if not self._has_next():
+            if not _wait(
+                self._has_next,
+                self._table,
+                self._entry + WAITING_FIELD,
+                self._wakeup,
+                timeout,
+            ):
+                raise SequenceNotFound()
+
+    def _release(self) -> None:
+        read_cursor_field = self._entry + READ_CURSOR_FIELD
+        if self._table[read_cursor_field] != self._read_cursor:
+            self._table[read_cursor_field] = self._read_cursor
+            disruptor = self._disruptor
+            if disruptor._header[PRODUCER_WAITING_FIELD]:
+                disruptor._producer_wakeup.signal()
+
+    def next(
+        self, timeout: typing.Optional[float] = None
+    ) -> typing.Tuple[int, typing.Any]:
+        self._wait_for_next(timeout)
+        sequence = self._read_cursor
+        self._read_cursor = sequence + 1
+        return (sequence, self._disruptor._read_slot(sequence))
+
+    def next_batch(
+        self, max_items: int = 16, timeout: typing.Optional[float] = None
+    ) -> typing.Tuple[int, typing.List[typing.Any]]:
+        self._wait_for_next(timeout)
+        disruptor = self._disruptor
+        first_sequence = self._read_cursor
+        stop = min(disruptor._header[CURSOR_FIELD], first_sequence + max_items)
+        self._read_cursor = stop
+        return (
+            first_sequence,
+            [
+                disruptor._read_slot(sequence)
+                for sequence in range(first_sequence, stop)
+            ],
+        )
+
+    def unregister(self) -> None:
+        """Stops gating the producer, the slot can then be reused by a new
+        subscriber."""
+        self._table[self._entry + STATE_FIELD] = FREE
+        disruptor = self._disruptor
+        if disruptor._header[PRODUCER_WAITING_FIELD]:
+            disruptor._producer_wakeup.signal()
+
+    def close(self) -> None:
+        self._wakeup.close()
+        if self._attached:
+            self._disruptor.close()
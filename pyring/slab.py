@@ -0,0 +1,70 @@
+import ctypes
+import multiprocessing as mp
+import typing
+from .ring_factory import RingFactory
+
+
+class SlabFactory(RingFactory):
+    """Slots that index into one `multiprocessing.RawArray` slab shared by
+    the whole ring, instead of a shared object and lock per slot.
+
+    Subclass it and set `ctype` to a ctypes type, an array typecode such as
+    "d", or a `ctypes.Structure`. Structure slots are set from a sequence of
+    field values (or an instance) and read back as a tuple. With
+    `lock_stripes = n` slot `i` is guarded by the `i % n`th of `n` shared
+    locks, otherwise only the ring's own lock orders access.
+
+    Slots are only created through `create_many`, so the ring and every
+    process it is passed to share a single slab.
+    """
+
+    ctype: typing.Any = ctypes.c_double
+    lock_stripes: int = 0
+
+    def __init__(
+        self,
+        slab: typing.Any,
+        index: int,
+        lock: typing.Any = None,
+        fields: typing.Optional[typing.Tuple[str, ...]] = None,
+    ):
+        self._slab = slab
+        self._index = index
+        self._lock = lock
+        self._fields = fields
+
+    @classmethod
+    def create_many(cls, count: int) -> typing.List[RingFactory]:
+        slab = mp.RawArray(cls.ctype, count)
+        locks = [mp.Lock() for _ in range(cls.lock_stripes)]
+        fields = None
+        if isinstance(cls.ctype, type) and issubclass(cls.ctype, ctypes.Structure):
+            fields = tuple(field[0] for field in cls.ctype._fields_)
+        return [
+            cls(slab, index, locks[index % len(locks)] if locks else None, fields)
+            for index in range(count)
+        ]
+
+    def _get(self) -> typing.Any:
+        value = self._slab[self._index]
+        if self._fields is None:
+            return value
+        return tuple(getattr(value, field) for field in self._fields)
+
+    def _set(self, value: typing.Any) -> None:
+        if self._fields is not None and not isinstance(value, ctypes.Structure):
+            value = self.ctype(*value)
+        self._slab[self._index] = value
+
+    def get(self):
+        if self._lock is None:
+            return self._get()
+        with self._lock:
+            return self._get()
+
+    def set(self, value):
+        if self._lock is None:
+            self._set(value)
+            return
+        with self._lock:
+            self._set(value)
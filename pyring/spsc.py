@@ -0,0 +1,160 @@
+import typing
+from threading import Event
+from .ring_buffer import SequencedRingBufferMethods
+from .wait_strategy import WaitStrategy, BlockingWaitStrategy
+from .metrics import timed_wait
+from .exceptions import SequenceNotFound, ReadCursorBlock
+
+
+class SPSCRingBuffer(SequencedRingBufferMethods):
+    """Ring buffer for exactly one producer thread and one consumer thread,
+    with no locks and no Events on the fast path.
+
+    The producer only writes the write cursor and the consumer only writes
+    the read cursor. Each side keeps a cached copy of the other's cursor and
+    only re-reads it when the ring looks full (producer) or empty (consumer).
+    Values are stored in the slots as they are, without a factory.
+
+    A side only waits on its `wait_strategy` once the ring is really full or
+    empty, and is only signalled by the other side while it is waiting.
+    """
+
+    def __init__(
+        self,
+        size: int = 16,
+        wait_strategy: typing.Optional[WaitStrategy] = None,
+    ):
+        if not size % 2 == 0:
+            raise AttributeError("size must be a factor of 2 for efficient arithmetic.")
+
+        self.ring_size: int = size
+        self._ring: typing.List[typing.Any] = [None] * size
+        self._write_cursor = 0  # owned by the producer
+        self._read_cursor = 0  # owned by the consumer
+        self._cached_read_cursor = 0  # producer's copy of the read cursor
+        self._cached_write_cursor = 0  # consumer's copy of the write cursor
+        self._producer_waiting = False
+        self._consumer_waiting = False
+        self._read_cursor_barrier = Event()
+        self._write_cursor_barrier = Event()
+        self._wait_strategy = wait_strategy or BlockingWaitStrategy()
+
+    def _wait_for_free_slots(self, count: int, timeout: typing.Optional[float]) -> None:
+        end = self._write_cursor + count - self.ring_size
+
+        def has_free_slots() -> bool:
+            return self._read_cursor >= end
+
+        self._producer_waiting = True
+        try:
+            if not timed_wait(
+                self._wait_strategy,
+                has_free_slots,
+                self._write_cursor_barrier,
+                timeout,
+                None,
+                producer=True,
+            ):
+                raise ReadCursorBlock()
+        finally:
+            self._producer_waiting = False
+        self._cached_read_cursor = self._read_cursor
+
+    def _has_next(self) -> bool:
+        return self._read_cursor < self._write_cursor
+
+    def _wait_for_next(self, timeout: typing.Optional[float]) -> None:
+        self._consumer_waiting = True
+        try:
+            if not timed_wait(
+                self._wait_strategy,
+                self._has_next,
+                self._read_cursor_barrier,
+                timeout,
+                None,
+                producer=False,
+            ):
+                raise SequenceNotFound()
+        finally:
+            self._consumer_waiting = False
+        self._cached_write_cursor = self._write_cursor
+
+    def put(self, value: typing.Any, timeout: typing.Optional[float] = None) -> int:
+        write_cursor = self._write_cursor
+        if write_cursor - self._cached_read_cursor >= self.ring_size:
+            self._cached_read_cursor = self._read_cursor
+            if write_cursor - self._cached_read_cursor >= self.ring_size:
+                self._wait_for_free_slots(1, timeout)
+
+        self._ring[write_cursor % self.ring_size] = value
+        # publish only once the slot is written
+        self._write_cursor = write_cursor + 1
+        if self._consumer_waiting:
+            self._wait_strategy.signal(self._read_cursor_barrier)
+        return write_cursor
+
+    def put_many(
+        self,
+        values: typing.Iterable[typing.Any],
+        timeout: typing.Optional[float] = None,
+    ) -> int:
+        """Waits until the whole batch fits, nothing is written on timeout."""
+        values = list(values)
+        ring_size = self.ring_size
+        if len(values) > ring_size:
+            raise ValueError("cannot put more values than the ring size at once.")
+
+        write_cursor = self._write_cursor
+        claim_end = write_cursor + len(values)
+        if claim_end - self._cached_read_cursor > ring_size:
+            self._cached_read_cursor = self._read_cursor
+            if claim_end - self._cached_read_cursor > ring_size:
+                self._wait_for_free_slots(len(values), timeout)
+
+        ring = self._ring
+        for sequence, value in enumerate(values, write_cursor):
+            ring[sequence % ring_size] = value
+        self._write_cursor = claim_end
+        if self._consumer_waiting:
+            self._wait_strategy.signal(self._read_cursor_barrier)
+        return write_cursor
+
+    def next(
+        self, timeout: typing.Optional[float] = None
+    ) -> typing.Tuple[int, typing.Any]:
+        read_cursor = self._read_cursor
+        if read_cursor >= self._cached_write_cursor:
+            self._cached_write_cursor = self._write_cursor
+            if read_cursor >= self._cached_write_cursor:
+                self._wait_for_next(timeout)
+
+        value = self._ring[read_cursor % self.ring_size]
+        self._read_cursor = read_cursor + 1
+        if self._producer_waiting:
+            self._wait_strategy.signal(self._write_cursor_barrier)
+        return (read_cursor, value)
+
+    def next_batch(
+        self, max_items: int = 16, timeout: typing.Optional[float] = None
+    ) -> typing.Tuple[int, typing.List[typing.Any]]:
+        read_cursor = self._read_cursor
+        if read_cursor >= self._cached_write_cursor:
+            self._cached_write_cursor = self._write_cursor
+            if read_cursor >= self._cached_write_cursor:
+                self._wait_for_next(timeout)
+
+        ring = self._ring
+        ring_size = self.ring_size
+        # the whole published run, not only what the cached cursor has seen
+        stop = min(self._write_cursor, read_cursor + max_items)
+        values = [ring[sequence % ring_size] for sequence in range(read_cursor, stop)]
+        self._read_cursor = stop
+        if self._producer_waiting:
+            self._wait_strategy.signal(self._write_cursor_barrier)
+        return (read_cursor, values)
+
+    def flush(self) -> None:
+        """Empties the ring, neither side may be using it meanwhile."""
+        self._ring = [None] * self.ring_size
+        self._write_cursor = self._read_cursor = 0
+        self._cached_read_cursor = self._cached_write_cursor = 0
@@ -0,0 +1,222 @@
+from abc import ABC, abstractmethod
+import asyncio
+import sys
+import time
+import typing
+from threading import Event
+
+Condition = typing.Callable[[], bool]
+
+# False on free-threaded builds running without the GIL
+GIL_ENABLED: bool = getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def _get_deadline(timeout: typing.Optional[float]) -> typing.Optional[float]:
+    return None if timeout is None else time.monotonic() + timeout
+
+
+class WaitStrategy(ABC):
+    """How a producer or consumer waits for the other side of a ring.
+
+    `wait` returns once `condition()` holds (True) or `timeout` seconds have
+    passed (False). `signal` is called on the barrier after the other side
+    has made progress, strategies that don't block on the barrier ignore it.
+    """
+
+    @abstractmethod
+    def wait(
+        self,
+        condition: Condition,
+        barrier: Event,
+        timeout: typing.Optional[float] = None,
+    ) -> bool:
+        ...
+
+    def signal(self, barrier: Event) -> None:
+        pass
+
+
+class BlockingWaitStrategy(WaitStrategy):
+    """Sleeps on the barrier Event, cheapest on CPU but slowest to wake.
+
+    A side is only signalled once it is seen to be waiting. Without the GIL
+    that can be missed, so each sleep is capped at `recheck_interval` seconds
+    before the condition is checked again.
+    """
+
+    recheck_interval: typing.Optional[float] = None if GIL_ENABLED else 0.001
+
+    def wait(
+        self,
+        condition: Condition,
+        barrier: Event,
+        timeout: typing.Optional[float] = None,
+    ) -> bool:
+        deadline = _get_deadline(timeout)
+        recheck_interval = self.recheck_interval
+        while not condition():
+            barrier.clear()
+            # re-check after clearing so a concurrent signal isn't missed
+            if condition():
+                return True
+            if deadline is None:
+                barrier.wait(timeout=recheck_interval)
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if recheck_interval is not None:
+                remaining = min(remaining, recheck_interval)
+            barrier.wait(timeout=remaining)
+        return True
+
+    def signal(self, barrier: Event) -> None:
+        if not barrier.is_set():
+            barrier.set()
+
+
+class BusySpinWaitStrategy(WaitStrategy):
+    """Spins on the condition, lowest latency at the cost of a whole core."""
+
+    def wait(
+        self,
+        condition: Condition,
+        barrier: Event,
+        timeout: typing.Optional[float] = None,
+    ) -> bool:
+        deadline = _get_deadline(timeout)
+        while not condition():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+        return True
+
+
+class YieldingWaitStrategy(WaitStrategy):
+    """Spins for `spin_tries` checks and then yields the thread between checks."""
+
+    def __init__(self, spin_tries: int = 100):
+        self.spin_tries = spin_tries
+
+    def wait(
+        self,
+        condition: Condition,
+        barrier: Event,
+        timeout: typing.Optional[float] = None,
+    ) -> bool:
+        deadline = _get_deadline(timeout)
+        spins_left = self.spin_tries
+        while not condition():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            if spins_left > 0:
+                spins_left -= 1
+            else:
+                time.sleep(0)
+        return True
+
+
+class SleepingWaitStrategy(WaitStrategy):
+    """Spins for `spin_tries` checks and then sleeps, doubling the sleep from
+    `min_sleep` up to `max_sleep` seconds between checks."""
+
+    def __init__(
+        self, spin_tries: int = 100, min_sleep: float = 1e-6, max_sleep: float = 1e-3
+    ):
+        self.spin_tries = spin_tries
+        self.min_sleep = min_sleep
+        self.max_sleep = max_sleep
+
+    def wait(
+        self,
+        condition: Condition,
+        barrier: Event,
+        timeout: typing.Optional[float] = None,
+    ) -> bool:
+        deadline = _get_deadline(timeout)
+        spins_left = self.spin_tries
+        sleep = self.min_sleep
+        while not condition():
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+            else:
+                remaining = sleep
+            if spins_left > 0:
+                spins_left -= 1
+                continue
+            time.sleep(min(sleep, remaining))
+            sleep = min(sleep * 2, self.max_sleep)
+        return True
+
+
+Waiter = typing.Tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]
+
+
+def _resolve_waiter(waiter: "asyncio.Future[None]") -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class AsyncWaitStrategy(BlockingWaitStrategy):
+    """Waits on asyncio futures with `wait_async`, so waiting doesn't block
+    the event loop.
+
+    `signal` is safe to call from any thread, waiters on another thread's loop
+    are woken with `call_soon_threadsafe`. Synchronous `wait` falls back to
+    blocking on the barrier Event.
+    """
+
+    def __init__(self) -> None:
+        # every coroutine waiting on a barrier, signal wakes all of them
+        self._waiters: typing.Dict[Event, typing.List[Waiter]] = {}
+
+    async def wait_async(
+        self,
+        condition: Condition,
+        barrier: Event,
+        timeout: typing.Optional[float] = None,
+    ) -> bool:
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while not condition():
+            entry = (loop, loop.create_future())
+            waiter = entry[1]
+            self._waiters.setdefault(barrier, []).append(entry)
+            try:
+                # re-check after registering so a concurrent signal isn't missed
+                if condition():
+                    return True
+                if deadline is None:
+                    await asyncio.wait((waiter,), timeout=self.recheck_interval)
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return False
+                if self.recheck_interval is not None:
+                    remaining = min(remaining, self.recheck_interval)
+                await asyncio.wait((waiter,), timeout=remaining)
+            finally:
+                waiters = self._waiters.get(barrier)
+                if waiters is not None:
+                    waiters.remove(entry)
+                    if not waiters:
+                        del self._waiters[barrier]
+        return True
+
+    def signal(self, barrier: Event) -> None:
+        super().signal(barrier)
+        waiters = self._waiters.get(barrier)
+        if not waiters:
+            return
+        try:
+            running_loop: typing.Optional[
+                asyncio.AbstractEventLoop
+            ] = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        for loop, waiter in tuple(waiters):
+            if running_loop is loop:
+                _resolve_waiter(waiter)
+            else:
+                loop.call_soon_threadsafe(_resolve_waiter, waiter)
@@ -0,0 +1,281 @@
+import multiprocessing as mp
+import threading
+import typing
+from threading import Event, Lock
+from .disruptor import (
+    SingleProducerDisruptor,
+    MultiProducerDisruptor,
+    DisruptorSubscriber,
+)
+from .ring_factory import RingFactory
+from .wait_strategy import WaitStrategy, BlockingWaitStrategy
+from .metrics import timed_wait
+from .processor import ExceptionHandler, print_exception
+
+# handles one event, called as handler(value, sequence)
+WorkHandler = typing.Callable[[typing.Any, int], None]
+
+# claims array entry of a worker without a claim in flight
+NO_CLAIM = -1
+
+
+class _SharedCursorSubscriber(DisruptorSubscriber):
+    """Subscriber whose read cursor lives in a shared array, so the producer
+    gates on a worker process."""
+
+    def __init__(
+        self,
+        ring_buffer: SingleProducerDisruptor,
+        read_cursor: int = 0,
+        wait_strategy: typing.Optional[WaitStrategy] = None,
+        cursors: typing.Any = None,
+        index: int = 0,
+    ):
+        self._cursors = cursors
+        self._index = index
+        super().__init__(ring_buffer, read_cursor, wait_strategy)
+
+    @property
+    def _read_cursor(self) -> int:
+        return self._cursors[self._index]
+
+    @_read_cursor.setter
+    def _read_cursor(self, value: int) -> None:
+        self._cursors[self._index] = value
+
+
+class _ThreadWorker:
+    def __init__(self, pool: "WorkerPool", subscriber: DisruptorSubscriber, index: int):
+        self.pool = pool
+        self.subscriber = subscriber
+        self.index = index
+
+    def _can_run(self) -> bool:
+        return self.pool._halted or self.subscriber._has_next()
+
+    def _wait(self) -> None:
+        subscriber = self.subscriber
+        subscriber._start_waiting()
+        try:
+            timed_wait(
+                subscriber._wait_strategy,
+                self._can_run,
+                subscriber._read_cursor_barrier,
+                None,
+                subscriber._metrics,
+                producer=False,
+            )
+        finally:
+            subscriber._stop_waiting()
+
+    def run(self) -> None:
+        pool = self.pool
+        subscriber = self.subscriber
+        disruptor = pool.disruptor
+        handler = pool.handler
+        claims = pool._claims
+        index = self.index
+        while not pool._halted:
+            sequence = claims[index]
+            if sequence == NO_CLAIM:
+                sequence = pool._claim()
+                claims[index] = sequence
+                # gate the producer at the claim until it is handled
+                subscriber._read_cursor = sequence
+
+            if not subscriber._has_next():
+                self._wait()
+                continue
+
+            _, value = disruptor._get(sequence)
+            try:
+                handler(value, sequence)
+            except Exception as exception:
+                pool.exception_handler(exception, sequence, value)
+            claims[index] = NO_CLAIM
+            subscriber._advance(1)
+
+
+class _ProcessWorker:
+    """Worker loop sent to a child process. It only holds process-shared
+    state: the ring's slots and cursor, the work cursor and the claims and
+    read cursors of the pool's workers."""
+
+    def __init__(
+        self,
+        pool: "WorkerPool",
+        slots: typing.List[RingFactory],
+        cursor: typing.Any,
+        index: int,
+    ):
+        self.slots = slots
+        self.ring_size = len(slots)
+        self.cursor = cursor
+        self.work_cursor = pool._work_cursor
+        self.claims = pool._claims
+        self.cursors = pool._cursors
+        self.halted = pool._halted_event
+        self.handler = pool.handler
+        self.exception_handler = pool.exception_handler
+        self.wait_strategy = pool.disruptor._wait_strategy
+        self.index = index
+
+    def _claim(self) -> int:
+        with self.work_cursor.get_lock():
+            sequence = self.work_cursor.value
+            self.work_cursor.value = sequence + 1
+        return sequence
+
+    def run(self) -> None:
+        cursor = self.cursor
+        claims = self.claims
+        cursors = self.cursors
+        index = self.index
+        halted = self.halted
+        # polling strategies never block on the barrier
+        barrier = Event()
+        while not halted.is_set():
+            sequence = claims[index]
+            if sequence == NO_CLAIM:
+                sequence = self._claim()
+                claims[index] = sequence
+                cursors[index] = sequence
+
+            if sequence >= cursor.value:
+                self.wait_strategy.wait(
+                    lambda: halted.is_set() or sequence < cursor.value, barrier
+                )
+                continue
+
+            value = self.slots[sequence % self.ring_size].get()
+            try:
+                self.handler(value, sequence)
+            except Exception as exception:
+                self.exception_handler(exception, sequence, value)
+            claims[index] = NO_CLAIM
+            cursors[index] = sequence + 1
+
+
+class WorkerPool:
+    """Work queue semantics on a disruptor: every published sequence is
+    handled by exactly one of `workers` workers, calling
+    `handler(value, sequence)`.
+
+    Workers claim sequences one at a time from a shared work cursor. Each
+    worker is a gating subscriber parked at its claim until it has handled
+    it, so the producer gates on the slowest in-flight claim. Workers start
+    at the oldest sequence still in the ring, or after the subscribers
+    passed as `after`.
+
+    With `processes=True` the workers run in child processes. The
+    disruptor's slots and cursor must then be process-shared, a
+    `SingleProducerDisruptor` with a `multiprocessing.Value` cursor and a
+    factory of `multiprocessing.Value` slots, and its wait strategy must
+    poll, e.g. `SleepingWaitStrategy`, since the Events other subscribers
+    block on aren't shared between processes. The handler and exception
+    handler must be picklable.
+
+    Handler exceptions and `halt()` behave as for `BatchEventProcessor`, a
+    claim interrupted by `halt()` is handled once the pool is restarted.
+    """
+
+    def __init__(
+        self,
+        disruptor: SingleProducerDisruptor,
+        handler: WorkHandler,
+        workers: int = 2,
+        processes: bool = False,
+        exception_handler: ExceptionHandler = print_exception,
+        after: typing.Optional[typing.Sequence[DisruptorSubscriber]] = None,
+    ):
+        self.disruptor = disruptor
+        self.handler = handler
+        self.exception_handler = exception_handler
+        self.processes = processes
+        self._halted = False
+        self._runners: typing.List[typing.Any] = []
+
+        if processes:
+            slots, cursor = disruptor._get_shared_state()
+            if isinstance(disruptor, MultiProducerDisruptor):
+                raise ValueError("worker processes need a SingleProducerDisruptor.")
+            if isinstance(cursor, int):
+                raise ValueError(
+                    "worker processes need a multiprocessing.Value "
+                    "cursor_position_value."
+                )
+            if isinstance(disruptor._wait_strategy, BlockingWaitStrategy):
+                raise ValueError("worker processes need a polling wait strategy.")
+            if after:
+                raise ValueError("worker processes cannot depend on subscribers.")
+
+            self._claims: typing.Any = mp.Array("q", [NO_CLAIM] * workers, lock=False)
+            self._cursors = mp.Array("q", workers, lock=False)
+            self._halted_event = mp.Event()
+            self.subscribers = [
+                disruptor._subscribe(
+                    lambda **kwargs: _SharedCursorSubscriber(
+                        cursors=self._cursors, index=index, **kwargs
+                    )
+                )
+                for index in range(workers)
+            ]
+            self._work_cursor: typing.Any = mp.Value(
+                "q", self.subscribers[0]._read_cursor
+            )
+            self._workers: typing.List[typing.Any] = [
+                _ProcessWorker(self, slots, cursor, index) for index in range(workers)
+            ]
+        else:
+            self._claims = [NO_CLAIM] * workers
+            self.subscribers = [
+                disruptor.subscribe(after=after) for _ in range(workers)
+            ]
+            self._work_cursor = self.subscribers[0]._read_cursor
+            self._work_lock = Lock()
+            self._workers = [
+                _ThreadWorker(self, subscriber, index)
+                for index, subscriber in enumerate(self.subscribers)
+            ]
+
+    def _claim(self) -> int:
+        with self._work_lock:
+            sequence = self._work_cursor
+            self._work_cursor = sequence + 1
+        return sequence
+
+    @property
+    def is_running(self) -> bool:
+        return any(runner.is_alive() for runner in self._runners)
+
+    def start(self) -> None:
+        if self.is_running:
+            raise RuntimeError("worker pool is already running.")
+        self._halted = False
+        if self.processes:
+            self._halted_event.clear()
+            self._runners = [
+                mp.Process(target=worker.run, daemon=True) for worker in self._workers
+            ]
+        else:
+            self._runners = [
+                threading.Thread(target=worker.run, daemon=True)
+                for worker in self._workers
+            ]
+        for runner in self._runners:
+            runner.start()
+
+    def halt(self, timeout: typing.Optional[float] = None) -> None:
+        self._halted = True
+        if self.processes:
+            self._halted_event.set()
+        for subscriber in self.subscribers:
+            subscriber._wait_strategy.signal(subscriber._read_cursor_barrier)
+        for runner in self._runners:
+            if runner is not threading.current_thread():
+                runner.join(timeout)
+
+    def unregister(self) -> None:
+        """Stops the workers gating the producer, halt the pool first."""
+        for subscriber in self.subscribers:
+            subscriber.unregister()
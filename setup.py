@@ -12,6 +12,7 @@ setuptools.setup(
     url="https://github.com/jaycosaur/pyring",
     packages=setuptools.find_packages(),
     package_data={"pyring": ["py.typed"]},
+    extras_require={"numpy": ["numpy"]},
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
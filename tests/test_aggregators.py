@@ -0,0 +1,201 @@
+import unittest
+import random
+import statistics
+import threading
+import typing
+from pyring import (
+    RingBuffer,
+    LockedRingBuffer,
+    WaitingBlockingRingBuffer,
+    SingleProducerDisruptor,
+    MultiProducerDisruptor,
+    RingFactory,
+    Empty,
+    RollingSum,
+    RollingMean,
+    RollingVariance,
+    RollingMin,
+    RollingMax,
+)
+
+
+class SumFactory(RingFactory):
+    def __init__(self):
+        self.value = 0
+
+    def set(self, values):
+        self.value = sum(values)
+
+    def get(self):
+        return self.value
+
+
+def fill(slot, sequence, value):
+    slot.set([value, value])
+
+
+def construct_test_case(ring_buffer_type, **kwargs):
+    class TestAggregators(unittest.TestCase):
+        def create_ring_buffer(self, size=8, **extra):
+            ring_buffer = ring_buffer_type(size=size, **kwargs, **extra)
+            for name, aggregator in [
+                ("sum", RollingSum()),
+                ("mean", RollingMean()),
+                ("variance", RollingVariance(ddof=1)),
+                ("min", RollingMin()),
+                ("max", RollingMax()),
+            ]:
+                ring_buffer.add_aggregator(name, aggregator)
+            return ring_buffer
+
+        def assert_aggregates(self, ring_buffer, window):
+            self.assertEqual(ring_buffer.aggregate("sum"), sum(window))
+            self.assertAlmostEqual(
+                ring_buffer.aggregate("mean"), statistics.mean(window)
+            )
+            if len(window) > 1:
+                self.assertAlmostEqual(
+                    ring_buffer.aggregate("variance"), statistics.variance(window)
+                )
+            self.assertEqual(ring_buffer.aggregate("min"), min(window))
+            self.assertEqual(ring_buffer.aggregate("max"), max(window))
+
+        def test_empty_ring(self):
+            ring_buffer = self.create_ring_buffer()
+            self.assertEqual(ring_buffer.aggregate("sum"), 0)
+            for name in ("mean", "variance", "min", "max"):
+                with self.assertRaises(Empty):
+                    ring_buffer.aggregate(name)
+
+        def test_put_evicts_overwritten_values(self):
+            ring_buffer = self.create_ring_buffer()
+            generator = random.Random(0)
+            values = [generator.randint(-100, 100) for _ in range(100)]
+            for i, value in enumerate(values):
+                ring_buffer.put(value)
+                self.assert_aggregates(ring_buffer, values[max(0, i - 7) : i + 1])
+
+        def test_put_many(self):
+            ring_buffer = self.create_ring_buffer()
+            values = list(range(20))
+            for start in range(0, 20, 5):
+                ring_buffer.put_many(values[start : start + 5])
+            self.assert_aggregates(ring_buffer, values[-8:])
+
+        def test_put_with_aggregates_the_slot_value(self):
+            ring_buffer = self.create_ring_buffer(factory=SumFactory)
+            for i in range(10):
+                ring_buffer.put_with(fill, i)
+            self.assert_aggregates(ring_buffer, [2 * i for i in range(2, 10)])
+
+        def test_added_late_sees_retained_values(self):
+            ring_buffer = ring_buffer_type(size=4, **kwargs)
+            ring_buffer.put_many([5, 1, 3, 2])
+            ring_buffer.put(4)
+            ring_buffer.add_aggregator("max", RollingMax())
+            self.assertEqual(ring_buffer.aggregate("max"), 4)
+            ring_buffer.put(0)
+            self.assertEqual(ring_buffer.aggregate("max"), 4)
+
+        def test_remove_aggregator(self):
+            ring_buffer = self.create_ring_buffer()
+            ring_buffer.remove_aggregator("sum")
+            ring_buffer.put(1)
+            with self.assertRaises(KeyError):
+                ring_buffer.aggregate("sum")
+            self.assertEqual(ring_buffer.aggregate("max"), 1)
+
+        def test_key(self):
+            ring_buffer = ring_buffer_type(size=4, **kwargs)
+            ring_buffer.add_aggregator("max", RollingMax(key=lambda quote: quote[1]))
+            ring_buffer.put_many([("a", 2.0), ("b", 3.5), ("c", 1.0)])
+            self.assertEqual(ring_buffer.aggregate("max"), 3.5)
+
+    return TestAggregators
+
+
+ring_buffer_test = construct_test_case(RingBuffer)  # type: typing.Any
+
+
+class TestRingBufferAggregators(ring_buffer_test):
+    def test_flush_resets_aggregates(self):
+        ring_buffer = self.create_ring_buffer()
+        ring_buffer.put_many([1, 2, 3])
+        ring_buffer.flush()
+        self.assertEqual(ring_buffer.aggregate("sum"), 0)
+        with self.assertRaises(Empty):
+            ring_buffer.aggregate("max")
+
+    def test_metrics_still_count_puts(self):
+        ring_buffer = self.create_ring_buffer()
+        ring_buffer.enable_metrics()
+        ring_buffer.put_many([1, 2])
+        ring_buffer.put(3)
+        self.assertEqual(ring_buffer.stats()["puts"], 3)
+        self.assertEqual(ring_buffer.aggregate("sum"), 6)
+
+    def test_no_aggregators_keeps_fast_path(self):
+        ring_buffer = RingBuffer(size=4)
+        fast_put = type(ring_buffer)._put
+        ring_buffer.add_aggregator("sum", RollingSum())
+        self.assertIsNot(type(ring_buffer)._put, fast_put)
+        ring_buffer.remove_aggregator("sum")
+        self.assertIs(type(ring_buffer)._put, fast_put)
+
+
+locked_ring_buffer_test = construct_test_case(
+    LockedRingBuffer, lock=threading.RLock()
+)  # type: typing.Any
+
+
+class TestLockedRingBufferAggregators(locked_ring_buffer_test):
+    pass
+
+
+value_cursor_ring_buffer_test = construct_test_case(
+    RingBuffer, lock=threading.Lock()
+)  # type: typing.Any
+
+
+class TestValueCursorRingBufferAggregators(value_cursor_ring_buffer_test):
+    pass
+
+
+single_producer_disruptor_test = construct_test_case(
+    SingleProducerDisruptor
+)  # type: typing.Any
+
+
+class TestSingleProducerDisruptorAggregators(single_producer_disruptor_test):
+    pass
+
+
+class TestWaitingBlockingRingBufferAggregators(unittest.TestCase):
+    def test_aggregates_as_consumed(self):
+        ring_buffer = WaitingBlockingRingBuffer(size=4)
+        ring_buffer.add_aggregator("mean", RollingMean())
+        for i in range(10):
+            ring_buffer.put(i)
+            ring_buffer.next()
+        self.assertEqual(ring_buffer.aggregate("mean"), 7.5)
+
+
+class TestMultiProducerDisruptorAggregators(unittest.TestCase):
+    def test_not_supported(self):
+        with self.assertRaises(TypeError):
+            MultiProducerDisruptor(size=4).add_aggregator("sum", RollingSum())
+
+
+class TestRollingVariance(unittest.TestCase):
+    def test_stays_accurate_for_large_offsets(self):
+        variance = RollingVariance()
+        values = [1e9 + i % 3 for i in range(1000)]
+        for sequence, value in enumerate(values):
+            variance.add(sequence, value)
+            if sequence >= 10:
+                variance.evict(sequence - 10, values[sequence - 10])
+        self.assertAlmostEqual(variance.value, statistics.pvariance(values[-10:]))
+
+
+if __name__ == "__main__":
+    unittest.main()
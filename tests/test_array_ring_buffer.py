@@ -0,0 +1,107 @@
+import unittest
+from pyring import (
+    ArrayRingBuffer,
+    Empty,
+    SequenceOverwritten,
+    SequenceNotFound,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestArrayRingBuffer(unittest.TestCase):
+    def test_accepts_valid_sizes(self):
+        with self.assertRaises(AttributeError):
+            ArrayRingBuffer(size=5)
+        self.assertIsInstance(ArrayRingBuffer(size=4), ArrayRingBuffer)
+
+    def test_cannot_read_ahead_of_cursor(self):
+        ring_buffer = ArrayRingBuffer(size=4)
+
+        with self.assertRaises(Empty):
+            ring_buffer.get_latest()
+
+        with self.assertRaises(SequenceNotFound):
+            ring_buffer.get(0)
+
+        ring_buffer.put(1.0)
+        with self.assertRaises(SequenceNotFound):
+            ring_buffer.get_range(0, 2)
+
+    def test_cannot_read_when_overwritten(self):
+        ring_buffer = ArrayRingBuffer(size=4)
+        for i in range(5):
+            ring_buffer.put(i)
+
+        with self.assertRaises(SequenceOverwritten):
+            ring_buffer.get(0)
+        with self.assertRaises(SequenceOverwritten) as context:
+            ring_buffer.get_range(0, 3)
+        self.assertEqual(context.exception.oldest, 1)
+
+    def test_can_read_and_write(self):
+        ring_buffer = ArrayRingBuffer(size=4)
+        for i in range(10):
+            ring_buffer.put(i ** 2)
+            self.assertEqual(ring_buffer.get(i), (i, i ** 2))
+
+    def test_window_returns_view_when_contiguous(self):
+        ring_buffer = ArrayRingBuffer(size=8)
+        ring_buffer.put_array(np.arange(6))
+
+        sequence, window = ring_buffer.window(4)
+        self.assertEqual(sequence, 2)
+        np.testing.assert_array_equal(window, [2, 3, 4, 5])
+        self.assertTrue(np.shares_memory(window, ring_buffer._array))
+
+    def test_window_stitches_when_wrapped(self):
+        ring_buffer = ArrayRingBuffer(size=8)
+        ring_buffer.put_array(np.arange(11))
+
+        sequence, window = ring_buffer.window(6)
+        self.assertEqual(sequence, 5)
+        np.testing.assert_array_equal(window, [5, 6, 7, 8, 9, 10])
+        self.assertFalse(np.shares_memory(window, ring_buffer._array))
+
+        # window is limited to the retained samples
+        sequence, window = ring_buffer.window(100)
+        self.assertEqual(sequence, 3)
+        self.assertEqual(len(window), 8)
+
+    def test_put_array_larger_than_ring(self):
+        ring_buffer = ArrayRingBuffer(size=4)
+        ring_buffer.put(-1)
+        self.assertEqual(ring_buffer.put_array(np.arange(10)), 1)
+        self.assertEqual(ring_buffer._get_cursor_position(), 11)
+        np.testing.assert_array_equal(ring_buffer.get_range(7, 11)[1], [6, 7, 8, 9])
+
+    def test_structured_dtype(self):
+        dtype = np.dtype([("price", "f8"), ("size", "i4")])
+        ring_buffer = ArrayRingBuffer(size=4, dtype=dtype)
+        ring_buffer.put((1.5, 10))
+        ring_buffer.put_array(np.array([(2.5, 20), (3.5, 30)], dtype=dtype))
+
+        _, window = ring_buffer.window(3)
+        self.assertEqual(window["size"].sum(), 60)
+        self.assertAlmostEqual(window["price"].mean(), 2.5)
+
+    def test_sample_shape(self):
+        ring_buffer = ArrayRingBuffer(size=4, shape=(3,))
+        ring_buffer.put([1, 2, 3])
+        _, window = ring_buffer.window(1)
+        self.assertEqual(window.shape, (1, 3))
+
+    def test_flush(self):
+        ring_buffer = ArrayRingBuffer(size=4)
+        ring_buffer.put_array(np.arange(3))
+        ring_buffer.flush()
+        with self.assertRaises(Empty):
+            ring_buffer.get_latest()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,224 @@
+import unittest
+import asyncio
+import threading
+import typing
+
+from pyring import (
+    AsyncRingBuffer,
+    AsyncDisruptor,
+    AsyncDisruptorSubscriber,
+    SequenceNotFound,
+    ReadCursorBlock,
+)
+
+
+def run(coroutine: typing.Awaitable[typing.Any]) -> typing.Any:
+    return asyncio.run(coroutine)  # type: ignore
+
+
+class TestAsyncRingBuffer(unittest.TestCase):
+    def test_sync_read_and_write(self):
+        async def main():
+            ring_buffer = AsyncRingBuffer(size=4)
+            for i in range(10):
+                await ring_buffer.put(i ** 2)
+                sequence, res = await ring_buffer.next()
+                self.assertEqual((sequence, res), (i, i ** 2))
+
+        run(main())
+
+    def test_timeouts(self):
+        async def main():
+            ring_buffer = AsyncRingBuffer(size=2)
+            with self.assertRaises(SequenceNotFound):
+                await ring_buffer.next(timeout=0.01)
+            await ring_buffer.put_many([0, 1])
+            with self.assertRaises(ReadCursorBlock):
+                await ring_buffer.put(2, timeout=0.01)
+
+        run(main())
+
+    def test_slow_consumer_does_not_block_loop(self):
+        async def main():
+            ring_buffer = AsyncRingBuffer(size=2)
+            received = []
+
+            async def consumer():
+                async for _, value in ring_buffer:
+                    received.append(value)
+                    await asyncio.sleep(0.001)
+                    if len(received) == 8:
+                        break
+
+            task = asyncio.ensure_future(consumer())
+            for i in range(0, 8, 2):
+                await ring_buffer.put_many(range(i, i + 2), timeout=1)
+            await asyncio.wait_for(task, timeout=1)
+            self.assertEqual(received, list(range(8)))
+
+        run(main())
+
+    def test_concurrent_waiters_are_all_woken(self):
+        async def main():
+            ring_buffer = AsyncRingBuffer(size=2)
+            readers = [
+                asyncio.ensure_future(ring_buffer.next(timeout=5)) for _ in range(2)
+            ]
+            await asyncio.sleep(0.01)
+            await ring_buffer.put_many([0, 1])
+            results = await asyncio.wait_for(asyncio.gather(*readers), timeout=0.5)
+            self.assertEqual(sorted(results), [(0, 0), (1, 1)])
+
+            await ring_buffer.put_many([2, 3])
+            writers = [
+                asyncio.ensure_future(ring_buffer.put(value, timeout=5))
+                for value in (4, 5)
+            ]
+            await asyncio.sleep(0.01)
+            self.assertEqual(await ring_buffer.next_batch(2), (2, [2, 3]))
+            await asyncio.wait_for(asyncio.gather(*writers), timeout=0.5)
+            self.assertEqual(await ring_buffer.next_batch(2), (4, [4, 5]))
+
+        run(main())
+
+    def test_threaded_producer_wakes_async_consumer(self):
+        async def main():
+            ring_buffer = AsyncRingBuffer(size=4)
+
+            def producer():
+                for i in range(16):
+                    ring_buffer.put_threadsafe(i, timeout=1)
+
+            thread = threading.Thread(target=producer)
+            thread.start()
+            values = []
+            while len(values) < 16:
+                _, batch = await ring_buffer.next_batch(4, timeout=1)
+                values.extend(batch)
+            thread.join()
+            self.assertEqual(values, list(range(16)))
+
+        run(main())
+
+
+class TestAsyncDisruptor(unittest.TestCase):
+    def test_subscribers_are_async(self):
+        disruptor = AsyncDisruptor()
+        self.assertIsInstance(disruptor.subscribe(), AsyncDisruptorSubscriber)
+
+    def test_sync_read_and_write(self):
+        async def main():
+            disruptor = AsyncDisruptor(size=2)
+            subscriber = disruptor.subscribe()
+            for i in range(10):
+                await disruptor.put(i ** 2, timeout=0.01)
+                sequence, res = await subscriber.next(timeout=0.01)
+                self.assertEqual((sequence, res), (i, i ** 2))
+
+        run(main())
+
+    def test_timeouts(self):
+        async def main():
+            disruptor = AsyncDisruptor(size=2)
+            subscriber = disruptor.subscribe()
+            with self.assertRaises(SequenceNotFound):
+                await subscriber.next(timeout=0.01)
+            await disruptor.put_many([0, 1])
+            with self.assertRaises(ReadCursorBlock):
+                await disruptor.put(2, timeout=0.01)
+
+            # one slot is free, the batch of two is not partially written
+            await subscriber.next()
+            with self.assertRaises(ReadCursorBlock):
+                await disruptor.put_many([2, 3], timeout=0.01)
+            self.assertEqual(await subscriber.next(), (1, 1))
+            with self.assertRaises(SequenceNotFound):
+                await subscriber.next(timeout=0.01)
+
+        run(main())
+
+    def test_concurrent_waiters_are_all_woken(self):
+        async def main():
+            disruptor = AsyncDisruptor(size=2)
+            subscriber = disruptor.subscribe()
+            readers = [
+                asyncio.ensure_future(subscriber.next(timeout=5)) for _ in range(2)
+            ]
+            await asyncio.sleep(0.01)
+            await disruptor.put_many([0, 1])
+            results = await asyncio.wait_for(asyncio.gather(*readers), timeout=0.5)
+            self.assertEqual(sorted(results), [(0, 0), (1, 1)])
+
+            # two producers gated on the one subscriber
+            await disruptor.put_many([2, 3])
+            writers = [
+                asyncio.ensure_future(disruptor.put(value, timeout=5))
+                for value in (4, 5)
+            ]
+            await asyncio.sleep(0.01)
+            self.assertEqual(await subscriber.next_batch(2), (2, [2, 3]))
+            await asyncio.wait_for(asyncio.gather(*writers), timeout=0.5)
+            self.assertEqual(sorted((await subscriber.next_batch(2))[1]), [4, 5])
+
+        run(main())
+
+    def test_multiple_async_subscribers(self):
+        async def main():
+            disruptor = AsyncDisruptor(size=4)
+            subscribers = [disruptor.subscribe() for _ in range(3)]
+
+            async def consume(subscriber: AsyncDisruptorSubscriber):
+                values = []
+                async for _, value in subscriber:
+                    values.append(value)
+                    if len(values) == 20:
+                        break
+                return values
+
+            tasks = [asyncio.ensure_future(consume(sub)) for sub in subscribers]
+            for i in range(20):
+                await disruptor.put(i, timeout=1)
+            results = await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+            self.assertEqual(results, [list(range(20))] * 3)
+
+        run(main())
+
+    def test_async_for_stops_on_unregister(self):
+        async def main():
+            disruptor = AsyncDisruptor(size=4)
+            subscriber = disruptor.subscribe()
+
+            async def consume():
+                return [value async for _, value in subscriber]
+
+            task = asyncio.ensure_future(consume())
+            await disruptor.put(1)
+            await asyncio.sleep(0.01)
+            subscriber.unregister()
+            self.assertEqual(await asyncio.wait_for(task, timeout=1), [1])
+
+        run(main())
+
+    def test_threaded_producer_wakes_async_subscriber(self):
+        async def main():
+            disruptor = AsyncDisruptor(size=4)
+            subscriber = disruptor.subscribe()
+
+            def producer():
+                for i in range(16):
+                    disruptor.put_threadsafe(i, timeout=1)
+
+            thread = threading.Thread(target=producer)
+            thread.start()
+            values = []
+            while len(values) < 16:
+                _, batch = await subscriber.next_batch(4, timeout=1)
+                values.extend(batch)
+            thread.join()
+            self.assertEqual(values, list(range(16)))
+
+        run(main())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+import unittest
+import threading
+import typing
+from pyring import (
+    SingleProducerDisruptor,
+    MultiProducerDisruptor,
+    BatchEventProcessor,
+    SequenceNotFound,
+)
+
+
+def construct_test_case(disruptor_class: typing.Type[SingleProducerDisruptor]):
+    class TestBatchEventProcessor(unittest.TestCase):
+        def setUp(self):
+            self.disruptor = disruptor_class(size=8)
+            self.received: typing.List[typing.Tuple[typing.Any, int, bool]] = []
+            self.processors: typing.List[BatchEventProcessor] = []
+            self.handled = threading.Event()
+            self.expected = 0
+
+        def tearDown(self):
+            for processor in self.processors:
+                processor.halt(timeout=5)
+
+        def processor(self, subscriber=None, handler=None, **kwargs):
+            processor = BatchEventProcessor(
+                subscriber or self.disruptor.subscribe(),
+                handler or self.record,
+                **kwargs,
+            )
+            self.processors.append(processor)
+            return processor
+
+        def record(self, value, sequence, end_of_batch):
+            self.received.append((value, sequence, end_of_batch))
+            if sequence + 1 >= self.expected:
+                self.handled.set()
+
+        def run_until(self, processor, expected):
+            self.expected = expected
+            processor.start()
+            self.assertTrue(self.handled.wait(timeout=5))
+            processor.halt(timeout=5)
+
+        def test_drains_available_sequences_in_one_batch(self):
+            processor = self.processor()
+            self.disruptor.put_many(range(5))
+            self.run_until(processor, 5)
+
+            self.assertEqual(
+                self.received,
+                [(0, 0, False), (1, 1, False), (2, 2, False), (3, 3, False)]
+                + [(4, 4, True)],
+            )
+
+        def test_max_batch_size(self):
+            processor = self.processor(max_batch_size=2)
+            self.disruptor.put_many(range(5))
+            self.run_until(processor, 5)
+
+            self.assertEqual(
+                [end_of_batch for _, _, end_of_batch in self.received],
+                [False, True, False, True, True],
+            )
+
+        def test_processes_while_running(self):
+            done = threading.Event()
+
+            def handler(value, sequence, end_of_batch):
+                self.record(value, sequence, end_of_batch)
+                if sequence == 99:
+                    done.set()
+
+            processor = self.processor(handler=handler)
+            processor.start()
+            for i in range(100):
+                self.disruptor.put(i, timeout=5)
+            self.assertTrue(done.wait(timeout=5))
+
+            self.assertEqual([value for value, _, _ in self.received], list(range(100)))
+            self.assertTrue(self.received[-1][2])
+
+        def test_halt_unblocks_waiting_processor(self):
+            processor = self.processor()
+            processor.start()
+            self.assertTrue(processor.is_running)
+
+            processor.halt(timeout=5)
+            self.assertFalse(processor.is_running)
+
+        def test_can_restart(self):
+            processor = self.processor()
+            processor.start()
+            with self.assertRaises(RuntimeError):
+                processor.start()
+            processor.halt(timeout=5)
+
+            self.disruptor.put(1)
+            self.run_until(processor, 1)
+            self.assertEqual(self.received, [(1, 0, True)])
+
+        def test_handler_exceptions_are_reported(self):
+            errors = []
+
+            def handler(value, sequence, end_of_batch):
+                if value == 1:
+                    raise ValueError(value)
+                self.record(value, sequence, end_of_batch)
+
+            processor = self.processor(
+                handler=handler,
+                exception_handler=lambda exc, seq, value: errors.append((exc, seq)),
+            )
+            self.disruptor.put_many(range(3))
+            self.run_until(processor, 3)
+
+            self.assertEqual(self.received, [(0, 0, False), (2, 2, True)])
+            self.assertEqual(len(errors), 1)
+            self.assertIsInstance(errors[0][0], ValueError)
+            self.assertEqual(errors[0][1], 1)
+
+        def test_downstream_waits_for_handler(self):
+            release = threading.Event()
+            handled = threading.Event()
+
+            def handler(value, sequence, end_of_batch):
+                handled.set()
+                release.wait(timeout=5)
+
+            upstream = self.disruptor.subscribe()
+            downstream = self.disruptor.subscribe(after=[upstream])
+            processor = self.processor(subscriber=upstream, handler=handler)
+            processor.start()
+            self.disruptor.put(0)
+
+            self.assertTrue(handled.wait(timeout=5))
+            with self.assertRaises(SequenceNotFound):
+                downstream.next(timeout=0.01)
+
+            release.set()
+            self.assertEqual(downstream.next(timeout=5), (0, 0))
+
+    return TestBatchEventProcessor
+
+
+single_producer_processor = construct_test_case(
+    SingleProducerDisruptor
+)  # type: typing.Any
+
+
+class TestSingleProducerBatchEventProcessor(single_producer_processor):
+    pass
+
+
+multi_producer_processor = construct_test_case(
+    MultiProducerDisruptor
+)  # type: typing.Any
+
+
+class TestMultiProducerBatchEventProcessor(multi_producer_processor):
+    pass
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+import contextlib
+import io
+import json
+import os
+import tempfile
+from pyring import bench
+
+
+class TestBench(unittest.TestCase):
+    def test_run_covers_every_variant(self):
+        results = bench.run(events=200)
+        variants = {result["variant"] for result in results["results"]}
+        self.assertEqual(
+            variants,
+            {
+                "RingBuffer",
+                "LockedRingBuffer",
+                "BlockingRingBuffer",
+                "WaitingBlockingRingBuffer",
+                "SingleProducerDisruptor",
+                "RingBuffer[mp.Value]",
+            },
+        )
+        for result in results["results"]:
+            self.assertGreater(result["ops_per_sec"], 0)
+            self.assertLessEqual(result["p50_us"], result["p99_us"])
+            self.assertLessEqual(result["p99_us"], result["p999_us"])
+
+    def test_compare_flags_regressions(self):
+        baseline = {
+            "results": [
+                {"name": "a", "ops_per_sec": 100.0, "p99_us": 10.0},
+                {"name": "b", "ops_per_sec": 100.0, "p99_us": 10.0},
+                {"name": "c", "ops_per_sec": 100.0, "p99_us": 10.0},
+            ]
+        }
+        current = {
+            "results": [
+                {"name": "a", "ops_per_sec": 95.0, "p99_us": 10.5},
+                {"name": "b", "ops_per_sec": 50.0, "p99_us": 10.0},
+                {"name": "c", "ops_per_sec": 100.0, "p99_us": 20.0},
+                {"name": "new", "ops_per_sec": 1.0, "p99_us": 1000.0},
+            ]
+        }
+        regressions = bench.compare(baseline, current, threshold=0.1)
+        self.assertEqual([line.split(":")[0] for line in regressions], ["b", "c"])
+
+    def test_compare_command_exit_status(self):
+        with tempfile.TemporaryDirectory() as directory:
+            baseline = os.path.join(directory, "baseline.json")
+            current = os.path.join(directory, "current.json")
+            with open(baseline, "w") as output:
+                json.dump(
+                    {"results": [{"name": "a", "ops_per_sec": 100.0, "p99_us": 1.0}]},
+                    output,
+                )
+            with open(current, "w") as output:
+                json.dump(
+                    {"results": [{"name": "a", "ops_per_sec": 10.0, "p99_us": 1.0}]},
+                    output,
+                )
+
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                self.assertEqual(bench.main(["compare", baseline, baseline]), 0)
+                self.assertEqual(bench.main(["compare", baseline, current]), 1)
+            self.assertIn("REGRESSION a", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
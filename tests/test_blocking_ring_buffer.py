@@ -57,6 +57,27 @@ def construct_test_case(ring_buffer: typing.Type[BlockingRingBuffer]):
                 self.assertEqual(res, i ** 2)
                 self.assertEqual(sequence, i)
 
+        def test_put_many_and_next_batch(self):
+            ring_buffer = self.ring_buffer(size=4)
+            self.assertEqual(ring_buffer.put_many(range(3)), 0)
+
+            self.assertEqual(ring_buffer.next_batch(2), (0, [0, 1]))
+            self.assertEqual(ring_buffer.next_batch(8), (2, [2]))
+            self.assertEqual(ring_buffer._read_cursor, 3)
+
+            with self.assertRaises(SequenceNotFound):
+                ring_buffer.next_batch(8)
+
+        def test_put_many_cannot_write_over_read_cursor(self):
+            ring_buffer = self.ring_buffer(size=4)
+            ring_buffer.put(0)
+
+            with self.assertRaises(ReadCursorBlock):
+                ring_buffer.put_many(range(4))
+
+            # nothing from the rejected batch is written
+            self.assertEqual(ring_buffer._get_cursor_position(), 1)
+
     return TestBlockingRingBuffer
 
 
@@ -0,0 +1,133 @@
+import unittest
+import threading
+import typing
+from pyring import (
+    ByteRingBuffer,
+    Empty,
+    SequenceOverwritten,
+    SequenceNotFound,
+)
+
+
+def construct_test_case(lock=None):
+    class TestByteRingBuffer(unittest.TestCase):
+        def create_ring_buffer(self, size=4, capacity=64):
+            return ByteRingBuffer(size=size, capacity=capacity, lock=lock)
+
+        def test_accepts_valid_sizes(self):
+            with self.assertRaises(AttributeError):
+                ByteRingBuffer(size=5)
+            self.assertIsInstance(self.create_ring_buffer(), ByteRingBuffer)
+
+        def test_cannot_read_ahead_of_cursor(self):
+            ring_buffer = self.create_ring_buffer()
+
+            with self.assertRaises(Empty):
+                ring_buffer.get_latest()
+
+            with self.assertRaises(SequenceNotFound):
+                ring_buffer.get(0)
+
+        def test_can_read_and_write(self):
+            ring_buffer = self.create_ring_buffer()
+            for i in range(20):
+                record = bytes([i]) * (i % 7)
+                self.assertEqual(ring_buffer.put(record), i)
+                sequence, view = ring_buffer.get(i)
+                self.assertEqual((sequence, bytes(view)), (i, record))
+                self.assertEqual(ring_buffer.get_latest()[0], i)
+
+        def test_reads_are_views_of_the_buffer(self):
+            ring_buffer = self.create_ring_buffer()
+            ring_buffer.put(b"abc")
+            _, view = ring_buffer.get(0)
+            self.assertIsInstance(view, memoryview)
+            self.assertIs(view.obj, ring_buffer._buffer.obj)
+
+        def test_accepts_any_buffer(self):
+            ring_buffer = self.create_ring_buffer()
+            ring_buffer.put(memoryview(bytearray(b"xyz"))[1:])
+            ring_buffer.put(bytearray(b"!"))
+            self.assertEqual(bytes(ring_buffer.get(0)[1]), b"yz")
+            self.assertEqual(bytes(ring_buffer.get(1)[1]), b"!")
+
+        def test_cannot_read_when_overwritten_by_count(self):
+            ring_buffer = self.create_ring_buffer(size=4, capacity=1024)
+            for i in range(5):
+                ring_buffer.put(bytes([i]))
+
+            with self.assertRaises(SequenceOverwritten):
+                ring_buffer.get(0)
+            self.assertEqual(bytes(ring_buffer.get(1)[1]), b"\x01")
+
+        def test_cannot_read_when_overwritten_by_bytes(self):
+            ring_buffer = self.create_ring_buffer(size=8, capacity=64)
+            # 4 byte header + 20 byte payload, only two fit at once
+            for i in range(3):
+                ring_buffer.put(bytes([i]) * 20)
+
+            with self.assertRaises(SequenceOverwritten):
+                ring_buffer.get(0)
+            self.assertEqual(bytes(ring_buffer.get(1)[1]), bytes([1]) * 20)
+            self.assertEqual(bytes(ring_buffer.get(2)[1]), bytes([2]) * 20)
+
+        def test_records_wrap_without_splitting(self):
+            ring_buffer = self.create_ring_buffer(size=8, capacity=64)
+            for i in range(50):
+                record = bytes([i]) * (i % 13 + 1)
+                ring_buffer.put(record)
+                self.assertEqual(bytes(ring_buffer.get(i)[1]), record)
+
+        def test_rejects_records_larger_than_capacity(self):
+            ring_buffer = self.create_ring_buffer(capacity=64)
+            ring_buffer.put(b"x" * 60)
+            with self.assertRaises(ValueError):
+                ring_buffer.put(b"x" * 61)
+            self.assertEqual(ring_buffer._get_cursor_position(), 1)
+
+        def test_put_many(self):
+            ring_buffer = self.create_ring_buffer()
+            self.assertEqual(ring_buffer.put_many([b"a", b"bb", b"ccc"]), 0)
+            self.assertEqual(ring_buffer.put_many([b"d"]), 3)
+            self.assertEqual(bytes(ring_buffer.get(2)[1]), b"ccc")
+
+        def test_put_many_is_all_or_nothing(self):
+            ring_buffer = self.create_ring_buffer(capacity=64)
+            ring_buffer.put(b"a")
+            with self.assertRaises(ValueError):
+                ring_buffer.put_many([b"b", b"x" * 61, b"c"])
+            self.assertEqual(ring_buffer._get_cursor_position(), 1)
+            self.assertEqual(ring_buffer.put(b"d"), 1)
+            self.assertEqual(bytes(ring_buffer.get(0)[1]), b"a")
+            self.assertEqual(bytes(ring_buffer.get(1)[1]), b"d")
+
+        def test_flush(self):
+            ring_buffer = self.create_ring_buffer()
+            ring_buffer.put(b"a")
+            ring_buffer.flush()
+            with self.assertRaises(Empty):
+                ring_buffer.get_latest()
+            ring_buffer.put(b"b")
+            self.assertEqual(ring_buffer.get(0)[0], 0)
+
+    return TestByteRingBuffer
+
+
+byte_ring_buffer_test = construct_test_case()  # type: typing.Any
+
+
+class TestByteRingBuffer(byte_ring_buffer_test):
+    pass
+
+
+locked_byte_ring_buffer_test = construct_test_case(
+    lock=threading.RLock()
+)  # type: typing.Any
+
+
+class TestLockedByteRingBuffer(locked_byte_ring_buffer_test):
+    pass
+
+
+if __name__ == "__main__":
+    unittest.main()
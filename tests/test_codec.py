@@ -0,0 +1,173 @@
+import unittest
+import multiprocessing as mp
+import os
+import pickle
+import struct
+import sys
+import tempfile
+from pyring import (
+    BytesCodec,
+    StructCodec,
+    PickleCodec,
+    Encoded,
+    JournalRingBuffer,
+    SharedMemoryRingBuffer,
+    SharedMemoryDisruptor,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+
+def consumer_routine(subscriber, total):
+    sequence, encoded = subscriber.next(timeout=5)
+    total.value = int(encoded.value["samples"].sum())
+    encoded.release()
+    subscriber.close()
+
+
+class TestBytesCodec(unittest.TestCase):
+    def test_round_trip(self):
+        buffer = memoryview(bytearray(8))
+        codec = BytesCodec()
+        self.assertEqual(codec.encode_into(b"abc", buffer), 3)
+        self.assertEqual(bytes(codec.decode(buffer[:3])), b"abc")
+
+        with self.assertRaises(ValueError):
+            codec.encode_into(b"x" * 9, buffer)
+
+
+class TestStructCodec(unittest.TestCase):
+    def test_round_trip(self):
+        codec = StructCodec("<qd8s")
+        buffer = memoryview(bytearray(32))
+        self.assertEqual(codec.encode_into((1, 2.5, b"ab"), buffer), 24)
+        self.assertEqual(codec.decode(buffer), (1, 2.5, b"ab" + bytes(6)))
+
+    def test_field_offsets_follow_alignment(self):
+        for format in ("@bqh", "<bqh", "!2bxi", "=?3h"):
+            codec = StructCodec(format)
+            values = struct.unpack(format, bytes(range(1, struct.calcsize(format) + 1)))
+            buffer = memoryview(bytearray(64))
+            codec.encode_into(values, buffer)
+            for index, value in enumerate(values):
+                self.assertEqual(codec.field(buffer, index), value)
+
+    def test_named_fields(self):
+        codec = StructCodec("<qd", names=["id", "price"])
+        buffer = memoryview(bytearray(16))
+        codec.encode_into((7, 1.5), buffer)
+        self.assertEqual(codec.field(buffer, "price"), 1.5)
+
+        with self.assertRaises(ValueError):
+            StructCodec("<qd", names=["id"])
+
+    def test_pickles(self):
+        codec = pickle.loads(pickle.dumps(StructCodec("<qd", names=["id", "price"])))
+        buffer = memoryview(bytearray(16))
+        codec.encode_into((7, 1.5), buffer)
+        self.assertEqual(codec.field(buffer, "id"), 7)
+
+
+class TestPickleCodec(unittest.TestCase):
+    def test_round_trip(self):
+        codec = PickleCodec()
+        buffer = memoryview(bytearray(256))
+        value = {"a": [1, 2, 3], "b": "text"}
+        nbytes = codec.encode_into(value, buffer)
+        self.assertEqual(codec.decode(buffer[:nbytes]), value)
+
+        with self.assertRaises(ValueError):
+            codec.encode_into(b"x" * 256, buffer)
+
+    def test_out_of_band_buffers_are_views_of_the_slot(self):
+        codec = PickleCodec()
+        buffer = memoryview(bytearray(256))
+        payload = bytearray(b"payload")
+        nbytes = codec.encode_into(pickle.PickleBuffer(payload), buffer)
+
+        decoded = codec.decode(buffer[:nbytes])
+        self.assertEqual(bytes(decoded), b"payload")
+        # writing to the slot shows through the decoded value
+        buffer[nbytes - 7] = ord("P")
+        self.assertEqual(bytes(decoded), b"Payload")
+
+    @unittest.skipIf(np is None, "numpy is not installed")
+    def test_numpy_arrays_are_not_copied(self):
+        codec = PickleCodec()
+        buffer = memoryview(bytearray(1024))
+        array = np.arange(64, dtype=np.int64)
+        nbytes = codec.encode_into(array, buffer)
+
+        decoded = codec.decode(buffer[:nbytes])
+        np.testing.assert_array_equal(decoded, array)
+        self.assertFalse(decoded.flags.owndata)
+
+
+class TestEncoded(unittest.TestCase):
+    def test_decodes_once_on_demand(self):
+        decodes = []
+
+        class CountingCodec(BytesCodec):
+            def decode(self, buffer):
+                decodes.append(buffer)
+                return bytes(buffer)
+
+        encoded = Encoded(memoryview(b"abc"), CountingCodec())
+        self.assertEqual(decodes, [])
+        self.assertEqual(encoded.value, b"abc")
+        self.assertEqual(encoded.value, b"abc")
+        self.assertEqual(len(decodes), 1)
+
+    def test_field_skips_decoding(self):
+        codec = StructCodec("<qd", names=["id", "price"])
+        buffer = memoryview(bytearray(16))
+        codec.encode_into((3, 0.5), buffer)
+        self.assertEqual(Encoded(buffer, codec).field("id"), 3)
+
+
+class TestRingsWithCodecs(unittest.TestCase):
+    def test_journal_ring_buffer(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "journal")
+            codec = StructCodec("<qd", names=["id", "price"])
+            with JournalRingBuffer(path, size=4, slot_size=16, codec=codec) as journal:
+                journal.put((1, 9.5))
+
+            with JournalRingBuffer(path, codec=codec) as journal:
+                sequence, encoded = journal.get_latest()
+                self.assertEqual((sequence, encoded.field("price")), (0, 9.5))
+                self.assertEqual(encoded.value, (1, 9.5))
+                encoded.release()
+
+    @unittest.skipIf(sys.version_info < (3, 8), "shared_memory requires python 3.8")
+    def test_shared_memory_ring_buffer(self):
+        with SharedMemoryRingBuffer(size=4, slot_size=128, codec=PickleCodec()) as ring:
+            ring.put({"key": [1, 2]})
+            attached = pickle.loads(pickle.dumps(ring))
+            _, encoded = attached.get(0)
+            self.assertEqual(encoded.value, {"key": [1, 2]})
+            encoded.release()
+            attached.close()
+
+    @unittest.skipIf(
+        sys.version_info < (3, 8) or not hasattr(os, "mkfifo") or np is None,
+        "requires shared_memory, named pipes and numpy",
+    )
+    def test_numpy_payload_across_processes(self):
+        disruptor = SharedMemoryDisruptor(size=4, slot_size=8192, codec=PickleCodec())
+        total = mp.Value("q", 0)
+        proc = mp.Process(target=consumer_routine, args=(disruptor.subscribe(), total))
+        proc.start()
+        disruptor.put({"samples": np.arange(512, dtype=np.int64)}, timeout=5)
+        proc.join(timeout=10)
+        disruptor.close()
+        disruptor.unlink()
+
+        self.assertEqual(total.value, sum(range(512)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+import threading
+import typing
+from pyring import (
+    SingleProducerDisruptor,
+    MultiProducerDisruptor,
+    ConflatingSubscriber,
+    ReadCursorBlock,
+    SequenceNotFound,
+)
+
+
+def symbol(quote):
+    return quote[0]
+
+
+def construct_test_case(disruptor_class: typing.Type[SingleProducerDisruptor]):
+    class TestConflatingSubscriber(unittest.TestCase):
+        def setUp(self):
+            self.disruptor = disruptor_class(size=8)
+
+        def test_subscribe_with_key(self):
+            subscriber = self.disruptor.subscribe(conflate=symbol)
+            self.assertIsInstance(subscriber, ConflatingSubscriber)
+
+        def test_next_returns_latest_value_per_key(self):
+            subscriber = self.disruptor.subscribe(conflate=symbol)
+            with self.assertRaises(SequenceNotFound):
+                subscriber.next(timeout=0.01)
+
+            self.disruptor.put_many(
+                [("ABC", 1.0), ("XYZ", 5.0), ("ABC", 1.5), ("ABC", 2.0)]
+            )
+            sequence, latest = subscriber.next()
+            self.assertEqual(sequence, 3)
+            self.assertEqual(latest, {"ABC": ("ABC", 2.0), "XYZ": ("XYZ", 5.0)})
+            self.assertEqual(subscriber.conflated, 2)
+
+            self.disruptor.put(("XYZ", 6.0))
+            self.assertEqual(subscriber.next(), (4, {"XYZ": ("XYZ", 6.0)}))
+
+        def test_next_batch_limits_sequences(self):
+            subscriber = self.disruptor.subscribe(conflate=symbol)
+            self.disruptor.put_many([("A", i) for i in range(5)])
+            self.assertEqual(subscriber.next_batch(max_items=2), (1, {"A": ("A", 1)}))
+            self.assertEqual(subscriber.next_batch(max_items=8), (4, {"A": ("A", 4)}))
+
+        def test_slots_are_not_borrowed(self):
+            subscriber = self.disruptor.subscribe(conflate=symbol)
+            self.disruptor.put(("A", 0))
+            with self.assertRaises(TypeError):
+                subscriber.next_slot()
+
+        def test_catching_up_releases_producer(self):
+            subscriber = self.disruptor.subscribe(conflate=symbol)
+            self.disruptor.put_many([("A", i) for i in range(8)])
+            with self.assertRaises(ReadCursorBlock):
+                self.disruptor.put(("A", 8), timeout=0.01)
+
+            # a single read frees the whole ring
+            subscriber.next()
+            self.disruptor.put_many([("B", i) for i in range(8)], timeout=0.01)
+            self.assertEqual(subscriber.next(), (15, {"B": ("B", 7)}))
+
+        def test_follows_upstream(self):
+            upstream = self.disruptor.subscribe()
+            subscriber = self.disruptor.subscribe(conflate=symbol, after=[upstream])
+            self.disruptor.put_many([("A", 0), ("A", 1), ("A", 2)])
+            with self.assertRaises(SequenceNotFound):
+                subscriber.next(timeout=0.01)
+
+            upstream.next_batch(max_items=2)
+            self.assertEqual(subscriber.next(), (1, {"A": ("A", 1)}))
+
+        def test_stats_report_conflated(self):
+            self.disruptor.enable_metrics()
+            subscriber = self.disruptor.subscribe(conflate=symbol)
+            self.disruptor.put_many([("A", 0), ("A", 1)])
+            subscriber.next()
+            self.assertEqual(self.disruptor.stats()["subscribers"][0]["conflated"], 1)
+
+        def test_lagging_reader_with_concurrent_producer(self):
+            subscriber = self.disruptor.subscribe(conflate=symbol)
+            latest: typing.Dict[str, typing.Any] = {}
+
+            def consume():
+                while latest.get("B") != ("B", 999):
+                    latest.update(subscriber.next(timeout=5)[1])
+
+            consumer = threading.Thread(target=consume)
+            consumer.start()
+            for i in range(1000):
+                self.disruptor.put(("A" if i % 2 else "B", i), timeout=5)
+            self.disruptor.put(("B", 999), timeout=5)
+            consumer.join(timeout=10)
+
+            self.assertEqual(latest, {"A": ("A", 999), "B": ("B", 999)})
+
+    return TestConflatingSubscriber
+
+
+single_producer_test = construct_test_case(SingleProducerDisruptor)  # type: typing.Any
+
+
+class TestSingleProducerConflatingSubscriber(single_producer_test):
+    pass
+
+
+multi_producer_test = construct_test_case(MultiProducerDisruptor)  # type: typing.Any
+
+
+class TestMultiProducerConflatingSubscriber(multi_producer_test):
+    pass
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import unittest
+import threading
+import typing
+
+from pyring import (
+    SingleProducerDisruptor,
+    MultiProducerDisruptor,
+    DisruptorSubscriber,
+    SequenceNotFound,
+    ReadCursorBlock,
+)
+
+
+class TestDisruptorDependencies(unittest.TestCase):
+    def test_dependent_cannot_pass_upstream(self):
+        disruptor = SingleProducerDisruptor(size=4)
+        journaler = disruptor.subscribe()
+        replicator = disruptor.subscribe()
+        business = disruptor.subscribe(after=[journaler, replicator])
+
+        disruptor.put_many(range(3))
+
+        journaler.next_batch(3)
+        with self.assertRaises(SequenceNotFound):
+            business.next(timeout=0.01)
+
+        replicator.next()
+        self.assertEqual(business.next(), (0, 0))
+        with self.assertRaises(SequenceNotFound):
+            business.next(timeout=0.01)
+
+        replicator.next_batch(2)
+        self.assertEqual(business.next_batch(8), (1, [1, 2]))
+
+    def test_start_at_latest_does_not_pass_upstream(self):
+        disruptor = SingleProducerDisruptor(size=8)
+        journaler = disruptor.subscribe()
+        disruptor.put_many(range(4))
+        journaler.next()
+
+        # starts at the journaler's read cursor rather than at sequence 3
+        business = disruptor.subscribe(start_at_latest=True, after=[journaler])
+        with self.assertRaises(SequenceNotFound):
+            business.next(timeout=0.01)
+
+        journaler.next()
+        self.assertEqual(business.next(timeout=0.01), (1, 1))
+
+    def test_producer_gates_on_terminal_subscribers(self):
+        disruptor = SingleProducerDisruptor(size=4)
+        journaler = disruptor.subscribe()
+        business = disruptor.subscribe(after=[journaler])
+
+        self.assertEqual(list(disruptor._gating_subscribers), [business])
+
+        disruptor.put_many(range(4))
+        journaler.next_batch(4)
+        with self.assertRaises(ReadCursorBlock):
+            disruptor.put(4, timeout=0.01)
+
+        business.next()
+        disruptor.put(4, timeout=0.01)
+
+    def test_rejects_foreign_upstream(self):
+        disruptor = SingleProducerDisruptor(size=4)
+        other = SingleProducerDisruptor(size=4).subscribe()
+        with self.assertRaises(ValueError):
+            disruptor.subscribe(after=[other])
+
+    def test_unregister_splices_graph(self):
+        disruptor = SingleProducerDisruptor(size=4)
+        first = disruptor.subscribe()
+        middle = disruptor.subscribe(after=[first])
+        last = disruptor.subscribe(after=[middle])
+
+        middle.unregister()
+
+        self.assertEqual(last._upstream, [first])
+        self.assertEqual(first._downstream, [last])
+
+        disruptor.put(0)
+        first.next()
+        self.assertEqual(last.next(timeout=0.01), (0, 0))
+
+    def test_threaded_diamond(self):
+        for disruptor_class in (SingleProducerDisruptor, MultiProducerDisruptor):
+            disruptor = disruptor_class(size=4)
+            journaler = disruptor.subscribe()
+            replicator = disruptor.subscribe()
+            business = disruptor.subscribe(after=[journaler, replicator])
+
+            total = 200
+            seen: typing.Dict[str, typing.List[int]] = {
+                "journaler": [],
+                "replicator": [],
+            }
+            ordering_ok = True
+
+            def stage(name: str, subscriber: DisruptorSubscriber):
+                while len(seen[name]) < total:
+                    _, values = subscriber.next_batch(3, timeout=1)
+                    seen[name].extend(values)
+
+            def business_logic():
+                nonlocal ordering_ok
+                processed = 0
+                while processed < total:
+                    sequence, values = business.next_batch(3, timeout=1)
+                    last = sequence + len(values)
+                    if journaler._read_cursor < last or replicator._read_cursor < last:
+                        ordering_ok = False
+                    processed += len(values)
+
+            threads = [
+                threading.Thread(target=stage, args=("journaler", journaler)),
+                threading.Thread(target=stage, args=("replicator", replicator)),
+                threading.Thread(target=business_logic),
+            ]
+            for thread in threads:
+                thread.start()
+            for i in range(total):
+                disruptor.put(i, timeout=1)
+            for thread in threads:
+                thread.join()
+
+            self.assertTrue(ordering_ok)
+            self.assertEqual(seen["journaler"], list(range(total)))
+            self.assertEqual(business._read_cursor, total)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+import os
+import sys
+import threading
+import time
+import unittest
+from pyring import (
+    RingBuffer,
+    SingleProducerDisruptor,
+    SPSCRingBuffer,
+    BlockingWaitStrategy,
+    SequenceOverwritten,
+    SequenceNotFound,
+    Empty,
+)
+from pyring.wait_strategy import GIL_ENABLED
+
+
+class TestFreeThreading(unittest.TestCase):
+    """Producers and consumers running in parallel. On a free-threaded build
+    they really run at once, with the GIL a tiny switch interval interleaves
+    them as finely as possible."""
+
+    def setUp(self):
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self._switch_interval)
+
+    def test_gil_flag(self):
+        is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)
+        self.assertEqual(GIL_ENABLED, is_gil_enabled())
+
+    def test_lockless_readers_never_see_lapped_slots(self):
+        ring_buffer = RingBuffer(size=8)
+        done = threading.Event()
+        torn = []
+
+        def reader():
+            while not done.is_set():
+                try:
+                    sequence, value = ring_buffer.get_latest()
+                    if value != sequence:
+                        torn.append((sequence, value))
+                    sequence, value = ring_buffer.get(max(0, sequence - 7))
+                    if value != sequence:
+                        torn.append((sequence, value))
+                    start, values = ring_buffer.snapshot()
+                    if values != list(range(start, start + len(values))):
+                        torn.append((start, values))
+                except (SequenceOverwritten, SequenceNotFound, Empty):
+                    pass
+
+        readers = [threading.Thread(target=reader) for _ in range(3)]
+        for thread in readers:
+            thread.start()
+        # values equal their sequence, so a lapped read shows as a mismatch
+        for sequence in range(0, 40000, 4):
+            ring_buffer.put(sequence)
+            ring_buffer.put_many([sequence + 1, sequence + 2])
+            ring_buffer.put_with(lambda slot, sequence: slot.set(sequence))
+        done.set()
+        for thread in readers:
+            thread.join()
+
+        self.assertEqual(torn, [])
+
+    def test_disruptor_subscribers_in_parallel(self):
+        count = 20000
+        disruptor = SingleProducerDisruptor(size=16)
+        subscribers = [disruptor.subscribe() for _ in range(4)]
+        received = [[] for _ in subscribers]
+
+        def consume(subscriber, values):
+            while len(values) < count:
+                _, batch = subscriber.next_batch(timeout=5)
+                values.extend(batch)
+
+        consumers = [
+            threading.Thread(target=consume, args=args)
+            for args in zip(subscribers, received)
+        ]
+        for thread in consumers:
+            thread.start()
+        for sequence in range(0, count, 2):
+            disruptor.put(sequence, timeout=5)
+            disruptor.put_many([sequence + 1], timeout=5)
+        for thread in consumers:
+            thread.join()
+
+        for values in received:
+            self.assertEqual(values, list(range(count)))
+
+    def test_spsc_in_parallel(self):
+        count = 20000
+        ring_buffer = SPSCRingBuffer(size=16)
+        received = []
+
+        def consume():
+            while len(received) < count:
+                _, values = ring_buffer.next_batch(timeout=5)
+                received.extend(values)
+
+        thread = threading.Thread(target=consume)
+        thread.start()
+        for sequence in range(count):
+            ring_buffer.put(sequence, timeout=5)
+        thread.join()
+
+        self.assertEqual(received, list(range(count)))
+
+    @unittest.skipIf(
+        GIL_ENABLED or (os.cpu_count() or 1) < 4,
+        "needs a free-threaded build and 4 cpus",
+    )
+    def test_readers_scale_without_the_gil(self):
+        ring_buffer = RingBuffer(size=1024)
+        ring_buffer.put_many(range(1024))
+
+        def read():
+            for _ in range(200):
+                for start in range(0, 1024, 64):
+                    ring_buffer.get_range(start, start + 64)
+
+        def run(threads):
+            readers = [threading.Thread(target=read) for _ in range(threads)]
+            start = time.perf_counter()
+            for thread in readers:
+                thread.start()
+            for thread in readers:
+                thread.join()
+            return time.perf_counter() - start
+
+        # four readers doing four times the work finish well inside 4x the time
+        self.assertLess(run(4), 2 * run(1))
+
+    def test_blocking_wait_recovers_missed_signal(self):
+        wait_strategy = BlockingWaitStrategy()
+        wait_strategy.recheck_interval = 0.01
+        barrier = threading.Event()
+        ready = threading.Event()
+
+        # the condition turns true without the barrier ever being signalled
+        timer = threading.Timer(0.05, ready.set)
+        timer.start()
+        start = time.monotonic()
+        self.assertTrue(wait_strategy.wait(ready.is_set, barrier, timeout=5))
+        timer.join()
+
+        self.assertLess(time.monotonic() - start, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+import unittest
+import multiprocessing as mp
+import os
+import pickle
+import tempfile
+from pyring import (
+    JournalRingBuffer,
+    Empty,
+    SequenceOverwritten,
+    SequenceNotFound,
+)
+
+
+def crashing_producer_routine(path: str):
+    journal = JournalRingBuffer(path)
+    for i in range(10):
+        journal.put(i.to_bytes(4, "little"))
+    # exit without closing or syncing the journal
+    os._exit(1)
+
+
+class TestJournalRingBuffer(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "journal")
+        self.ring_buffer = JournalRingBuffer(self.path, size=4, slot_size=8)
+
+    def tearDown(self):
+        self.ring_buffer.close()
+        self.directory.cleanup()
+
+    def reopen(self, **kwargs) -> JournalRingBuffer:
+        self.ring_buffer.close()
+        self.ring_buffer = JournalRingBuffer(self.path, **kwargs)
+        return self.ring_buffer
+
+    def test_accepts_valid_sizes(self):
+        with self.assertRaises(AttributeError):
+            JournalRingBuffer(os.path.join(self.directory.name, "odd"), size=5)
+
+    def test_cannot_read_ahead_of_cursor(self):
+        with self.assertRaises(Empty):
+            self.ring_buffer.get_latest()
+
+        with self.assertRaises(SequenceNotFound):
+            self.ring_buffer.get(0)
+
+    def test_cannot_read_when_overwritten(self):
+        for i in range(5):
+            self.ring_buffer.put(bytes([i]))
+
+        with self.assertRaises(SequenceOverwritten):
+            self.ring_buffer.get(0)
+
+    def test_recovers_cursor_and_slots_on_reopen(self):
+        self.ring_buffer.put_many([bytes([i]) for i in range(6)])
+        ring_buffer = self.reopen()
+        self.assertEqual(ring_buffer.ring_size, 4)
+        self.assertEqual(ring_buffer.slot_size, 8)
+
+        for i in range(2, 6):
+            sequence, res = ring_buffer.get(i)
+            self.assertEqual((sequence, bytes(res)), (i, bytes([i])))
+            res.release()
+        with self.assertRaises(SequenceOverwritten):
+            ring_buffer.get(1)
+
+        self.assertEqual(ring_buffer.put(b"next"), 6)
+
+    def test_recovers_after_process_crash(self):
+        self.ring_buffer.close()
+        os.remove(self.path)
+        proc = mp.Process(target=crashing_producer_routine, args=(self.path,))
+        proc.start()
+        proc.join()
+        self.assertEqual(proc.exitcode, 1)
+
+        self.ring_buffer = JournalRingBuffer(self.path)
+        sequence, res = self.ring_buffer.get_latest()
+        self.assertEqual((sequence, int.from_bytes(res, "little")), (9, 9))
+        res.release()
+
+    def test_rejects_mismatched_sizes(self):
+        self.ring_buffer.close()
+        with self.assertRaises(ValueError):
+            JournalRingBuffer(self.path, size=8)
+        with self.assertRaises(ValueError):
+            JournalRingBuffer(self.path, slot_size=16)
+        self.reopen(size=4, slot_size=8)
+
+    def test_rejects_other_files(self):
+        path = os.path.join(self.directory.name, "other")
+        with open(path, "wb") as other:
+            other.write(b"not a journal" * 100)
+        with self.assertRaises(ValueError):
+            JournalRingBuffer(path)
+
+    def test_replays_with_subscriber(self):
+        self.ring_buffer.put_many([bytes([i]) for i in range(6)])
+        subscriber = self.reopen().subscribe()
+
+        sequence, res = subscriber.next()
+        self.assertEqual((sequence, bytes(res)), (2, b"\x02"))
+        res.release()
+
+        first_sequence, values = subscriber.next_batch(max_items=8)
+        self.assertEqual(first_sequence, 3)
+        self.assertEqual(
+            [bytes(value) for value in values], [b"\x03", b"\x04", b"\x05"]
+        )
+        for value in values:
+            value.release()
+
+        with self.assertRaises(SequenceNotFound):
+            subscriber.next(timeout=0.01)
+
+        self.ring_buffer.put(b"\x06")
+        sequence, res = subscriber.next(timeout=1)
+        self.assertEqual((sequence, bytes(res)), (6, b"\x06"))
+        res.release()
+
+    def test_subscriber_from_sequence(self):
+        self.ring_buffer.put_many([bytes([i]) for i in range(3)])
+        sequence, res = self.ring_buffer.subscribe(start_sequence=1).next()
+        self.assertEqual((sequence, bytes(res)), (1, b"\x01"))
+        res.release()
+
+    def test_lapped_subscriber(self):
+        subscriber = self.ring_buffer.subscribe()
+        self.ring_buffer.put_many([bytes([i]) for i in range(5)])
+        with self.assertRaises(SequenceOverwritten) as overwritten:
+            subscriber.next()
+        self.assertEqual(overwritten.exception.lag, 1)
+        self.assertEqual(subscriber.overwritten, 1)
+
+        # the subscriber carries on from the oldest retained sequence
+        sequence, res = subscriber.next()
+        self.assertEqual((sequence, bytes(res)), (1, b"\x01"))
+        res.release()
+        self.ring_buffer.put_many([bytes([i]) for i in range(5, 10)])
+        with self.assertRaises(SequenceOverwritten):
+            subscriber.next_batch()
+        sequence, views = subscriber.next_batch()
+        self.assertEqual(
+            (sequence, [bytes(view) for view in views]),
+            (6, [b"\x06", b"\x07", b"\x08", b"\x09"]),
+        )
+        for view in views:
+            view.release()
+
+    def test_sync_policy(self):
+        ring_buffer = self.reopen(sync_every=3)
+        ring_buffer.put(b"a")
+        ring_buffer.put(b"b")
+        self.assertEqual(ring_buffer._unsynced, 2)
+        ring_buffer.put(b"c")
+        self.assertEqual(ring_buffer._unsynced, 0)
+        ring_buffer.put_many([b"d", b"e", b"f"])
+        self.assertEqual(ring_buffer._unsynced, 0)
+
+    def test_pickles_by_path(self):
+        reopened = pickle.loads(pickle.dumps(self.ring_buffer))
+        self.assertEqual(reopened.path, self.path)
+        reopened.put(b"abc")
+        _, res = self.ring_buffer.get(0)
+        self.assertEqual(bytes(res), b"abc")
+        res.release()
+        reopened.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+import asyncio
+from pyring import (
+    RingBuffer,
+    WaitingBlockingRingBuffer,
+    SingleProducerDisruptor,
+    MultiProducerDisruptor,
+    AsyncDisruptor,
+    SequenceNotFound,
+    ReadCursorBlock,
+)
+
+
+class TestMetrics(unittest.TestCase):
+    def test_disabled_by_default(self):
+        ring_buffer = RingBuffer()
+        self.assertEqual(ring_buffer._put.__name__, "_put_int_cursor")
+        with self.assertRaises(RuntimeError):
+            ring_buffer.stats()
+
+    def test_counts_puts_and_gets(self):
+        ring_buffer = RingBuffer(size=4)
+        ring_buffer.enable_metrics()
+        ring_buffer.put(0)
+        ring_buffer.put_many([1, 2])
+        ring_buffer.get(0)
+        ring_buffer.get_latest()
+
+        stats = ring_buffer.stats()
+        self.assertEqual((stats["cursor"], stats["puts"], stats["gets"]), (3, 3, 2))
+        self.assertGreater(stats["puts_per_sec"], 0)
+
+        ring_buffer.disable_metrics()
+        self.assertEqual(ring_buffer._put.__name__, "_put_int_cursor")
+
+    def test_waiting_ring_buffer_waits_and_timeouts(self):
+        ring_buffer = WaitingBlockingRingBuffer(size=2)
+        ring_buffer.enable_metrics()
+        with self.assertRaises(SequenceNotFound):
+            ring_buffer.next(timeout=0.01)
+        ring_buffer.put_many([0, 1])
+        with self.assertRaises(ReadCursorBlock):
+            ring_buffer.put(2, timeout=0.01)
+        ring_buffer.next_batch(1)
+
+        stats = ring_buffer.stats()
+        self.assertEqual(stats["lag"], 1)
+        self.assertEqual((stats["puts"], stats["gets"]), (2, 1))
+        self.assertEqual((stats["consumer_waits"], stats["consumer_timeouts"]), (1, 1))
+        self.assertEqual((stats["producer_waits"], stats["producer_timeouts"]), (1, 1))
+        self.assertGreater(stats["producer_wait_time"], 0)
+
+    def test_disruptor_reports_gating_subscriber(self):
+        disruptor = SingleProducerDisruptor(size=2)
+        fast = disruptor.subscribe()
+        disruptor.enable_metrics()
+        slow = disruptor.subscribe()
+
+        disruptor.put_many([0, 1])
+        fast.next_batch(2)
+        with self.assertRaises(ReadCursorBlock):
+            disruptor.put(2, timeout=0.01)
+        with self.assertRaises(SequenceNotFound):
+            fast.next(timeout=0.01)
+
+        stats = disruptor.stats()
+        fast_stats, slow_stats = stats["subscribers"]
+        self.assertEqual((fast_stats["lag"], slow_stats["lag"]), (0, 2))
+        self.assertEqual(slow_stats["producer_timeouts"], 1)
+        self.assertEqual(fast_stats["producer_timeouts"], 0)
+        self.assertEqual(fast_stats["consumer_timeouts"], 1)
+        self.assertEqual(stats["producer_timeouts"], 1)
+        self.assertEqual(stats["consumer_timeouts"], 1)
+
+    def test_multi_producer_counts_claims(self):
+        disruptor = MultiProducerDisruptor(size=4)
+        disruptor.enable_metrics()
+        subscriber = disruptor.subscribe()
+        disruptor.put(0)
+        disruptor.put_many([1, 2])
+        subscriber.next_batch(4)
+
+        stats = disruptor.stats()
+        self.assertEqual((stats["puts"], stats["gets"]), (3, 3))
+
+    def test_async_disruptor_records_waits(self):
+        async def main():
+            disruptor = AsyncDisruptor(size=2)
+            disruptor.enable_metrics()
+            subscriber = disruptor.subscribe()
+            with self.assertRaises(SequenceNotFound):
+                await subscriber.next(timeout=0.01)
+            await disruptor.put_many([0, 1])
+            with self.assertRaises(ReadCursorBlock):
+                await disruptor.put(2, timeout=0.01)
+            return disruptor.stats()
+
+        stats = asyncio.run(main())
+        self.assertEqual(stats["consumer_timeouts"], 1)
+        self.assertEqual(stats["producer_timeouts"], 1)
+        self.assertEqual(stats["subscribers"][0]["lag"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import unittest
+import threading
+
+from pyring import (
+    MultiProducerDisruptor,
+    DisruptorSubscriber,
+    SequenceNotFound,
+    ReadCursorBlock,
+    Empty,
+)
+
+
+class TestMultiProducerDisruptor(unittest.TestCase):
+    def test_accepts_valid_sizes(self):
+        with self.assertRaises(AttributeError):
+            MultiProducerDisruptor(size=5)
+        self.assertIsInstance(MultiProducerDisruptor(size=4), MultiProducerDisruptor)
+
+    def test_sync_read_and_write(self):
+        disruptor = MultiProducerDisruptor(size=2)
+        subscriber = disruptor.subscribe()
+        for i in range(10):
+            disruptor.put(i ** 2, timeout=0.01)
+            sequence, res = subscriber.next(timeout=0.01)
+            self.assertEqual(res, i ** 2)
+            self.assertEqual(sequence, i)
+
+    def test_single_sub_cannot_write_over_read_cursor(self):
+        disruptor = MultiProducerDisruptor(size=4)
+        _subscriber = disruptor.subscribe()
+
+        disruptor.put_many(range(4))
+        with self.assertRaises(ReadCursorBlock):
+            disruptor.put(4, timeout=0.05)
+
+    def test_unpublished_sequences_are_not_visible(self):
+        disruptor = MultiProducerDisruptor(size=4)
+        subscriber = disruptor.subscribe()
+
+        first = disruptor._claim(1)
+        second = disruptor._claim(1)
+
+        # publishing out of order does not expose the gap
+        disruptor._write(second, "second")
+        disruptor._publish(second, second + 1)
+        with self.assertRaises(SequenceNotFound):
+            subscriber.next(timeout=0.05)
+        with self.assertRaises(SequenceNotFound):
+            subscriber.next_batch(4, timeout=0.05)
+
+        disruptor._write(first, "first")
+        disruptor._publish(first, first + 1)
+        self.assertEqual(subscriber.next_batch(4), (0, ["first", "second"]))
+
+    def test_start_at_latest_skips_unpublished_claims(self):
+        disruptor = MultiProducerDisruptor(size=4)
+        with self.assertRaises(Empty):
+            disruptor.subscribe(start_at_latest=True)
+
+        disruptor.put_many(range(2))
+        claimed = disruptor._claim(1)
+
+        subscriber = disruptor.subscribe(start_at_latest=True)
+        self.assertEqual(subscriber.next(timeout=0.01), (1, 1))
+
+        disruptor._write(claimed, 2)
+        disruptor._publish(claimed, claimed + 1)
+        self.assertEqual(subscriber.next(timeout=0.01), (2, 2))
+
+    def test_put_many_rejects_batches_larger_than_ring(self):
+        disruptor = MultiProducerDisruptor(size=4)
+        with self.assertRaises(ValueError):
+            disruptor.put_many(range(5))
+
+    def test_concurrent_producers(self):
+        disruptor = MultiProducerDisruptor(size=8)
+        subscribers = [disruptor.subscribe() for _ in range(2)]
+
+        number_of_producers = 4
+        puts_per_producer = 250
+        total = number_of_producers * puts_per_producer
+
+        def producer(producer_id: int):
+            for i in range(puts_per_producer):
+                disruptor.put((producer_id, i), timeout=1)
+
+        received = [[] for _ in subscribers]
+
+        def consumer(idx: int, subscriber: DisruptorSubscriber):
+            while len(received[idx]) < total:
+                _, values = subscriber.next_batch(16, timeout=1)
+                received[idx].extend(values)
+
+        threads = [
+            threading.Thread(target=consumer, args=(idx, subscriber))
+            for idx, subscriber in enumerate(subscribers)
+        ] + [
+            threading.Thread(target=producer, args=(producer_id,))
+            for producer_id in range(number_of_producers)
+        ]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for values in received:
+            self.assertEqual(len(values), total)
+            for producer_id in range(number_of_producers):
+                # each producer's values arrive exactly once and in order
+                self.assertEqual(
+                    [i for pid, i in values if pid == producer_id],
+                    list(range(puts_per_producer)),
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+from pyring import (
+    RingBuffer,
+    BlockingRingBuffer,
+    WaitingBlockingRingBuffer,
+    SingleProducerDisruptor,
+    MultiProducerDisruptor,
+    RingFactory,
+    ReadCursorBlock,
+    SequenceNotFound,
+)
+
+
+class TradeFactory(RingFactory):
+    def __init__(self):
+        self.price = 0.0
+        self.quantity = 0
+
+    def get(self):
+        return (self.price, self.quantity)
+
+    def set(self, value):
+        self.price, self.quantity = value
+
+
+def fill_trade(slot: TradeFactory, sequence: int, price: float, quantity: int):
+    slot.price = price
+    slot.quantity = quantity
+
+
+class TestPutWith(unittest.TestCase):
+    def test_fills_preallocated_slots_in_place(self):
+        ring_buffer = RingBuffer(size=2, factory=TradeFactory)
+        slots = [ring_buffer.put_with(fill_trade, 1.5, i) for i in range(3)]
+        self.assertEqual(slots, [0, 1, 2])
+        self.assertEqual(ring_buffer.get(2), (2, (1.5, 2)))
+
+        # the slot objects are reused, not replaced
+        _, first = ring_buffer.get_slot(1)
+        ring_buffer.put_with(fill_trade, 2.5, 3)
+        _, second = ring_buffer.get_slot(3)
+        self.assertIs(first, second)
+        self.assertEqual((second.price, second.quantity), (2.5, 3))
+
+    def test_translator_receives_sequence(self):
+        ring_buffer = RingBuffer(size=4)
+        sequences = []
+
+        def translator(slot, sequence):
+            sequences.append(sequence)
+            slot.set(sequence * 10)
+
+        ring_buffer.put_with(translator)
+        ring_buffer.put_with(translator)
+        self.assertEqual(sequences, [0, 1])
+        self.assertEqual(ring_buffer.get_latest(), (1, 10))
+
+    def test_blocking_ring_buffer(self):
+        ring_buffer = BlockingRingBuffer(size=2, factory=TradeFactory)
+        ring_buffer.put_with(fill_trade, 1.0, 1)
+        ring_buffer.put_with(fill_trade, 2.0, 2)
+        with self.assertRaises(ReadCursorBlock):
+            ring_buffer.put_with(fill_trade, 3.0, 3)
+
+        sequence, slot = ring_buffer.next_slot()
+        self.assertEqual((sequence, slot.price), (0, 1.0))
+
+    def test_waiting_ring_buffer(self):
+        ring_buffer = WaitingBlockingRingBuffer(size=2, factory=TradeFactory)
+        ring_buffer.put_with(fill_trade, 1.0, 1)
+        ring_buffer.put_with(fill_trade, 2.0, 2)
+        with self.assertRaises(ReadCursorBlock):
+            ring_buffer.put_with(fill_trade, 3.0, 3, timeout=0.01)
+
+        self.assertEqual(ring_buffer.next_slot()[1].quantity, 1)
+        self.assertEqual(ring_buffer.next_slot()[1].quantity, 2)
+        with self.assertRaises(SequenceNotFound):
+            ring_buffer.next_slot(timeout=0.01)
+
+    def test_disruptors(self):
+        for disruptor_type in (SingleProducerDisruptor, MultiProducerDisruptor):
+            with self.subTest(disruptor_type=disruptor_type):
+                disruptor = disruptor_type(size=2, factory=TradeFactory)
+                subscriber = disruptor.subscribe()
+                disruptor.put_with(fill_trade, 1.0, 1)
+                disruptor.put_with(fill_trade, 2.0, 2)
+                with self.assertRaises(ReadCursorBlock):
+                    disruptor.put_with(fill_trade, 3.0, 3, timeout=0.01)
+
+                sequence, slot = subscriber.next_slot()
+                self.assertEqual((sequence, slot.get()), (0, (1.0, 1)))
+                disruptor.put_with(fill_trade, 3.0, 3, timeout=0.01)
+                self.assertEqual(subscriber.next_batch(2), (1, [(2.0, 2), (3.0, 3)]))
+
+    def test_counted_by_metrics(self):
+        ring_buffer = RingBuffer(size=2)
+        ring_buffer.enable_metrics()
+        ring_buffer.put_with(lambda slot, sequence: slot.set(sequence))
+        ring_buffer.get_slot(0)
+        stats = ring_buffer.stats()
+        self.assertEqual((stats["puts"], stats["gets"]), (1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
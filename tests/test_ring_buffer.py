@@ -1,5 +1,8 @@
 import unittest
 import typing
+import threading
+import multiprocessing
+import pickle
 from pyring import (
     RingBuffer,
     LockedRingBuffer,
@@ -92,9 +95,146 @@ def construct_test_case(ring_class: typing.Type[RingBuffer]):
             with self.assertRaises(Empty):
                 ring_buffer.get_latest()
 
+        def test_put_many(self):
+            ring_buffer = self.ring_buffer(size=4)
+            ring_buffer.put(0)
+            first_sequence = ring_buffer.put_many(range(1, 4))
+
+            self.assertEqual(first_sequence, 1)
+            self.assertEqual(ring_buffer.get_latest(), (3, 3))
+            for i in range(4):
+                self.assertEqual(ring_buffer.get(i), (i, i))
+
+        def test_put_many_wraps_and_overwrites(self):
+            ring_buffer = self.ring_buffer(size=4)
+            ring_buffer.put_many(range(6))
+
+            with self.assertRaises(SequenceOverwritten):
+                ring_buffer.get(1)
+            self.assertEqual(ring_buffer.get(2), (2, 2))
+            self.assertEqual(ring_buffer.get_latest(), (5, 5))
+
+        def test_get_range(self):
+            ring_buffer = self.ring_buffer(size=4)
+            ring_buffer.put_many(range(6))
+            self.assertEqual(ring_buffer.get_range(2, 6), (2, [2, 3, 4, 5]))
+            self.assertEqual(ring_buffer.get_range(3, 3), (3, []))
+
+            with self.assertRaises(SequenceNotFound):
+                ring_buffer.get_range(4, 7)
+
+            with self.assertRaises(SequenceOverwritten) as context:
+                ring_buffer.get_range(0, 4)
+            self.assertEqual(context.exception.sequence, 0)
+            self.assertEqual(context.exception.oldest, 2)
+            self.assertEqual(context.exception.lag, 2)
+
+        def test_iter_from(self):
+            ring_buffer = self.ring_buffer(size=4)
+            ring_buffer.put_many(range(3))
+            pairs = ring_buffer.iter_from(1)
+            # later puts don't change a span already taken
+            ring_buffer.put(3)
+            self.assertEqual(list(pairs), [(1, 1), (2, 2)])
+
+            ring_buffer.put_many(range(4, 8))
+            with self.assertRaises(SequenceOverwritten):
+                ring_buffer.iter_from(3)
+
+        def test_snapshot_and_iter(self):
+            ring_buffer = self.ring_buffer(size=4)
+            self.assertEqual(ring_buffer.snapshot(), (0, []))
+
+            ring_buffer.put_many(range(3))
+            self.assertEqual(ring_buffer.snapshot(), (0, [0, 1, 2]))
+            ring_buffer.put_many(range(3, 6))
+            self.assertEqual(ring_buffer.snapshot(), (2, [2, 3, 4, 5]))
+            self.assertEqual(list(ring_buffer), [(2, 2), (3, 3), (4, 4), (5, 5)])
+
     return GenericTestRingBuffer
 
 
+class CountingLock:
+    def __init__(self):
+        self.acquired = 0
+        self._lock = threading.RLock()
+
+    def __enter__(self):
+        self.acquired += 1
+        return self._lock.__enter__()
+
+    def __exit__(self, *args):
+        return self._lock.__exit__(*args)
+
+
+def put_from_child(ring_buffer, value):
+    ring_buffer.put(value)
+
+
+class TestRingBufferSpecialization(unittest.TestCase):
+    def test_lockless_int_cursor_uses_fast_path(self):
+        ring_buffer = RingBuffer()
+        self.assertEqual(ring_buffer._put.__name__, "_put_int_cursor")
+        self.assertEqual(ring_buffer._get.__name__, "_get_int_cursor")
+
+    def test_locked_ring_takes_lock(self):
+        lock = CountingLock()
+        ring_buffer = RingBuffer(lock=lock)
+        ring_buffer.put(1)
+        ring_buffer.get(0)
+        self.assertEqual(lock.acquired, 2)
+
+    def test_range_reads_take_lock_once(self):
+        lock = CountingLock()
+        ring_buffer = RingBuffer(size=1024, lock=lock)
+        ring_buffer.put_many(range(1000))
+        lock.acquired = 0
+        ring_buffer.get_range(0, 1000)
+        list(ring_buffer.iter_from(500))
+        ring_buffer.snapshot()
+        self.assertEqual(lock.acquired, 3)
+
+    def test_shared_value_cursor(self):
+        cursor_position_value = multiprocessing.Value("l", 0, lock=False)
+        ring_buffer = RingBuffer(size=4, cursor_position_value=cursor_position_value)
+        for i in range(6):
+            ring_buffer.put(i)
+        self.assertEqual(cursor_position_value.value, 6)
+        self.assertEqual(ring_buffer.get_latest(), (5, 5))
+        with self.assertRaises(SequenceOverwritten):
+            ring_buffer.get(1)
+
+    def test_subclass_overrides_are_not_replaced(self):
+        class CustomRingBuffer(RingBuffer):
+            def _get(self, idx):
+                return (idx, "custom")
+
+        ring_buffer = CustomRingBuffer()
+        ring_buffer.put(1)
+        self.assertEqual(ring_buffer.get(0), (0, "custom"))
+
+    def test_pickle_round_trip(self):
+        ring_buffer = RingBuffer(size=4)
+        ring_buffer.put(1)
+        restored = pickle.loads(pickle.dumps(ring_buffer))
+        self.assertIsInstance(restored, RingBuffer)
+        self.assertEqual(restored.get_latest(), (0, 1))
+        restored.put(2)
+        self.assertEqual(restored.get_latest(), (1, 2))
+
+    def test_locked_ring_passes_to_spawned_process(self):
+        ctx = multiprocessing.get_context("spawn")
+        ring_buffer = LockedRingBuffer(
+            lock=ctx.RLock(), cursor_position_value=ctx.Value("l", 0)
+        )
+        process = ctx.Process(target=put_from_child, args=(ring_buffer, "child"))
+        process.start()
+        process.join(timeout=30)
+        self.assertEqual(process.exitcode, 0)
+        # the cursor is shared, the slots are the child's own copy
+        self.assertEqual(ring_buffer._get_cursor_position(), 1)
+
+
 ring_buffer_test = construct_test_case(RingBuffer)  # type: typing.Any
 
 
@@ -45,6 +45,16 @@ class TestRingFactory(unittest.TestCase):
         simple_factory.set(1)
         self.assertEqual(simple_factory.get(), 1)
 
+    def test_create_many_and_reset(self):
+        """Test to check the default bulk allocation and reset hooks"""
+        slots = SimpleFactory.create_many(3)
+        self.assertEqual(len(slots), 3)
+        self.assertEqual(len({id(slot) for slot in slots}), 3)
+
+        slots[0].set(1)
+        slots[0].reset()
+        self.assertIsNone(slots[0].get())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,156 @@
+import unittest
+import multiprocessing as mp
+import os
+import sys
+from pyring import (
+    SharedMemoryDisruptor,
+    SharedMemorySubscriber,
+    SequenceNotFound,
+    SequenceOverwritten,
+    ReadCursorBlock,
+)
+
+RECORDS = 1000
+
+
+def consumer_routine(subscriber: SharedMemorySubscriber, total):
+    expected = 0
+    while expected < RECORDS:
+        sequence, views = subscriber.next_batch(max_items=8, timeout=5)
+        for offset, view in enumerate(views):
+            if sequence + offset != expected:
+                return
+            if int.from_bytes(view, "little") != expected:
+                return
+            expected += 1
+            view.release()
+    total.value = expected
+    subscriber.close()
+
+
+def producer_routine(disruptor: SharedMemoryDisruptor):
+    for i in range(RECORDS):
+        disruptor.put(i.to_bytes(8, "little"), timeout=5)
+    disruptor.close()
+
+
+@unittest.skipIf(
+    sys.version_info < (3, 8) or not hasattr(os, "mkfifo"),
+    "requires shared_memory and named pipes",
+)
+class TestSharedMemoryDisruptor(unittest.TestCase):
+    def setUp(self):
+        self.disruptor = SharedMemoryDisruptor(size=4, slot_size=8, max_subscribers=2)
+
+    def tearDown(self):
+        self.disruptor.close()
+        self.disruptor.unlink()
+
+    def test_accepts_valid_sizes(self):
+        with self.assertRaises(AttributeError):
+            SharedMemoryDisruptor(size=5)
+
+    def test_put_and_next(self):
+        subscriber = self.disruptor.subscribe()
+        with self.assertRaises(SequenceNotFound):
+            subscriber.next(timeout=0.01)
+
+        self.disruptor.put(b"a")
+        self.disruptor.put_many([b"bb", b"ccc"])
+        sequence, view = subscriber.next()
+        self.assertEqual((sequence, bytes(view)), (0, b"a"))
+        view.release()
+
+        sequence, views = subscriber.next_batch(max_items=8)
+        self.assertEqual((sequence, [bytes(v) for v in views]), (1, [b"bb", b"ccc"]))
+        for view in views:
+            view.release()
+
+    def test_subscribers_start_at_cursor(self):
+        self.disruptor.put(b"a")
+        subscriber = self.disruptor.subscribe()
+        self.disruptor.put(b"b")
+        sequence, view = subscriber.next()
+        self.assertEqual((sequence, bytes(view)), (1, b"b"))
+        view.release()
+
+    def test_subscriber_gates_producer(self):
+        subscriber = self.disruptor.subscribe()
+        self.disruptor.put_many([bytes([i]) for i in range(4)])
+        with self.assertRaises(ReadCursorBlock):
+            self.disruptor.put(b"x", timeout=0.01)
+
+        # the slot handed out by next() stays gated until the following read
+        _, view = subscriber.next()
+        view.release()
+        with self.assertRaises(ReadCursorBlock):
+            self.disruptor.put(b"x", timeout=0.01)
+
+        _, view = subscriber.next()
+        view.release()
+        self.assertEqual(self.disruptor.put(b"x", timeout=0.01), 4)
+
+    def test_put_many_is_all_or_nothing(self):
+        self.disruptor.subscribe()
+        self.disruptor.put_many([b"a", b"b", b"c"])
+        with self.assertRaises(ReadCursorBlock):
+            self.disruptor.put_many([b"d", b"e"], timeout=0.01)
+        self.assertEqual(self.disruptor._get_cursor_position(), 3)
+
+        with self.assertRaises(ValueError):
+            self.disruptor.put_many([b"x"] * 5)
+
+    def test_unregister_releases_producer(self):
+        subscriber = self.disruptor.subscribe()
+        self.disruptor.put_many([bytes([i]) for i in range(4)])
+        subscriber.unregister()
+        self.assertEqual(self.disruptor.put(b"x", timeout=0.01), 4)
+
+        # the freed entry can be reused
+        self.disruptor.subscribe()
+        self.disruptor.subscribe()
+        with self.assertRaises(ValueError):
+            self.disruptor.subscribe()
+
+    def test_get_copies_and_checks_for_overwrite(self):
+        self.disruptor.put_many([bytes([i]) for i in range(4)])
+        self.assertEqual(self.disruptor.get(1), (1, b"\x01"))
+        with self.assertRaises(SequenceNotFound):
+            self.disruptor.get(4)
+
+        self.disruptor.put(b"x")
+        with self.assertRaises(SequenceOverwritten):
+            self.disruptor.get(1)
+
+    def test_subscribe_only_in_creating_process(self):
+        attached = SharedMemoryDisruptor.attach(self.disruptor.name)
+        with self.assertRaises(RuntimeError):
+            attached.subscribe()
+        attached.close()
+
+    def test_subscriber_in_other_process(self):
+        subscriber = self.disruptor.subscribe()
+        total = mp.Value("q", 0)
+        proc = mp.Process(target=consumer_routine, args=(subscriber, total))
+        proc.start()
+        for i in range(RECORDS):
+            self.disruptor.put(i.to_bytes(8, "little"), timeout=5)
+        proc.join(timeout=10)
+
+        self.assertEqual(total.value, RECORDS)
+
+    def test_producer_and_subscriber_in_other_processes(self):
+        subscriber = self.disruptor.subscribe()
+        total = mp.Value("q", 0)
+        consumer = mp.Process(target=consumer_routine, args=(subscriber, total))
+        producer = mp.Process(target=producer_routine, args=(self.disruptor,))
+        consumer.start()
+        producer.start()
+        producer.join(timeout=10)
+        consumer.join(timeout=10)
+
+        self.assertEqual(total.value, RECORDS)
+
+
+if __name__ == "__main__":
+    unittest.main()
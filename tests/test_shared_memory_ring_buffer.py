@@ -0,0 +1,130 @@
+import unittest
+import multiprocessing as mp
+import pickle
+import sys
+from pyring import (
+    SharedMemoryRingBuffer,
+    Empty,
+    SequenceOverwritten,
+    SequenceNotFound,
+)
+
+
+def producer_routine(ring_buffer: SharedMemoryRingBuffer):
+    for i in range(10):
+        ring_buffer.put(i.to_bytes(4, "little"))
+    ring_buffer.close()
+
+
+@unittest.skipIf(sys.version_info < (3, 8), "shared_memory requires python 3.8")
+class TestSharedMemoryRingBuffer(unittest.TestCase):
+    def setUp(self):
+        self.ring_buffer = SharedMemoryRingBuffer(size=4, slot_size=8)
+
+    def tearDown(self):
+        self.ring_buffer.close()
+        self.ring_buffer.unlink()
+
+    def test_accepts_valid_sizes(self):
+        with self.assertRaises(AttributeError):
+            SharedMemoryRingBuffer(size=5)
+
+    def test_cannot_read_ahead_of_cursor(self):
+        with self.assertRaises(Empty):
+            self.ring_buffer.get_latest()
+
+        with self.assertRaises(SequenceNotFound):
+            self.ring_buffer.get(0)
+
+        self.ring_buffer.put(b"a")
+        with self.assertRaises(SequenceNotFound):
+            self.ring_buffer.get(1)
+
+    def test_cannot_read_when_overwritten(self):
+        for i in range(5):
+            self.ring_buffer.put(bytes([i]))
+
+        with self.assertRaises(SequenceOverwritten):
+            self.ring_buffer.get(0)
+
+    def test_can_read_and_write(self):
+        for i in range(10):
+            self.ring_buffer.put(b"x" * (i % 8))
+            sequence, res = self.ring_buffer.get(i)
+            self.assertIsInstance(res, memoryview)
+            self.assertEqual(bytes(res), b"x" * (i % 8))
+            self.assertEqual(sequence, i)
+            res.release()
+
+    def test_rejects_values_larger_than_slot(self):
+        with self.assertRaises(ValueError):
+            self.ring_buffer.put(b"x" * 9)
+
+    def test_put_many(self):
+        self.assertEqual(self.ring_buffer.put_many([b"a", b"bb", b"ccc"]), 0)
+        sequence, res = self.ring_buffer.get_latest()
+        self.assertEqual((sequence, bytes(res)), (2, b"ccc"))
+        res.release()
+
+    def test_get_range(self):
+        self.ring_buffer.put_many([b"a", b"bb", b"ccc", b"d", b"e"])
+        start, views = self.ring_buffer.get_range(2, 5)
+        self.assertEqual(
+            (start, [bytes(view) for view in views]), (2, [b"ccc", b"d", b"e"])
+        )
+        for view in views:
+            view.release()
+
+        with self.assertRaises(SequenceNotFound):
+            self.ring_buffer.get_range(4, 6)
+        with self.assertRaises(SequenceOverwritten) as overwritten:
+            self.ring_buffer.get_range(0, 2)
+        self.assertEqual(overwritten.exception.lag, 1)
+
+    def test_locked_reads(self):
+        lock = mp.Lock()
+        with SharedMemoryRingBuffer(size=4, slot_size=8, lock=lock) as ring_buffer:
+            ring_buffer.put_many([b"a", b"b"])
+            self.assertEqual(bytes(ring_buffer.get(1)[1]), b"b")
+            self.assertEqual(len(ring_buffer.get_range(0, 2)[1]), 2)
+            self.assertEqual(bytes(ring_buffer.get_latest()[1]), b"b")
+
+    def test_flush(self):
+        self.ring_buffer.put(b"a")
+        self.ring_buffer.flush()
+        with self.assertRaises(Empty):
+            self.ring_buffer.get_latest()
+
+    def test_attach_by_name(self):
+        attached = SharedMemoryRingBuffer.attach(self.ring_buffer.name)
+        self.assertEqual(attached.ring_size, 4)
+        self.assertEqual(attached.slot_size, 8)
+
+        self.ring_buffer.put(b"hello")
+        _, res = attached.get(0)
+        self.assertEqual(bytes(res), b"hello")
+        res.release()
+        attached.close()
+
+    def test_pickles_by_name(self):
+        attached = pickle.loads(pickle.dumps(self.ring_buffer))
+        self.assertEqual(attached.name, self.ring_buffer.name)
+        attached.put(b"abc")
+        _, res = self.ring_buffer.get(0)
+        self.assertEqual(bytes(res), b"abc")
+        res.release()
+        attached.close()
+
+    def test_multiprocess_producer(self):
+        proc = mp.Process(target=producer_routine, args=(self.ring_buffer,))
+        proc.start()
+        proc.join()
+
+        for i in range(6, 10):
+            sequence, res = self.ring_buffer.get(i)
+            self.assertEqual(int.from_bytes(res, "little"), i)
+            res.release()
+
+
+if __name__ == "__main__":
+    unittest.main()
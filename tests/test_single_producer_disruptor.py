@@ -151,6 +151,77 @@ class TestSingleProducerDisruptor(unittest.TestCase):
         thread.join()
         self.assertEqual(final_val, 3)
 
+    def test_put_many_and_next_batch(self):
+        disruptor = SingleProducerDisruptor(size=4)
+        subscriber_one = disruptor.subscribe()
+        subscriber_two = disruptor.subscribe()
+
+        self.assertEqual(disruptor.put_many(range(4)), 0)
+
+        self.assertEqual(subscriber_one.next_batch(8), (0, [0, 1, 2, 3]))
+        self.assertEqual(subscriber_two.next_batch(3), (0, [0, 1, 2]))
+
+        # subscriber two gates the producer
+        with self.assertRaises(ReadCursorBlock):
+            disruptor.put_many(range(4, 8), timeout=0.05)
+
+        # nothing of the timed out batch was written
+        self.assertEqual(subscriber_two.next_batch(8), (3, [3]))
+        with self.assertRaises(SequenceNotFound):
+            subscriber_one.next_batch(8, timeout=0.01)
+
+        with self.assertRaises(ValueError):
+            disruptor.put_many(range(5))
+
+    def test_put_many_with_slow_consumer(self):
+        disruptor = SingleProducerDisruptor(size=4)
+        subscriber = disruptor.subscribe()
+
+        received = []
+
+        def worker(subscriber: DisruptorSubscriber):
+            while len(received) < 16:
+                time.sleep(0.01)
+                _, values = subscriber.next_batch(3, timeout=1)
+                received.extend(values)
+
+        thread = threading.Thread(target=worker, args=(subscriber,))
+        thread.start()
+
+        for i in range(0, 16, 4):
+            disruptor.put_many(range(i, i + 4), timeout=1)
+
+        thread.join()
+        self.assertEqual(received, list(range(16)))
+
+    def test_late_subscriber_starts_at_oldest_retained_sequence(self):
+        disruptor = SingleProducerDisruptor(size=4)
+        for i in range(10):
+            disruptor.put(i)
+
+        subscriber = disruptor.subscribe()
+        self.assertEqual(subscriber.next(timeout=0.01), (6, 6))
+
+        # the late subscriber now gates the producer, one slot is free
+        with self.assertRaises(ReadCursorBlock):
+            disruptor.put_many([10, 11, 12], timeout=0.01)
+
+    def test_many_subscribers_gate_and_unregister(self):
+        disruptor = SingleProducerDisruptor(size=4)
+        subscribers = [disruptor.subscribe() for _ in range(64)]
+
+        disruptor.put_many(range(4))
+        for subscriber in subscribers[:-1]:
+            subscriber.next_batch(4)
+
+        # the one subscriber that hasn't read still gates the producer
+        with self.assertRaises(ReadCursorBlock):
+            disruptor.put(4, timeout=0.01)
+
+        subscribers[-1].unregister()
+        self.assertEqual(len(disruptor._subscribers), 63)
+        disruptor.put(4, timeout=0.01)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+import ctypes
+import multiprocessing as mp
+from pyring import LockedRingBuffer, RingBuffer, SlabFactory, SequenceOverwritten
+
+
+class Quote(ctypes.Structure):
+    _fields_ = [("bid", ctypes.c_double), ("ask", ctypes.c_double)]
+
+
+class IntSlab(SlabFactory):
+    ctype = "q"
+
+
+class StripedIntSlab(SlabFactory):
+    ctype = ctypes.c_int64
+    lock_stripes = 2
+
+
+class QuoteSlab(SlabFactory):
+    ctype = Quote
+
+
+def worker_routine(ring_buffer: LockedRingBuffer):
+    for i in range(10):
+        ring_buffer.put(i)
+
+
+class TestSlabFactory(unittest.TestCase):
+    def test_slots_share_one_slab(self):
+        slots = IntSlab.create_many(4)
+        self.assertEqual(len({id(slot._slab) for slot in slots}), 1)
+        for index, slot in enumerate(slots):
+            slot.set(index * 10)
+        self.assertEqual(list(slots[0]._slab), [0, 10, 20, 30])
+
+    def test_ring_buffer(self):
+        for factory in (SlabFactory, IntSlab, StripedIntSlab):
+            ring_buffer = RingBuffer(size=4, factory=factory)
+            for i in range(6):
+                ring_buffer.put(i)
+            self.assertEqual(ring_buffer.get(5), (5, 5))
+            with self.assertRaises(SequenceOverwritten):
+                ring_buffer.get(1)
+
+    def test_lock_stripes(self):
+        slots = StripedIntSlab.create_many(4)
+        self.assertIs(slots[0]._lock, slots[2]._lock)
+        self.assertIsNot(slots[0]._lock, slots[1]._lock)
+        self.assertIsNone(IntSlab.create_many(1)[0]._lock)
+
+    def test_structures(self):
+        ring_buffer = RingBuffer(size=4, factory=QuoteSlab)
+        ring_buffer.put((1.0, 1.5))
+        ring_buffer.put(Quote(2.0, 2.5))
+        self.assertEqual(ring_buffer.get(0), (0, (1.0, 1.5)))
+        self.assertEqual(ring_buffer.get(1), (1, (2.0, 2.5)))
+
+    def test_shared_with_other_process(self):
+        lock = mp.RLock()
+        ring_buffer = LockedRingBuffer(
+            size=16,
+            factory=StripedIntSlab,
+            lock=lock,
+            cursor_position_value=mp.Value("q", 0, lock=lock),
+        )
+        process = mp.Process(target=worker_routine, args=(ring_buffer,))
+        process.start()
+        process.join(timeout=30)
+
+        self.assertEqual(process.exitcode, 0)
+        self.assertEqual(ring_buffer.get_range(0, 10), (0, list(range(10))))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,212 @@
+import unittest
+import threading
+import typing
+import multiprocessing as mp
+from pyring import (
+    RingBuffer,
+    LockedRingBuffer,
+    WaitingBlockingRingBuffer,
+    SingleProducerDisruptor,
+    RingFactory,
+    SimpleFactory,
+    Empty,
+)
+
+
+class CountingFactory(SimpleFactory):
+    created = 0
+    bulk_calls = 0
+    resets = 0
+
+    def __init__(self):
+        super().__init__()
+        type(self).created += 1
+
+    @classmethod
+    def create_many(cls, count: int) -> typing.List[RingFactory]:
+        cls.bulk_calls += 1
+        return super().create_many(count)
+
+    def reset(self):
+        super().reset()
+        type(self).resets += 1
+
+
+class LazyFactory(CountingFactory):
+    lazy = True
+
+
+class NoResetFactory(RingFactory):
+    def __init__(self):
+        self.value = None
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+class DuckFactory:
+    def __init__(self):
+        self.value = None
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+class SharedSlot(RingFactory):
+    def __init__(self):
+        self.value = mp.Value("i", lock=False)
+
+    def get(self):
+        return self.value.value
+
+    def set(self, value):
+        self.value.value = value
+
+
+def read_and_write_routine(ring_buffer):
+    assert ring_buffer.get_latest() == (1, 101)
+    ring_buffer.put(102)
+    ring_buffer.put(103)
+
+
+def fill(slot, sequence, value):
+    slot.set(value)
+
+
+def construct_test_case(ring_buffer_type, **kwargs):
+    class TestSlotAllocation(unittest.TestCase):
+        def factory(self, base):
+            # fresh counters for every test
+            return type(base.__name__, (base,), {"created": 0, "resets": 0})
+
+        def test_eager_slots_are_allocated_in_bulk(self):
+            factory = self.factory(CountingFactory)
+            factory.bulk_calls = 0
+            ring_buffer_type(size=8, factory=factory, **kwargs)
+            self.assertEqual((factory.bulk_calls, factory.created), (1, 8))
+
+        def test_lazy_slots_are_allocated_on_first_write(self):
+            factory = self.factory(LazyFactory)
+            ring_buffer = ring_buffer_type(size=8, factory=factory, **kwargs)
+            self.assertEqual(factory.created, 0)
+
+            ring_buffer.put(1)
+            ring_buffer.put_many([2, 3])
+            ring_buffer.put_with(fill, 4)
+            self.assertEqual(factory.created, 4)
+            self.assertEqual(ring_buffer.get(3), (3, 4))
+
+            ring_buffer.put_many(range(4))
+            ring_buffer.put_many(range(4))
+            self.assertEqual(factory.created, 8)
+
+        def test_flush_reuses_slots(self):
+            for base in (CountingFactory, LazyFactory):
+                factory = self.factory(base)
+                ring_buffer = ring_buffer_type(size=8, factory=factory, **kwargs)
+                ring_buffer.put_many([1, 2, 3])
+                created = factory.created
+
+                ring_buffer.flush()
+                self.assertEqual(factory.created, created)
+                self.assertEqual(factory.resets, created)
+                with self.assertRaises(Empty):
+                    ring_buffer.get_latest()
+
+                ring_buffer.put(4)
+                self.assertEqual(ring_buffer.get_latest(), (0, 4))
+
+        def test_flush_skips_default_reset(self):
+            ring_buffer = ring_buffer_type(size=4, factory=NoResetFactory, **kwargs)
+            ring_buffer.put(1)
+            slot = ring_buffer.get_slot(0)[1]
+            ring_buffer.flush()
+            ring_buffer.put(2)
+            self.assertIs(ring_buffer.get_slot(0)[1], slot)
+
+        def test_factories_without_hooks_are_reallocated(self):
+            ring_buffer = ring_buffer_type(size=4, factory=DuckFactory, **kwargs)
+            ring_buffer.put(1)
+            slot = ring_buffer.get_slot(0)[1]
+            ring_buffer.flush()
+            ring_buffer.put(2)
+            self.assertIsNot(ring_buffer.get_slot(0)[1], slot)
+            self.assertEqual(ring_buffer.get(0), (0, 2))
+
+    return TestSlotAllocation
+
+
+ring_buffer_test = construct_test_case(RingBuffer)  # type: typing.Any
+
+
+class TestRingBufferSlotAllocation(ring_buffer_test):
+    def test_shared_state_allocates_every_slot(self):
+        factory = type("Factory", (LazyFactory,), {"created": 0})
+        ring_buffer = RingBuffer(size=8, factory=factory)
+        ring_buffer.put(1)
+        ring, _ = ring_buffer._get_shared_state()
+        self.assertEqual(factory.created, 8)
+        self.assertEqual(ring[0].get(), 1)
+
+
+locked_ring_buffer_test = construct_test_case(
+    LockedRingBuffer, lock=threading.RLock()
+)  # type: typing.Any
+
+
+class TestLockedRingBufferSlotAllocation(locked_ring_buffer_test):
+    pass
+
+
+class TestSharedSlotAllocation(unittest.TestCase):
+    def test_lazy_factories_need_an_int_cursor(self):
+        with self.assertRaises(ValueError):
+            RingBuffer(
+                size=4, factory=LazyFactory, cursor_position_value=mp.Value("q", 0)
+            )
+
+    def test_slots_shared_with_other_process(self):
+        ring_buffer = RingBuffer(
+            size=4, factory=SharedSlot, cursor_position_value=mp.Value("q", 0)
+        )
+        ring_buffer.put(100)
+        ring_buffer.put(101)
+        process = mp.Process(target=read_and_write_routine, args=(ring_buffer,))
+        process.start()
+        process.join(timeout=30)
+
+        self.assertEqual(process.exitcode, 0)
+        self.assertEqual(
+            [ring_buffer.get(i) for i in range(4)],
+            [(0, 100), (1, 101), (2, 102), (3, 103)],
+        )
+
+
+class TestWaitingBlockingRingBufferSlotAllocation(unittest.TestCase):
+    def test_lazy_slots(self):
+        factory = type("Factory", (LazyFactory,), {"created": 0})
+        ring_buffer = WaitingBlockingRingBuffer(size=4, factory=factory)
+        for i in range(6):
+            ring_buffer.put(i)
+            self.assertEqual(ring_buffer.next(), (i, i))
+        self.assertEqual(factory.created, 4)
+
+
+class TestDisruptorSlotAllocation(unittest.TestCase):
+    def test_lazy_slots(self):
+        factory = type("Factory", (LazyFactory,), {"created": 0})
+        disruptor = SingleProducerDisruptor(size=4, factory=factory)
+        subscriber = disruptor.subscribe()
+        disruptor.put_many([1, 2])
+        self.assertEqual(subscriber.next_batch(), (0, [1, 2]))
+        self.assertEqual(factory.created, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+import unittest
+import threading
+import time
+from pyring import (
+    SPSCRingBuffer,
+    SequenceNotFound,
+    ReadCursorBlock,
+    BlockingWaitStrategy,
+    YieldingWaitStrategy,
+    SleepingWaitStrategy,
+)
+
+
+class TestSPSCRingBuffer(unittest.TestCase):
+    def test_accepts_valid_sizes(self):
+        with self.assertRaises(AttributeError):
+            SPSCRingBuffer(size=5)
+        self.assertIsInstance(SPSCRingBuffer(size=4), SPSCRingBuffer)
+
+    def test_put_and_next(self):
+        ring_buffer = SPSCRingBuffer(size=4)
+        self.assertEqual(ring_buffer.put("a"), 0)
+        self.assertEqual(ring_buffer.put("b"), 1)
+
+        self.assertEqual(ring_buffer.next(), (0, "a"))
+        self.assertEqual(ring_buffer.next(), (1, "b"))
+
+    def test_cannot_read_ahead_of_cursor(self):
+        ring_buffer = SPSCRingBuffer(size=4)
+        ring_buffer.put(0)
+        ring_buffer.next()
+
+        with self.assertRaises(SequenceNotFound):
+            ring_buffer.next(timeout=0.1)
+        with self.assertRaises(SequenceNotFound):
+            ring_buffer.next_batch(timeout=0.1)
+        self.assertEqual(ring_buffer._read_cursor, 1)
+
+    def test_cannot_write_over_read_cursor(self):
+        ring_buffer = SPSCRingBuffer(size=4)
+        for i in range(4):
+            ring_buffer.put(i)
+
+        with self.assertRaises(ReadCursorBlock):
+            ring_buffer.put(4, timeout=0.1)
+
+        ring_buffer.next()
+        self.assertEqual(ring_buffer.put(4, timeout=0.1), 4)
+        self.assertEqual(ring_buffer.next_batch(), (1, [1, 2, 3, 4]))
+
+    def test_next_batch(self):
+        ring_buffer = SPSCRingBuffer(size=8)
+        for i in range(6):
+            ring_buffer.put(i)
+
+        self.assertEqual(ring_buffer.next_batch(max_items=4), (0, [0, 1, 2, 3]))
+        self.assertEqual(ring_buffer.next_batch(), (4, [4, 5]))
+
+    def test_put_many(self):
+        ring_buffer = SPSCRingBuffer(size=4)
+        self.assertEqual(ring_buffer.put_many(range(3)), 0)
+        ring_buffer.next()
+
+        # wraps around the end of the ring
+        self.assertEqual(ring_buffer.put_many([3, 4]), 3)
+        self.assertEqual(ring_buffer.next_batch(), (1, [1, 2, 3, 4]))
+
+        with self.assertRaises(ValueError):
+            ring_buffer.put_many(range(5))
+
+    def test_put_many_is_all_or_nothing(self):
+        ring_buffer = SPSCRingBuffer(size=4)
+        ring_buffer.put_many(range(3))
+
+        with self.assertRaises(ReadCursorBlock):
+            ring_buffer.put_many([3, 4], timeout=0.1)
+        self.assertEqual(ring_buffer._write_cursor, 3)
+        self.assertEqual(ring_buffer.next_batch(), (0, [0, 1, 2]))
+
+    def test_flush(self):
+        ring_buffer = SPSCRingBuffer(size=4)
+        ring_buffer.put_many(range(4))
+        ring_buffer.flush()
+
+        with self.assertRaises(SequenceNotFound):
+            ring_buffer.next(timeout=0.1)
+        self.assertEqual(ring_buffer.put("a"), 0)
+        self.assertEqual(ring_buffer.next(), (0, "a"))
+
+    def test_instances_do_not_share_barriers(self):
+        first, second = SPSCRingBuffer(), SPSCRingBuffer()
+        self.assertIsNot(first._read_cursor_barrier, second._read_cursor_barrier)
+        self.assertIsNot(first._write_cursor_barrier, second._write_cursor_barrier)
+
+    def test_slow_producer_wakes_consumer(self):
+        ring_buffer = SPSCRingBuffer(size=2)
+
+        def worker():
+            for i in range(4):
+                time.sleep(0.05)
+                ring_buffer.put(i)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        values = [ring_buffer.next(timeout=5)[1] for _ in range(4)]
+        thread.join()
+        self.assertEqual(values, [0, 1, 2, 3])
+
+    def test_slow_consumer_wakes_producer(self):
+        ring_buffer = SPSCRingBuffer(size=2)
+        values = []
+
+        def worker():
+            for _ in range(4):
+                time.sleep(0.05)
+                values.append(ring_buffer.next(timeout=5)[1])
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        for i in range(4):
+            ring_buffer.put(i, timeout=5)
+        thread.join()
+        self.assertEqual(values, [0, 1, 2, 3])
+
+    def test_producer_consumer_threads(self):
+        # busy spinning holds the GIL for whole switch intervals, too slow here
+        count = 20000
+        for wait_strategy in (
+            BlockingWaitStrategy(),
+            YieldingWaitStrategy(),
+            SleepingWaitStrategy(),
+        ):
+            with self.subTest(wait_strategy=type(wait_strategy).__name__):
+                ring_buffer = SPSCRingBuffer(size=16, wait_strategy=wait_strategy)
+                received = []
+
+                def consumer():
+                    while len(received) < count:
+                        _, values = ring_buffer.next_batch(timeout=5)
+                        received.extend(values)
+
+                thread = threading.Thread(target=consumer)
+                thread.start()
+                for i in range(0, count, 10):
+                    if i % 20:
+                        ring_buffer.put_many(range(i, i + 10), timeout=5)
+                    else:
+                        for j in range(i, i + 10):
+                            ring_buffer.put(j, timeout=5)
+                thread.join()
+
+                self.assertEqual(received, list(range(count)))
+
+
+if __name__ == "__main__":
+    unittest.main()
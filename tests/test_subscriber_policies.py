@@ -0,0 +1,207 @@
+import unittest
+import threading
+import typing
+from pyring import (
+    SingleProducerDisruptor,
+    MultiProducerDisruptor,
+    OverwritableSubscriber,
+    ObserverSubscriber,
+    BatchEventProcessor,
+    SequenceNotFound,
+    SequenceOverwritten,
+    ReadCursorBlock,
+)
+
+
+def construct_test_case(disruptor_class: typing.Type[SingleProducerDisruptor]):
+    class TestSubscriberPolicies(unittest.TestCase):
+        def setUp(self):
+            self.disruptor = disruptor_class(size=4)
+
+        def test_rejects_unknown_policy(self):
+            with self.assertRaises(ValueError):
+                self.disruptor.subscribe(policy="drop")
+
+        def test_only_blocking_subscribers_have_dependencies(self):
+            blocking = self.disruptor.subscribe()
+            observer = self.disruptor.subscribe(policy="observer")
+            with self.assertRaises(ValueError):
+                self.disruptor.subscribe(policy="overwrite", after=[blocking])
+            with self.assertRaises(ValueError):
+                self.disruptor.subscribe(after=[observer])
+            with self.assertRaises(ValueError):
+                self.disruptor.subscribe(policy="overwrite", conflate=len)
+
+        def test_block_policy_gates_producer(self):
+            subscriber = self.disruptor.subscribe(policy="block")
+            self.disruptor.put_many(range(4))
+            with self.assertRaises(ReadCursorBlock):
+                self.disruptor.put(4, timeout=0.01)
+            self.assertEqual(subscriber.next(), (0, 0))
+
+        def test_overwrite_policy_never_gates(self):
+            subscriber = self.disruptor.subscribe(policy="overwrite")
+            self.assertIsInstance(subscriber, OverwritableSubscriber)
+            self.disruptor.put(0)
+            self.assertEqual(subscriber.next(), (0, 0))
+
+            for i in range(1, 11):
+                self.disruptor.put(i, timeout=0.01)
+
+            with self.assertRaises(SequenceOverwritten) as context:
+                subscriber.next()
+            self.assertEqual(context.exception.sequence, 1)
+            self.assertEqual(context.exception.oldest, 7)
+            self.assertEqual(context.exception.lag, 6)
+            self.assertEqual(subscriber.overwritten, 6)
+
+            # carries on from the oldest retained sequence
+            self.assertEqual(subscriber.next(), (7, 7))
+            self.assertEqual(subscriber.next_batch(max_items=8), (8, [8, 9, 10]))
+            with self.assertRaises(SequenceNotFound):
+                subscriber.next(timeout=0.01)
+
+        def test_overwrite_policy_waits_for_new_sequences(self):
+            subscriber = self.disruptor.subscribe(policy="overwrite")
+            timer = threading.Timer(0.05, self.disruptor.put, args=(1,))
+            timer.start()
+            self.assertEqual(subscriber.next(timeout=5), (0, 1))
+            timer.join()
+
+        def test_observer_policy_reads_latest(self):
+            subscriber = self.disruptor.subscribe(policy="observer")
+            self.assertIsInstance(subscriber, ObserverSubscriber)
+            with self.assertRaises(SequenceNotFound):
+                subscriber.next(timeout=0.01)
+
+            self.disruptor.put_many(range(3))
+            self.assertEqual(subscriber.next(), (2, 2))
+            with self.assertRaises(SequenceNotFound):
+                subscriber.next(timeout=0.01)
+
+            for i in range(3, 20):
+                self.disruptor.put(i, timeout=0.01)
+            self.assertEqual(subscriber.next(), (19, 19))
+
+        def test_producer_is_bounded_by_blocking_subscribers_only(self):
+            blocking = self.disruptor.subscribe()
+            self.disruptor.subscribe(policy="overwrite")
+            self.disruptor.subscribe(policy="observer")
+            for i in range(12):
+                self.disruptor.put(i, timeout=0.01)
+                blocking.next()
+
+        def test_stats(self):
+            self.disruptor.enable_metrics()
+            subscriber = self.disruptor.subscribe(policy="overwrite")
+            self.disruptor.subscribe(policy="observer")
+            self.disruptor.put_many(range(4))
+            self.disruptor.put_many(range(4))
+            with self.assertRaises(SequenceOverwritten):
+                subscriber.next()
+
+            overwriting, observer = self.disruptor.stats()["subscribers"]
+            self.assertEqual(overwriting["policy"], "overwrite")
+            self.assertFalse(overwriting["gating"])
+            self.assertEqual(overwriting["overwritten"], 4)
+            self.assertEqual(observer["policy"], "observer")
+            self.assertNotIn("overwritten", observer)
+
+        def test_processor_reports_overwritten(self):
+            subscriber = self.disruptor.subscribe(policy="overwrite")
+            self.disruptor.put_many(range(4))
+            self.disruptor.put_many(range(4, 8))
+            received = []
+            errors = []
+            done = threading.Event()
+
+            def handler(value, sequence, end_of_batch):
+                received.append(sequence)
+                if sequence == 7:
+                    done.set()
+
+            processor = BatchEventProcessor(
+                subscriber,
+                handler,
+                exception_handler=lambda exception, sequence, value: errors.append(
+                    exception.lag
+                ),
+            )
+            processor.start()
+            self.assertTrue(done.wait(timeout=5))
+            processor.halt(timeout=5)
+
+            self.assertEqual(errors, [4])
+            self.assertEqual(received, [4, 5, 6, 7])
+
+        def test_lapped_reader_never_sees_torn_values(self):
+            disruptor = disruptor_class(size=8)
+            subscriber = disruptor.subscribe(policy="overwrite")
+            stop = 20000
+            seen: typing.List[typing.Tuple[int, int]] = []
+
+            def consume():
+                last = -1
+                while last < stop - 1:
+                    try:
+                        sequence, values = subscriber.next_batch(timeout=5)
+                    except SequenceOverwritten:
+                        continue
+                    seen.extend(zip(range(sequence, sequence + len(values)), values))
+                    last = sequence + len(values) - 1
+
+            consumer = threading.Thread(target=consume)
+            consumer.start()
+            for i in range(stop):
+                disruptor.put(i, timeout=5)
+            consumer.join(timeout=10)
+
+            self.assertFalse(consumer.is_alive())
+            self.assertTrue(all(sequence == value for sequence, value in seen))
+
+        def test_lapped_observer_reads_a_newer_latest(self):
+            disruptor = disruptor_class(size=8)
+            subscriber = disruptor.subscribe(policy="observer")
+            stop = 20000
+            seen: typing.List[typing.Tuple[int, typing.Any]] = []
+
+            def consume():
+                sequence = -1
+                while sequence < stop - 1:
+                    sequence, values = subscriber.next_batch(timeout=5)
+                    seen.append((sequence, values[0]))
+
+            consumer = threading.Thread(target=consume)
+            consumer.start()
+            for i in range(stop):
+                disruptor.put(i, timeout=5)
+            consumer.join(timeout=10)
+
+            self.assertFalse(consumer.is_alive())
+            self.assertTrue(all(sequence == value for sequence, value in seen))
+
+        def test_slots_are_not_borrowed(self):
+            subscriber = self.disruptor.subscribe(policy="overwrite")
+            self.disruptor.put(0)
+            with self.assertRaises(TypeError):
+                subscriber.next_slot()
+
+    return TestSubscriberPolicies
+
+
+single_producer_test = construct_test_case(SingleProducerDisruptor)  # type: typing.Any
+
+
+class TestSingleProducerSubscriberPolicies(single_producer_test):
+    pass
+
+
+multi_producer_test = construct_test_case(MultiProducerDisruptor)  # type: typing.Any
+
+
+class TestMultiProducerSubscriberPolicies(multi_producer_test):
+    pass
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+import unittest
+import typing
+import threading
+import time
+from pyring import (
+    WaitStrategy,
+    BlockingWaitStrategy,
+    BusySpinWaitStrategy,
+    YieldingWaitStrategy,
+    SleepingWaitStrategy,
+    WaitingBlockingRingBuffer,
+    SingleProducerDisruptor,
+    MultiProducerDisruptor,
+    SequenceNotFound,
+    ReadCursorBlock,
+)
+
+
+def construct_test_case(wait_strategy: typing.Callable[[], WaitStrategy]):
+    class GenericTestWaitStrategy(unittest.TestCase):
+        def setUp(self):
+            self.wait_strategy = wait_strategy()
+
+        def test_returns_immediately_when_condition_holds(self):
+            barrier = threading.Event()
+            self.assertTrue(self.wait_strategy.wait(lambda: True, barrier, timeout=0))
+
+        def test_times_out(self):
+            barrier = threading.Event()
+            start = time.monotonic()
+            self.assertFalse(
+                self.wait_strategy.wait(lambda: False, barrier, timeout=0.05)
+            )
+            self.assertGreaterEqual(time.monotonic() - start, 0.05)
+
+        def test_wakes_when_condition_met_by_other_thread(self):
+            barrier = threading.Event()
+            done = False
+
+            def worker():
+                nonlocal done
+                time.sleep(0.02)
+                done = True
+                self.wait_strategy.signal(barrier)
+
+            thread = threading.Thread(target=worker)
+            thread.start()
+            self.assertTrue(self.wait_strategy.wait(lambda: done, barrier, timeout=1))
+            thread.join()
+
+        def test_waiting_ring_buffer(self):
+            ring_buffer = WaitingBlockingRingBuffer(
+                size=2, wait_strategy=self.wait_strategy
+            )
+
+            with self.assertRaises(SequenceNotFound):
+                ring_buffer.next(timeout=0.01)
+
+            def worker(r_b: WaitingBlockingRingBuffer):
+                for i in range(8):
+                    r_b.put(i, timeout=1)
+
+            thread = threading.Thread(target=worker, args=(ring_buffer,))
+            thread.start()
+            values = [ring_buffer.next(timeout=1)[1] for _ in range(8)]
+            thread.join()
+            self.assertEqual(values, list(range(8)))
+
+            ring_buffer.put_many([0, 1])
+            with self.assertRaises(ReadCursorBlock):
+                ring_buffer.put(2, timeout=0.01)
+
+        def test_disruptors(self):
+            for disruptor_class in (SingleProducerDisruptor, MultiProducerDisruptor):
+                disruptor = disruptor_class(size=2, wait_strategy=self.wait_strategy)
+                subscribers = [disruptor.subscribe() for _ in range(2)]
+
+                received: typing.List[typing.List[int]] = [[], []]
+
+                def worker(idx: int):
+                    for _ in range(8):
+                        received[idx].append(subscribers[idx].next(timeout=1)[1])
+
+                threads = [
+                    threading.Thread(target=worker, args=(idx,)) for idx in range(2)
+                ]
+                for thread in threads:
+                    thread.start()
+                for i in range(8):
+                    disruptor.put(i, timeout=1)
+                for thread in threads:
+                    thread.join()
+
+                self.assertEqual(received, [list(range(8)), list(range(8))])
+
+                disruptor.put_many([8, 9])
+                with self.assertRaises(ReadCursorBlock):
+                    disruptor.put(10, timeout=0.01)
+
+    return GenericTestWaitStrategy
+
+
+blocking_wait_strategy_test = construct_test_case(
+    BlockingWaitStrategy
+)  # type: typing.Any
+
+
+class TestBlockingWaitStrategy(blocking_wait_strategy_test):
+    pass
+
+
+busy_spin_wait_strategy_test = construct_test_case(
+    BusySpinWaitStrategy
+)  # type: typing.Any
+
+
+class TestBusySpinWaitStrategy(busy_spin_wait_strategy_test):
+    pass
+
+
+yielding_wait_strategy_test = construct_test_case(
+    YieldingWaitStrategy
+)  # type: typing.Any
+
+
+class TestYieldingWaitStrategy(yielding_wait_strategy_test):
+    pass
+
+
+sleeping_wait_strategy_test = construct_test_case(
+    SleepingWaitStrategy
+)  # type: typing.Any
+
+
+class TestSleepingWaitStrategy(sleeping_wait_strategy_test):
+    pass
+
+
+class TestMixedWaitStrategies(unittest.TestCase):
+    def test_subscriber_strategy_overrides_disruptor_default(self):
+        disruptor = SingleProducerDisruptor(size=4)
+        spinning = BusySpinWaitStrategy()
+        subscriber = disruptor.subscribe(wait_strategy=spinning)
+        default_subscriber = disruptor.subscribe()
+
+        self.assertIs(subscriber._wait_strategy, spinning)
+        self.assertIs(default_subscriber._wait_strategy, disruptor._wait_strategy)
+
+    def test_waiting_ring_buffers_do_not_share_barriers(self):
+        ring_one = WaitingBlockingRingBuffer()
+        ring_two = WaitingBlockingRingBuffer()
+        self.assertIsNot(ring_one._read_cursor_barrier, ring_two._read_cursor_barrier)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -95,6 +95,51 @@ class TestWaitingBlockingRingBuffer(unittest.TestCase):
             self.assertEqual(res, i ** 2)
             self.assertEqual(sequence, i)
 
+    def test_put_many_and_next_batch(self):
+        ring_buffer = self.ring_buffer(size=4)
+        self.assertEqual(ring_buffer.put_many(range(3)), 0)
+
+        self.assertEqual(ring_buffer.next_batch(2), (0, [0, 1]))
+        self.assertEqual(ring_buffer.next_batch(8), (2, [2]))
+
+        with self.assertRaises(SequenceNotFound):
+            ring_buffer.next_batch(8, timeout=0.05)
+
+    def test_put_many_waits_for_slow_consumer(self):
+        ring_buffer = self.ring_buffer(size=2)
+
+        received = []
+
+        def worker(r_b: WaitingBlockingRingBuffer):
+            while len(received) < 8:
+                time.sleep(0.05)
+                _, values = r_b.next_batch(4, timeout=1)
+                received.extend(values)
+
+        thread = threading.Thread(target=worker, args=(ring_buffer,))
+        thread.start()
+
+        for i in range(0, 8, 2):
+            ring_buffer.put_many(range(i, i + 2), timeout=1)
+
+        thread.join()
+        self.assertEqual(received, list(range(8)))
+
+    def test_put_many_times_out_without_partial_write(self):
+        ring_buffer = self.ring_buffer(size=4)
+        ring_buffer.put_many(range(3))
+        with self.assertRaises(ReadCursorBlock):
+            ring_buffer.put_many(range(3, 5), timeout=0.05)
+
+        self.assertEqual(ring_buffer.next_batch(8), (0, [0, 1, 2]))
+        with self.assertRaises(SequenceNotFound):
+            ring_buffer.next(timeout=0.01)
+
+    def test_put_many_rejects_batches_larger_than_ring(self):
+        ring_buffer = self.ring_buffer(size=4)
+        with self.assertRaises(ValueError):
+            ring_buffer.put_many(range(5))
+
 
 if __name__ == "__main__":
     unittest.main()
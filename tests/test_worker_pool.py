@@ -0,0 +1,217 @@
+import unittest
+import multiprocessing as mp
+import threading
+import typing
+from collections import Counter
+from pyring import (
+    SingleProducerDisruptor,
+    MultiProducerDisruptor,
+    WorkerPool,
+    RingFactory,
+    SleepingWaitStrategy,
+    ReadCursorBlock,
+)
+
+
+class ValueFactory(RingFactory):
+    def __init__(self):
+        self.value = mp.Value("q", 0)
+
+    def get(self):
+        with self.value.get_lock():
+            return self.value.value
+
+    def set(self, value):
+        with self.value.get_lock():
+            self.value.value = value
+
+
+class SharedCounts:
+    """Picklable handler counting the values handled by worker processes."""
+
+    def __init__(self, size: int):
+        self.counts = mp.Array("q", size)
+
+    def __call__(self, value, sequence):
+        with self.counts.get_lock():
+            self.counts[value] += 1
+
+
+def construct_test_case(disruptor_class: typing.Type[SingleProducerDisruptor]):
+    class TestWorkerPool(unittest.TestCase):
+        def setUp(self):
+            self.disruptor = disruptor_class(size=8)
+            self.handled: typing.Counter[int] = Counter()
+            self.lock = threading.Lock()
+            self.done = threading.Event()
+            self.expected = 0
+            self.pools: typing.List[WorkerPool] = []
+
+        def tearDown(self):
+            for pool in self.pools:
+                pool.halt(timeout=5)
+
+        def pool(self, handler=None, **kwargs):
+            pool = WorkerPool(self.disruptor, handler or self.record, **kwargs)
+            self.pools.append(pool)
+            return pool
+
+        def record(self, value, sequence):
+            with self.lock:
+                self.handled[value] += 1
+                if sum(self.handled.values()) >= self.expected:
+                    self.done.set()
+
+        def test_each_event_handled_once(self):
+            self.expected = 1000
+            pool = self.pool(workers=4)
+            pool.start()
+            for i in range(1000):
+                self.disruptor.put(i, timeout=5)
+            self.assertTrue(self.done.wait(timeout=5))
+
+            self.assertEqual(self.handled, Counter(range(1000)))
+
+        def test_work_is_shared(self):
+            self.expected = 200
+            workers = set()
+
+            def handler(value, sequence):
+                workers.add(threading.current_thread())
+                # let the other worker claim while this one is busy
+                threading.Event().wait(0.001)
+                self.record(value, sequence)
+
+            pool = self.pool(handler=handler, workers=2)
+            pool.start()
+            for i in range(200):
+                self.disruptor.put(i, timeout=5)
+            self.assertTrue(self.done.wait(timeout=5))
+            self.assertEqual(len(workers), 2)
+
+        def test_producer_gates_on_slowest_claim(self):
+            release = threading.Event()
+            handling = threading.Event()
+
+            def handler(value, sequence):
+                if sequence == 0:
+                    handling.set()
+                    release.wait(timeout=5)
+
+            pool = self.pool(handler=handler, workers=2)
+            pool.start()
+            self.disruptor.put(0)
+            self.assertTrue(handling.wait(timeout=5))
+
+            # the other worker handles the rest, but sequence 0 is in flight
+            for i in range(1, 8):
+                self.disruptor.put(i, timeout=5)
+            with self.assertRaises(ReadCursorBlock):
+                self.disruptor.put(8, timeout=0.05)
+
+            release.set()
+            self.disruptor.put(8, timeout=5)
+
+        def test_handler_exceptions_are_reported(self):
+            self.expected = 3
+            errors = []
+
+            def handler(value, sequence):
+                if value == 1:
+                    raise ValueError(value)
+                self.record(value, sequence)
+
+            def exception_handler(exception, sequence, value):
+                errors.append(sequence)
+                self.record(value, sequence)
+
+            pool = self.pool(handler=handler, exception_handler=exception_handler)
+            pool.start()
+            self.disruptor.put_many(range(3))
+            self.assertTrue(self.done.wait(timeout=5))
+
+            self.assertEqual(self.handled, Counter(range(3)))
+            self.assertEqual(errors, [1])
+
+        def test_halt_and_restart(self):
+            pool = self.pool(workers=3)
+            pool.start()
+            self.assertTrue(pool.is_running)
+            pool.halt(timeout=5)
+            self.assertFalse(pool.is_running)
+
+            # claims made before the halt are handled after the restart
+            self.expected = 6
+            self.disruptor.put_many(range(6))
+            pool.start()
+            self.assertTrue(self.done.wait(timeout=5))
+            self.assertEqual(self.handled, Counter(range(6)))
+
+        def test_waits_for_upstream(self):
+            self.expected = 1
+            journaler = self.disruptor.subscribe()
+            pool = self.pool(after=[journaler])
+            pool.start()
+            self.disruptor.put(0)
+            self.assertFalse(self.done.wait(timeout=0.05))
+
+            journaler.next()
+            self.assertTrue(self.done.wait(timeout=5))
+
+        def test_unregister(self):
+            pool = self.pool()
+            pool.halt(timeout=5)
+            pool.unregister()
+            self.disruptor.put_many(range(8))
+            self.disruptor.put_many(range(8), timeout=0.05)
+
+    return TestWorkerPool
+
+
+single_producer_pool = construct_test_case(SingleProducerDisruptor)  # type: typing.Any
+
+
+class TestSingleProducerWorkerPool(single_producer_pool):
+    pass
+
+
+multi_producer_pool = construct_test_case(MultiProducerDisruptor)  # type: typing.Any
+
+
+class TestMultiProducerWorkerPool(multi_producer_pool):
+    pass
+
+
+class TestProcessWorkerPool(unittest.TestCase):
+    def test_each_event_handled_once(self):
+        disruptor = SingleProducerDisruptor(
+            size=16,
+            factory=ValueFactory,
+            cursor_position_value=mp.Value("q", 0, lock=False),
+            wait_strategy=SleepingWaitStrategy(),
+        )
+        handler = SharedCounts(200)
+        pool = WorkerPool(disruptor, handler, workers=3, processes=True)
+        pool.start()
+        for i in range(200):
+            disruptor.put(i, timeout=5)
+        # every worker parks past the last sequence once it's all handled
+        disruptor._refresh_gating_sequence(200, 200 + disruptor.ring_size, timeout=5)
+        pool.halt(timeout=5)
+
+        self.assertEqual(list(handler.counts), [1] * 200)
+
+    def test_rejects_unshared_disruptors(self):
+        with self.assertRaises(ValueError):
+            WorkerPool(SingleProducerDisruptor(), print, processes=True)
+
+        with self.assertRaises(ValueError):
+            WorkerPool(
+                SingleProducerDisruptor(cursor_position_value=mp.Value("q", 0)),
+                print,
+                processes=True,
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()